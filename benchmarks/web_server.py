@@ -0,0 +1,122 @@
+"""
+Load-test benchmark for CodingYok web server engines
+
+Each engine runs in its own process serving a handler written in CodingYok;
+a local asyncio client drives it over N concurrent connections and reports
+requests/sec and latency percentiles. Connections are kept alive whenever the
+server allows it.
+
+    python benchmarks/web_server.py --koneksi 50 --durasi 5
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+APP_SOURCE = """
+server = buat_server_web("127.0.0.1", 0, pekerja=PEKERJA, mesin=MESIN)
+fungsi beranda(request):
+    kembalikan {"pesan": "halo", "angka": [1, 2, 3]}
+server.route("/")(beranda)
+"""
+
+ENGINES = {
+    "http": ("http", 0),
+    "http+pekerja": ("http", 8),
+    "asyncio": ("asyncio", 0),
+}
+
+
+def _serve(engine: str, workers: int, ready) -> None:
+    from codingyok.lexer import CodingYokLexer
+    from codingyok.parser import CodingYokParser
+    from codingyok.interpreter import CodingYokInterpreter
+
+    sys.stdout = open(os.devnull, "w")
+    source = APP_SOURCE.replace("PEKERJA", str(workers)).replace("MESIN", f'"{engine}"')
+    interpreter = CodingYokInterpreter()
+    interpreter.interpret(CodingYokParser(CodingYokLexer(source).tokenize()).parse())
+    server = interpreter.environment.get("server").create_server()
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+async def _client(port: int, deadline: float, latencies: list) -> None:
+    request = b"GET / HTTP/1.1\r\nHost: localhost\r\nConnection: keep-alive\r\n\r\n"
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            headers = head.decode("latin-1").lower()
+            length = 0
+            for line in headers.split("\r\n"):
+                if line.startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer = None
+            continue
+        latencies.append(time.perf_counter() - started)
+        if headers.startswith("http/1.0") or "connection: close" in headers:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def _load(port: int, connections: int, duration: float) -> list:
+    latencies: list = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(
+        *(_client(port, deadline, latencies) for _ in range(connections))
+    )
+    return latencies
+
+
+def bench(name: str, connections: int, duration: float) -> None:
+    engine, workers = ENGINES[name]
+    ready = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_serve, args=(engine, workers, ready), daemon=True
+    )
+    process.start()
+    try:
+        port = ready.get(timeout=10)
+        latencies = asyncio.run(_load(port, connections, duration))
+    finally:
+        process.terminate()
+        process.join()
+
+    latencies.sort()
+    count = len(latencies)
+    if not count:
+        print(f"{name:14s} tidak ada respons")
+        return
+    p50 = latencies[count // 2] * 1000
+    p99 = latencies[min(count - 1, int(count * 0.99))] * 1000
+    print(f"{name:14s} {count / duration:10.0f} req/s   p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--koneksi", type=int, default=50, help="koneksi bersamaan")
+    parser.add_argument("--durasi", type=float, default=5.0, help="detik per mesin")
+    parser.add_argument(
+        "--mesin", nargs="*", default=list(ENGINES), choices=list(ENGINES)
+    )
+    args = parser.parse_args()
+    for name in args.mesin:
+        bench(name, args.koneksi, args.durasi)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Async support for CodingYok (`async fungsi` / `menunggu`)
+Bridges CodingYok coroutines to an asyncio event loop
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .errors import CodingYokRuntimeError, CodingYokTypeError, CodingYokValueError
+
+
+# Coroutine bodies awaited by an event loop that may run at once. Kept apart
+# from the loop's default executor, which the *_asinkron helpers use, so
+# bodies waiting on those helpers cannot starve them of threads.
+MAX_COROUTINE_THREADS = 64
+
+# Set on pool threads, so a nested `menunggu` can give up its slot
+_local = threading.local()
+
+
+class _CoroutinePool:
+    """Threads running coroutine bodies awaited by an event loop
+
+    At most `limit` threads run bodies at once. A body blocked in a nested
+    `menunggu` on the loop does not count towards the limit, so coroutines
+    that await child coroutines always leave room for the children.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._work: Deque[Tuple[Future, Callable[[], Any]]] = deque()
+        self._cond = threading.Condition()
+        self._threads = 0
+        self._idle = 0
+        self._blocked = 0
+
+    def submit(self, func: Callable[[], Any]) -> Future:
+        future: Future = Future()
+        with self._cond:
+            self._work.append((future, func))
+            self._wake()
+        return future
+
+    def _wake(self) -> None:
+        # Called with the condition held and work queued
+        if self._idle:
+            self._idle -= 1
+            self._cond.notify()
+        elif self._threads - self._blocked < self.limit:
+            self._threads += 1
+            threading.Thread(
+                target=self._worker,
+                name=f"codingyok-async-{self._threads}",
+                daemon=True,
+            ).start()
+
+    def _worker(self) -> None:
+        _local.pool = self
+        while True:
+            with self._cond:
+                while not self._work:
+                    self._idle += 1
+                    self._cond.wait()
+                future, func = self._work.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    @contextmanager
+    def blocked(self) -> Iterator[None]:
+        """Release the calling thread's slot while it waits on the loop"""
+        with self._cond:
+            self._blocked += 1
+            if self._work:
+                self._wake()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._blocked -= 1
+
+
+_pool: Optional[_CoroutinePool] = None
+_pool_lock = threading.Lock()
+
+
+def _coroutine_pool() -> _CoroutinePool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _CoroutinePool(MAX_COROUTINE_THREADS)
+    return _pool
+
+
+class CodingYokCoroutine:
+    """The pending body of an `async fungsi` call
+
+    The tree-walking interpreter cannot suspend halfway through a body, so a
+    coroutine runs to completion on one thread: inline when awaited directly
+    with `menunggu`, or on a shared pool running up to MAX_COROUTINE_THREADS
+    bodies at once when awaited by the event loop (e.g. through `kumpulkan`), so many of
+    them can wait on I/O at once.
+    """
+
+    def __init__(self, run: Callable[[], Any], name: str):
+        self._run = run
+        self.name = name
+        self._started = False
+        self._lock = threading.Lock()
+
+    def _claim(self) -> None:
+        with self._lock:
+            if self._started:
+                raise CodingYokRuntimeError(f"Koroutin '{self.name}' sudah ditunggu")
+            self._started = True
+
+    def jalankan(self) -> Any:
+        """Run the body in the current thread and return its result"""
+        self._claim()
+        return self._run()
+
+    def __await__(self):
+        self._claim()
+        loop = asyncio.get_running_loop()
+        future = asyncio.wrap_future(_coroutine_pool().submit(self._run), loop=loop)
+        return (yield from future)
+
+    def __repr__(self) -> str:
+        return f"<koroutin {self.name}>"
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+class EventLoopThread:
+    """asyncio event loop running on a daemon thread for one interpreter"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="codingyok-asyncio", daemon=True
+        )
+        self._thread.start()
+
+    def run(self, awaitable: Any) -> Any:
+        """Block the calling thread until awaitable completes on the loop"""
+        if threading.current_thread() is self._thread:
+            raise CodingYokRuntimeError(
+                "'menunggu' tidak dapat memblokir loop peristiwa"
+            )
+        future = asyncio.run_coroutine_threadsafe(_await(awaitable), self.loop)
+        pool = getattr(_local, "pool", None)
+        if pool is None:
+            return future.result()
+        with pool.blocked():
+            return future.result()
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+def resolve_awaitable(interpreter, value: Any) -> Any:
+    """Value of `menunggu value`"""
+    if isinstance(value, CodingYokCoroutine):
+        # Awaiting one coroutine gains nothing from another thread
+        return value.jalankan()
+    if inspect.isawaitable(value):
+        return interpreter.event_loop().run(value)
+    raise CodingYokTypeError("Objek tidak dapat ditunggu dengan 'menunggu'")
+
+
+async def _gather(awaitables) -> list:
+    return list(await asyncio.gather(*awaitables))
+
+
+async def _in_executor(func: Callable, *args: Any) -> Any:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+def kumpulkan(*daftar_tugas: Any):
+    """Await several coroutines concurrently; results keep their order"""
+    if len(daftar_tugas) == 1 and isinstance(daftar_tugas[0], (list, tuple)):
+        daftar_tugas = tuple(daftar_tugas[0])
+    return _gather(daftar_tugas)
+
+
+def tidur_asinkron(detik: float):
+    """Sleep without holding an event loop thread (asyncio.sleep)"""
+    if not isinstance(detik, (int, float)) or isinstance(detik, bool):
+        raise CodingYokValueError("tidur_asinkron() membutuhkan angka detik")
+    return asyncio.sleep(detik)
+
+
+def batas_waktu(tugas: Any, detik: float):
+    """Await tugas, failing with TimeoutError after detik seconds"""
+    return asyncio.wait_for(_await(tugas), detik)
+
+
+def baca_file_asinkron(nama_file: str, encoding: str = "utf-8"):
+    """Read a file on the loop's thread pool"""
+    from .fileio import baca_file
+
+    return _in_executor(baca_file, nama_file, encoding)
+
+
+def http_get_asinkron(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30):
+    """HTTP GET on the loop's thread pool, using the shared session"""
+    from .web import http_get
+
+    return _in_executor(http_get, url, headers, timeout)
+
+
+def get_asinkron_functions() -> Dict[str, Any]:
+    """Get all async helper functions"""
+    return {
+        "kumpulkan": kumpulkan,
+        "tidur_asinkron": tidur_asinkron,
+        "batas_waktu": batas_waktu,
+        "baca_file_asinkron": baca_file_asinkron,
+        "http_get_asinkron": http_get_asinkron,
+    }
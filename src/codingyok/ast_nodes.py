@@ -230,6 +230,16 @@ class TupleExpression(Expression):
         return visitor.visit_tuple(self)
 
 
+@dataclass
+class AwaitExpression(Expression):
+    """menunggu expression"""
+
+    expression: Expression
+
+    def accept(self, visitor):
+        return visitor.visit_await(self)
+
+
 @dataclass
 class LambdaExpression(Expression):
     """Lambda expression (anonymous function)"""
@@ -368,6 +378,7 @@ class FunctionDefinition(Statement):
     body: List[Statement]
     defaults: List[Optional[Expression]]
     decorators: List[str] = field(default_factory=list)
+    is_async: bool = False
 
     def accept(self, visitor):
         return visitor.visit_function_def(self)
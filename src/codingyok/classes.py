@@ -126,8 +126,6 @@ class CodingYokMethod:
         if keyword_args is None:
             keyword_args = {}
 
-        from .interpreter import ReturnValue
-
         # Create new environment for method execution
         environment = Environment(self.closure)
 
@@ -147,11 +145,21 @@ class CodingYokMethod:
             else:
                 raise CodingYokRuntimeError(f"Parameter '{param}' tidak memiliki nilai")
 
+        if self.declaration.is_async:
+            from .asinkron import CodingYokCoroutine
+
+            return CodingYokCoroutine(
+                lambda: self._execute(interpreter, environment), self.declaration.name
+            )
+        return self._execute(interpreter, environment)
+
+    def _execute(self, interpreter: "CodingYokInterpreter", environment: Environment) -> Any:
+        """Run the body in an environment with the parameters bound"""
+        from .interpreter import ReturnValue
+
         # Execute method body
+        frame = interpreter.push_frame(environment, self.declaration.name)
         try:
-            previous = interpreter.environment
-            interpreter.environment = environment
-
             for statement in self.declaration.body:
                 interpreter.execute(statement)
 
@@ -160,7 +168,7 @@ class CodingYokMethod:
         except ReturnValue as return_value:
             return return_value.value
         finally:
-            interpreter.environment = previous
+            interpreter.pop_frame(frame)
 
     def __str__(self) -> str:
         return f"<method {self.declaration.name}>"
@@ -74,3 +74,37 @@ class Environment:
         if self.enclosing:
             result += f" -> {self.enclosing}"
         return result
+
+
+class Frame:
+    """Execution context of one running piece of CodingYok code
+
+    Holds the scope being executed and the frame it was entered from. Each
+    thread has its own chain of frames, so one interpreter (with its modules
+    already loaded) can run code on many threads at once.
+    """
+
+    __slots__ = ("environment", "parent", "name")
+
+    def __init__(
+        self,
+        environment: Environment,
+        parent: Optional["Frame"] = None,
+        name: str = "<modul>",
+    ):
+        self.environment = environment
+        self.parent = parent
+        self.name = name
+
+    def stack(self) -> List[str]:
+        """Names of the active frames, outermost first"""
+        names = []
+        frame: Optional[Frame] = self
+        while frame is not None:
+            names.append(frame.name)
+            frame = frame.parent
+        names.reverse()
+        return names
+
+    def __repr__(self) -> str:
+        return f"<frame {self.name}>"
@@ -6,9 +6,15 @@ Provides Indonesian-named file operations and utilities
 import os
 import json
 import csv
+import fnmatch
+import mmap
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 from .errors import CodingYokRuntimeError, CodingYokValueError
 
 
@@ -28,9 +34,17 @@ def baca_file(nama_file: str, encoding: str = "utf-8") -> str:
 
 
 def tulis_file(
-    nama_file: str, konten: str, encoding: str = "utf-8", mode: str = "w"
+    nama_file: str,
+    konten: str,
+    encoding: str = "utf-8",
+    mode: str = "w",
+    atomik: bool = False,
 ) -> None:
     """Write content to file (Indonesian: write file)"""
+    if atomik:
+        with FileWriter(nama_file, mode, encoding, atomik=True) as writer:
+            writer.tulis_teks(konten)
+        return
     try:
         with open(nama_file, mode, encoding=encoding) as file:
             file.write(konten)
@@ -43,6 +57,176 @@ def tambah_ke_file(nama_file: str, konten: str, encoding: str = "utf-8") -> None
     tulis_file(nama_file, konten, encoding, "a")
 
 
+_FSYNC_POLICIES = ("tidak", "tutup", "selalu")
+
+
+class FileWriter:
+    """Persistent buffered text writer, usable in a `dengan` block
+
+    Keeps one file open for many writes. With `atomik` the content goes to a
+    temporary file in the same directory that replaces the target only when
+    the writer is closed without error, so readers never see a partial file.
+    `fsync` is "tidak" (leave it to the OS), "tutup" (sync once on close) or
+    "selalu" (flush and sync after every write).
+    """
+
+    def __init__(
+        self,
+        nama_file: str,
+        mode: str = "w",
+        encoding: str = "utf-8",
+        atomik: bool = False,
+        fsync: Optional[str] = None,
+        ukuran_buffer: int = 64 * 1024,
+    ):
+        if mode not in ("w", "a"):
+            raise CodingYokValueError("mode penulis harus 'w' atau 'a'")
+        if atomik and mode != "w":
+            raise CodingYokValueError("Penulis atomik hanya mendukung mode 'w'")
+        if fsync is None:
+            fsync = "tutup" if atomik else "tidak"
+        if fsync not in _FSYNC_POLICIES:
+            raise CodingYokValueError("fsync harus 'tidak', 'tutup' atau 'selalu'")
+        self.nama_file = nama_file
+        self.atomik = atomik
+        self.fsync = fsync
+        self.jumlah_baris = 0
+        self._temp: Optional[str] = None
+        try:
+            if atomik:
+                directory, base = os.path.split(os.path.abspath(nama_file))
+                self._temp = os.path.join(
+                    directory, f".{base}.{os.getpid()}.{id(self):x}.tmp"
+                )
+                self._file = open(
+                    self._temp, "x", encoding=encoding, buffering=ukuran_buffer
+                )
+            else:
+                self._file = open(
+                    nama_file, mode, encoding=encoding, buffering=ukuran_buffer
+                )
+        except OSError as e:
+            raise CodingYokRuntimeError(f"Error membuka file '{nama_file}': {str(e)}")
+
+    def _written(self) -> None:
+        if self.fsync == "selalu":
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def _check_open(self) -> None:
+        if self._file.closed:
+            raise CodingYokRuntimeError(f"Penulis '{self.nama_file}' sudah ditutup")
+
+    def tulis_teks(self, teks: Any) -> None:
+        """Write text as is"""
+        self._check_open()
+        self._file.write(str(teks))
+        self._written()
+
+    def tulis_baris(self, baris: Any) -> None:
+        """Write one line; the newline is added"""
+        self._check_open()
+        self._file.write(str(baris) + "\n")
+        self.jumlah_baris += 1
+        self._written()
+
+    def tulis_banyak(self, daftar_baris: Any) -> None:
+        """Write every line from a list or iterator"""
+        self._check_open()
+        write = self._file.write
+        for baris in daftar_baris:
+            write(str(baris) + "\n")
+            self.jumlah_baris += 1
+        self._written()
+
+    def bilas(self) -> None:
+        """Push buffered text to the OS (and disk when fsync is not "tidak")"""
+        self._check_open()
+        self._file.flush()
+        if self.fsync != "tidak":
+            os.fsync(self._file.fileno())
+
+    def tutup(self) -> None:
+        """Flush and close; an atomic writer then replaces the target file"""
+        if self._file.closed:
+            return
+        try:
+            self._file.flush()
+            if self.fsync != "tidak":
+                os.fsync(self._file.fileno())
+        except OSError as e:
+            self.batal()
+            raise CodingYokRuntimeError(
+                f"Error menulis file '{self.nama_file}': {str(e)}"
+            )
+        self._file.close()
+        if self._temp is None:
+            return
+        try:
+            try:
+                os.chmod(self._temp, os.stat(self.nama_file).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+            os.replace(self._temp, self.nama_file)
+        except OSError as e:
+            self.batal()
+            raise CodingYokRuntimeError(
+                f"Error mengganti file '{self.nama_file}': {str(e)}"
+            )
+        self._temp = None
+        if self.fsync != "tidak":
+            _fsync_directory(os.path.dirname(os.path.abspath(self.nama_file)))
+
+    def batal(self) -> None:
+        """Close without replacing the target; only meaningful when atomik"""
+        if not self._file.closed:
+            self._file.close()
+        if self._temp is not None:
+            try:
+                os.remove(self._temp)
+            except OSError:
+                pass
+            self._temp = None
+
+    def __enter__(self) -> "FileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None and self.atomik:
+            self.batal()
+        else:
+            self.tutup()
+
+    def __repr__(self) -> str:
+        return f"<penulis '{self.nama_file}'>"
+
+
+def _fsync_directory(directory: str) -> None:
+    """Persist a rename by syncing its directory (POSIX only)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def buka_penulis(
+    nama_file: str,
+    mode: str = "w",
+    encoding: str = "utf-8",
+    atomik: bool = False,
+    fsync: Optional[str] = None,
+    ukuran_buffer: int = 64 * 1024,
+) -> FileWriter:
+    """Open a persistent buffered writer (Indonesian: open writer)"""
+    return FileWriter(nama_file, mode, encoding, atomik, fsync, ukuran_buffer)
+
+
 def baca_baris(nama_file: str, encoding: str = "utf-8") -> List[str]:
     """Read file lines as list (Indonesian: read lines)"""
     try:
@@ -54,8 +238,97 @@ def baca_baris(nama_file: str, encoding: str = "utf-8") -> List[str]:
         raise CodingYokRuntimeError(f"Error membaca baris file '{nama_file}': {str(e)}")
 
 
-def tulis_baris(nama_file: str, baris_list: List[str], encoding: str = "utf-8") -> None:
+class FileLines:
+    """Lines of a text file, read lazily
+
+    Each iteration opens the file afresh and yields lines without their line
+    endings, so memory use is constant. A `untuk` loop closes the file when
+    it finishes or breaks.
+    """
+
+    def __init__(self, nama_file: str, encoding: str = "utf-8"):
+        if not os.path.isfile(nama_file):
+            raise CodingYokRuntimeError(f"File '{nama_file}' tidak ditemukan")
+        self.nama_file = nama_file
+        self.encoding = encoding
+
+    def __iter__(self):
+        try:
+            with open(self.nama_file, "r", encoding=self.encoding) as file:
+                for line in file:
+                    yield line.rstrip("\n\r")
+        except (OSError, UnicodeDecodeError) as e:
+            raise CodingYokRuntimeError(
+                f"Error membaca baris file '{self.nama_file}': {str(e)}"
+            )
+
+    def __repr__(self) -> str:
+        return f"<iter_baris '{self.nama_file}'>"
+
+
+class FileBlocks:
+    """Fixed-size chunks of a file (str, or bytes when biner), read lazily"""
+
+    def __init__(
+        self,
+        nama_file: str,
+        ukuran: int = 64 * 1024,
+        biner: bool = False,
+        encoding: str = "utf-8",
+    ):
+        if not os.path.isfile(nama_file):
+            raise CodingYokRuntimeError(f"File '{nama_file}' tidak ditemukan")
+        if ukuran <= 0:
+            raise CodingYokValueError("Ukuran blok harus lebih dari 0")
+        self.nama_file = nama_file
+        self.ukuran = ukuran
+        self.biner = biner
+        self.encoding = encoding
+
+    def __iter__(self):
+        try:
+            if self.biner:
+                file = open(self.nama_file, "rb")
+            else:
+                file = open(self.nama_file, "r", encoding=self.encoding)
+            with file:
+                while True:
+                    block = file.read(self.ukuran)
+                    if not block:
+                        break
+                    yield block
+        except (OSError, UnicodeDecodeError) as e:
+            raise CodingYokRuntimeError(
+                f"Error membaca file '{self.nama_file}': {str(e)}"
+            )
+
+    def __repr__(self) -> str:
+        return f"<iter_blok '{self.nama_file}'>"
+
+
+def iter_baris(nama_file: str, encoding: str = "utf-8") -> FileLines:
+    """Iterate file lines lazily (Indonesian: iterate lines)"""
+    return FileLines(nama_file, encoding)
+
+
+def iter_blok(
+    nama_file: str, ukuran: int = 64 * 1024, biner: bool = False, encoding: str = "utf-8"
+) -> FileBlocks:
+    """Iterate file in chunks of `ukuran` characters or bytes (Indonesian: iterate blocks)"""
+    return FileBlocks(nama_file, ukuran, biner, encoding)
+
+
+def tulis_baris(
+    nama_file: str,
+    baris_list: List[str],
+    encoding: str = "utf-8",
+    atomik: bool = False,
+) -> None:
     """Write list of lines to file (Indonesian: write lines)"""
+    if atomik:
+        with FileWriter(nama_file, "w", encoding, atomik=True) as writer:
+            writer.tulis_banyak(baris_list)
+        return
     try:
         with open(nama_file, "w", encoding=encoding) as file:
             for baris in baris_list:
@@ -157,11 +430,8 @@ def hapus_direktori(nama_dir: str) -> None:
 def daftar_file(direktori: str = ".") -> List[str]:
     """List files in directory (Indonesian: list files)"""
     try:
-        return [
-            f
-            for f in os.listdir(direktori)
-            if os.path.isfile(os.path.join(direktori, f))
-        ]
+        with os.scandir(direktori) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
     except FileNotFoundError:
         raise CodingYokRuntimeError(f"Direktori '{direktori}' tidak ditemukan")
     except Exception as e:
@@ -171,17 +441,167 @@ def daftar_file(direktori: str = ".") -> List[str]:
 def daftar_direktori(direktori: str = ".") -> List[str]:
     """List directories (Indonesian: list directories)"""
     try:
-        return [
-            d
-            for d in os.listdir(direktori)
-            if os.path.isdir(os.path.join(direktori, d))
-        ]
+        with os.scandir(direktori) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
     except FileNotFoundError:
         raise CodingYokRuntimeError(f"Direktori '{direktori}' tidak ditemukan")
     except Exception as e:
         raise CodingYokRuntimeError(f"Error membaca direktori '{direktori}': {str(e)}")
 
 
+class DirectoryWalker:
+    """Entries of a directory tree matching a glob pattern, found lazily
+
+    Walks with `os.scandir`, so file types come from the directory listing
+    instead of one stat call per entry. Symlinked directories are listed but
+    not descended into, and unreadable subdirectories are skipped.
+    """
+
+    def __init__(
+        self,
+        direktori: str = ".",
+        pola: Union[str, List[str]] = "*",
+        rekursif: bool = True,
+        tipe: str = "file",
+        info: bool = False,
+    ):
+        if not os.path.isdir(direktori):
+            raise CodingYokRuntimeError(f"Direktori '{direktori}' tidak ditemukan")
+        if tipe not in ("file", "direktori", "semua"):
+            raise CodingYokValueError(
+                "tipe harus 'file', 'direktori' atau 'semua'"
+            )
+        self.direktori = direktori
+        self.pola = [pola] if isinstance(pola, str) else list(pola)
+        self.rekursif = rekursif
+        self.tipe = tipe
+        self.info = info
+
+    def _matches(self, name: str) -> bool:
+        return any(fnmatch.fnmatch(name, pola) for pola in self.pola)
+
+    def __iter__(self):
+        want_files = self.tipe != "direktori"
+        want_dirs = self.tipe != "file"
+        match_all = self.pola == ["*"]
+        pending = [self.direktori]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            if self.rekursif and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            wanted = want_dirs
+                        else:
+                            wanted = want_files and entry.is_file()
+                    except OSError:
+                        continue
+                    if wanted and (match_all or self._matches(entry.name)):
+                        yield self._result(entry) if self.info else entry.path
+            # Depth-first, visiting subdirectories in listing order
+            pending.extend(reversed(subdirs))
+
+    def _result(self, entry: "os.DirEntry") -> Dict[str, Any]:
+        st = entry.stat()
+        return {
+            "jalur": entry.path,
+            "nama": entry.name,
+            "ukuran": st.st_size,
+            "dimodifikasi": st.st_mtime,
+            "adalah_direktori": entry.is_dir(),
+        }
+
+    def __repr__(self) -> str:
+        return f"<jelajahi '{self.direktori}' {self.pola}>"
+
+
+def jelajahi(
+    direktori: str = ".",
+    pola: Union[str, List[str]] = "*",
+    rekursif: bool = True,
+    tipe: str = "file",
+    info: bool = False,
+) -> DirectoryWalker:
+    """Walk a directory tree lazily, yielding paths whose names match pola"""
+    return DirectoryWalker(direktori, pola, rekursif, tipe, info)
+
+
+def _run_bulk(
+    operation: Callable[[Any], None], items: List[Any], pekerja: int, verb: str
+) -> int:
+    """Apply operation to every item on a thread pool; raise one summary error"""
+
+    def attempt(item: Any) -> Optional[str]:
+        try:
+            operation(item)
+            return None
+        except FileNotFoundError as e:
+            return f"File '{e.filename}' tidak ditemukan"
+        except Exception as e:
+            return f"{item}: {e}"
+
+    if pekerja <= 1 or len(items) <= 1:
+        errors = [attempt(item) for item in items]
+    else:
+        with ThreadPoolExecutor(
+            min(pekerja, len(items)), thread_name_prefix="codingyok-file"
+        ) as pool:
+            errors = list(pool.map(attempt, items))
+    failed = [error for error in errors if error is not None]
+    if failed:
+        raise CodingYokRuntimeError(
+            f"Gagal {verb} {len(failed)} dari {len(items)} file: {failed[0]}"
+        )
+    return len(items)
+
+
+def salin_banyak(
+    daftar: Any, tujuan: Optional[str] = None, pekerja: int = 8
+) -> int:
+    """Copy many files concurrently; returns the number copied
+
+    daftar is a dict or list of (sumber, tujuan) pairs, or, when tujuan names
+    a directory, a list of source files copied into it.
+    """
+    if tujuan is not None:
+        os.makedirs(tujuan, exist_ok=True)
+        pairs = [
+            (sumber, os.path.join(tujuan, os.path.basename(sumber)))
+            for sumber in daftar
+        ]
+    elif isinstance(daftar, dict):
+        pairs = list(daftar.items())
+    else:
+        pairs = [tuple(pair) for pair in daftar]
+        if any(len(pair) != 2 for pair in pairs):
+            raise CodingYokValueError(
+                "salin_banyak() membutuhkan pasangan [sumber, tujuan]"
+            )
+
+    return _run_bulk(lambda pair: shutil.copy2(*pair), pairs, pekerja, "menyalin")
+
+
+def hapus_banyak(
+    daftar: Any, pekerja: int = 8, abaikan_hilang: bool = False
+) -> int:
+    """Delete many files concurrently; returns the number processed"""
+
+    def remove(nama_file: str) -> None:
+        try:
+            os.remove(nama_file)
+        except FileNotFoundError:
+            if not abaikan_hilang:
+                raise
+
+    return _run_bulk(remove, list(daftar), pekerja, "menghapus")
+
+
 # JSON operations
 def baca_json(nama_file: str) -> Any:
     """Read JSON file (Indonesian: read JSON)"""
@@ -196,15 +616,226 @@ def baca_json(nama_file: str) -> Any:
         raise CodingYokRuntimeError(f"Error membaca JSON: {str(e)}")
 
 
-def tulis_json(nama_file: str, data: Any, indent: int = 2) -> None:
+def tulis_json(
+    nama_file: str, data: Any, indent: int = 2, atomik: bool = False
+) -> None:
     """Write data to JSON file (Indonesian: write JSON)"""
     try:
+        if atomik:
+            with FileWriter(nama_file, atomik=True) as writer:
+                json.dump(data, writer._file, indent=indent, ensure_ascii=False)
+            return
         with open(nama_file, "w", encoding="utf-8") as file:
             json.dump(data, file, indent=indent, ensure_ascii=False)
+    except CodingYokRuntimeError:
+        raise
     except Exception as e:
         raise CodingYokRuntimeError(f"Error menulis JSON: {str(e)}")
 
 
+class JSONLinesReader:
+    """Records of a JSON Lines (NDJSON) file, parsed one line at a time"""
+
+    def __init__(self, nama_file: str, encoding: str = "utf-8"):
+        if not os.path.isfile(nama_file):
+            raise CodingYokRuntimeError(f"File JSONL '{nama_file}' tidak ditemukan")
+        self.nama_file = nama_file
+        self.encoding = encoding
+
+    def __iter__(self):
+        loads = json.loads
+        with open(self.nama_file, "r", encoding=self.encoding) as file:
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield loads(line)
+                except json.JSONDecodeError as e:
+                    raise CodingYokRuntimeError(
+                        f"Error parsing JSONL '{self.nama_file}' baris {number}: {str(e)}"
+                    )
+
+    def __repr__(self) -> str:
+        return f"<baca_jsonl '{self.nama_file}'>"
+
+
+class JSONLinesWriter:
+    """Incremental JSON Lines writer, usable in a `dengan` block"""
+
+    def __init__(self, nama_file: str, mode: str = "w", encoding: str = "utf-8"):
+        try:
+            self._file = open(nama_file, mode, encoding=encoding)
+        except OSError as e:
+            raise CodingYokRuntimeError(f"Error membuka JSONL '{nama_file}': {str(e)}")
+        self.nama_file = nama_file
+        self._encoder = json.JSONEncoder(ensure_ascii=False)
+        self.jumlah_baris = 0
+
+    def tulis_baris(self, data: Any) -> None:
+        """Write one record as a line"""
+        self._file.write(self._encoder.encode(data) + "\n")
+        self.jumlah_baris += 1
+
+    def tulis_banyak(self, daftar_data: Any) -> None:
+        """Write every record from a list or iterator"""
+        encode = self._encoder.encode
+        write = self._file.write
+        for data in daftar_data:
+            write(encode(data) + "\n")
+            self.jumlah_baris += 1
+
+    def tutup(self) -> None:
+        """Flush and close the file"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "JSONLinesWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.tutup()
+
+    def __repr__(self) -> str:
+        return f"<penulis_jsonl '{self.nama_file}'>"
+
+
+_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+_JSON_TOKEN = re.compile(r'"(?:[^"\\\n]|\\.)*("?)|[][{},]')
+
+
+def _element_end(text: str, start: int) -> int:
+    """End of the JSON array element starting at `start`, or -1 if cut off"""
+    depth = 0
+    for match in _JSON_TOKEN.finditer(text, start):
+        token = match.group()
+        if token[0] == '"':
+            # JSON strings cannot hold a raw newline, so one ends a broken string
+            if not match.group(1) and text.startswith("\n", match.end()):
+                return match.end()
+        elif token in "[{":
+            depth += 1
+        elif depth == 0:
+            return match.start()
+        elif token in "]}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+class JSONArrayReader:
+    """Elements of one large top-level JSON array, decoded one by one
+
+    The file is read in blocks of `ukuran_blok` characters and only the
+    element being decoded is kept in memory.
+    """
+
+    def __init__(self, nama_file: str, ukuran_blok: int = 64 * 1024, encoding: str = "utf-8"):
+        if not os.path.isfile(nama_file):
+            raise CodingYokRuntimeError(f"File JSON '{nama_file}' tidak ditemukan")
+        self.nama_file = nama_file
+        self.ukuran_blok = max(1, ukuran_blok)
+        self.encoding = encoding
+
+    def _error(self, message: str) -> CodingYokRuntimeError:
+        return CodingYokRuntimeError(f"Error parsing JSON '{self.nama_file}': {message}")
+
+    def __iter__(self):
+        decode = json.JSONDecoder().raw_decode
+        with open(self.nama_file, "r", encoding=self.encoding) as file:
+            buffer = ""
+            pos = 0
+            eof = False
+
+            def fill(size: int = self.ukuran_blok) -> bool:
+                # Drop the consumed prefix and append the next block
+                nonlocal buffer, pos, eof
+                if eof:
+                    return False
+                block = file.read(size)
+                if not block:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + block
+                pos = 0
+                return True
+
+            def next_char() -> str:
+                # First non-whitespace character at pos, reading as needed
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                        pos += 1
+                    if pos < len(buffer):
+                        return buffer[pos]
+                    if not fill():
+                        return ""
+
+            if next_char() != "[":
+                raise self._error("diharapkan array JSON di awal file")
+            pos += 1
+            if next_char() == "]":
+                return
+            while True:
+                next_char()
+                # Each retry re-decodes the element from its start, so read
+                # geometrically more to keep huge elements linear overall
+                size = self.ukuran_blok
+                while True:
+                    try:
+                        value, end = decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        # A complete element that still fails is malformed;
+                        # reading on would pull the rest of the file in
+                        if _element_end(buffer, pos) < 0:
+                            size *= 2
+                            if fill(size):
+                                continue
+                        raise self._error(str(e))
+                    # A number cut by the block edge ("12" of "123", "1.5" of
+                    # "1.5e3") decodes fine; make sure it really ended
+                    if (
+                        isinstance(value, (int, float))
+                        and _NUMBER_TAIL.match(buffer, end).end() == len(buffer)
+                        and fill()
+                    ):
+                        continue
+                    break
+                pos = end
+                yield value
+                separator = next_char()
+                pos += 1
+                if separator == "]":
+                    return
+                if separator != ",":
+                    raise self._error("diharapkan ',' atau ']' di antara elemen")
+
+    def __repr__(self) -> str:
+        return f"<iter_json '{self.nama_file}'>"
+
+
+def baca_jsonl(nama_file: str) -> JSONLinesReader:
+    """Iterate records of a JSON Lines file lazily (Indonesian: read JSONL)"""
+    return JSONLinesReader(nama_file)
+
+
+def tulis_jsonl(nama_file: str, data: Any, mode: str = "w") -> int:
+    """Write records from a list or iterator as JSON Lines; returns the count"""
+    with JSONLinesWriter(nama_file, mode) as writer:
+        writer.tulis_banyak(data)
+        return writer.jumlah_baris
+
+
+def buka_jsonl(nama_file: str, mode: str = "w") -> JSONLinesWriter:
+    """Open an incremental JSON Lines writer (Indonesian: open JSONL)"""
+    return JSONLinesWriter(nama_file, mode)
+
+
+def iter_json(nama_file: str, ukuran_blok: int = 64 * 1024) -> JSONArrayReader:
+    """Iterate the elements of a top-level JSON array without loading it"""
+    return JSONArrayReader(nama_file, ukuran_blok)
+
+
 # CSV operations
 def baca_csv(nama_file: str, delimiter: str = ",") -> List[List[str]]:
     """Read CSV file (Indonesian: read CSV)"""
@@ -228,49 +859,449 @@ def tulis_csv(nama_file: str, data: List[List[Any]], delimiter: str = ",") -> No
         raise CodingYokRuntimeError(f"Error menulis CSV: {str(e)}")
 
 
-# Regular expressions with Indonesian interface
-def cari_pola(pola: str, teks: str, semua: bool = False) -> Union[str, List[str], None]:
-    """Search pattern in text (Indonesian: search pattern)"""
+_TRUE_VALUES = {"benar", "true", "1", "ya", "y"}
+
+
+def _to_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUE_VALUES
+
+
+_CSV_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "bilangan_bulat": int,
+    "float": float,
+    "bilangan_desimal": float,
+    "str": str,
+    "teks": str,
+    "bool": _to_bool,
+    "boolean": _to_bool,
+}
+
+
+def _csv_converter(spec: Any) -> Callable[[str], Any]:
+    if callable(spec):
+        return spec
+    converter = _CSV_CONVERTERS.get(str(spec))
+    if converter is None:
+        raise CodingYokValueError(
+            f"Tipe kolom '{spec}' tidak dikenal, gunakan salah satu: "
+            f"{', '.join(sorted(_CSV_CONVERTERS))}"
+        )
+    return converter
+
+
+def _convert_column(converter: Callable, values: List[str], column: Any) -> List[Any]:
+    """Convert one column of a batch; empty cells become kosong"""
     try:
-        if semua:
-            matches = re.findall(pola, teks)
-            return matches if matches else []
+        return list(map(converter, values))
+    except (ValueError, TypeError):
+        pass
+    converted = []
+    for value in values:
+        if value == "":
+            converted.append(None)
+            continue
+        try:
+            converted.append(converter(value))
+        except (ValueError, TypeError):
+            raise CodingYokValueError(
+                f"Nilai '{value}' di kolom '{column}' tidak dapat dikonversi"
+            )
+    return converted
+
+
+class CSVReader:
+    """Rows of a CSV file, read lazily in batches
+
+    With header=benar the first row names the columns and rows are yielded
+    as dicts. `tipe` maps column names (or indexes) to a type name such as
+    "int"/"float"/"bool" or a function; conversion runs column by column on
+    each batch of `ukuran_batch` rows.
+    """
+
+    def __init__(
+        self,
+        nama_file: str,
+        delimiter: str = ",",
+        header: bool = False,
+        tipe: Optional[Dict[Any, Any]] = None,
+        ukuran_batch: int = 1000,
+        encoding: str = "utf-8",
+    ):
+        if not os.path.isfile(nama_file):
+            raise CodingYokRuntimeError(f"File CSV '{nama_file}' tidak ditemukan")
+        self.nama_file = nama_file
+        self.delimiter = delimiter
+        self.header = header
+        self.converters = {key: _csv_converter(spec) for key, spec in (tipe or {}).items()}
+        self.ukuran_batch = max(1, ukuran_batch)
+        self.encoding = encoding
+        self.kolom: Optional[List[str]] = None
+
+    def __iter__(self):
+        try:
+            with open(self.nama_file, "r", encoding=self.encoding, newline="") as file:
+                reader = csv.reader(file, delimiter=self.delimiter)
+                columns = None
+                if self.header:
+                    columns = next(reader, None)
+                    if columns is None:
+                        return
+                    self.kolom = columns
+                converters = self._resolve(columns)
+                while True:
+                    batch = list(islice(reader, self.ukuran_batch))
+                    if not batch:
+                        break
+                    if converters:
+                        batch = self._convert(batch, converters)
+                    if columns is None:
+                        yield from batch
+                    else:
+                        for row in batch:
+                            yield dict(zip(columns, row))
+        except csv.Error as e:
+            raise CodingYokRuntimeError(f"Error membaca CSV: {str(e)}")
+
+    def _resolve(self, columns: Optional[List[str]]) -> List[Tuple[int, Any, Callable]]:
+        resolved = []
+        for key, converter in self.converters.items():
+            if isinstance(key, int):
+                index = key
+            elif columns is not None and key in columns:
+                index = columns.index(key)
+            else:
+                raise CodingYokValueError(f"Kolom '{key}' tidak ditemukan di CSV")
+            resolved.append((index, key, converter))
+        return resolved
+
+    @staticmethod
+    def _convert(batch: List[List[str]], converters: List[Tuple[int, Any, Callable]]) -> List[list]:
+        width = max(index for index, _, _ in converters) + 1
+        if any(len(row) < width for row in batch):
+            raise CodingYokValueError("Baris CSV memiliki kolom yang kurang")
+        columns = [list(column) for column in zip(*batch)]
+        for index, key, converter in converters:
+            columns[index] = _convert_column(converter, columns[index], key)
+        return [list(row) for row in zip(*columns)]
+
+    def __repr__(self) -> str:
+        return f"<iter_csv '{self.nama_file}'>"
+
+
+class CSVWriter:
+    """Incremental CSV writer, usable in a `dengan` block
+
+    When `header` is given it is written first, and dict rows are written
+    in header order.
+    """
+
+    def __init__(
+        self,
+        nama_file: str,
+        header: Optional[List[str]] = None,
+        delimiter: str = ",",
+        mode: str = "w",
+        encoding: str = "utf-8",
+    ):
+        try:
+            self._file = open(nama_file, mode, encoding=encoding, newline="")
+        except OSError as e:
+            raise CodingYokRuntimeError(f"Error membuka CSV '{nama_file}': {str(e)}")
+        self.nama_file = nama_file
+        self.header = list(header) if header else None
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        self.jumlah_baris = 0
+        if self.header and (mode == "w" or self._file.tell() == 0):
+            self._writer.writerow(self.header)
+
+    def _row(self, baris: Any) -> Any:
+        if isinstance(baris, dict):
+            if self.header is None:
+                raise CodingYokValueError("Baris kamus membutuhkan header")
+            return [baris.get(name, "") for name in self.header]
+        return baris
+
+    def tulis_baris(self, baris: Any) -> None:
+        """Write one row (list or dict)"""
+        self._writer.writerow(self._row(baris))
+        self.jumlah_baris += 1
+
+    def tulis_banyak(self, daftar_baris: Any) -> None:
+        """Write every row from a list or iterator"""
+        for baris in daftar_baris:
+            self._writer.writerow(self._row(baris))
+            self.jumlah_baris += 1
+
+    def tutup(self) -> None:
+        """Flush and close the file"""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "CSVWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.tutup()
+
+    def __repr__(self) -> str:
+        return f"<penulis_csv '{self.nama_file}'>"
+
+
+def iter_csv(
+    nama_file: str,
+    delimiter: str = ",",
+    header: bool = False,
+    tipe: Optional[Dict[Any, Any]] = None,
+    ukuran_batch: int = 1000,
+) -> CSVReader:
+    """Iterate CSV rows lazily, optionally as dicts with typed columns"""
+    return CSVReader(nama_file, delimiter, header, tipe, ukuran_batch)
+
+
+def buka_csv(
+    nama_file: str,
+    header: Optional[List[str]] = None,
+    delimiter: str = ",",
+    mode: str = "w",
+) -> CSVWriter:
+    """Open an incremental CSV writer (Indonesian: open CSV)"""
+    return CSVWriter(nama_file, header, delimiter, mode)
+
+
+class MemoryMappedFile:
+    """Read-only memory map of a file
+
+    Nothing is copied until a slice or match is taken; indexes are byte
+    offsets. Slices come back as text (decoded with `encoding`) or as bytes
+    when biner=benar.
+    """
+
+    def __init__(self, nama_file: str, encoding: str = "utf-8", biner: bool = False):
+        try:
+            self._file = open(nama_file, "rb")
+        except FileNotFoundError:
+            raise CodingYokRuntimeError(f"File '{nama_file}' tidak ditemukan")
+        except OSError as e:
+            raise CodingYokRuntimeError(f"Error membuka file '{nama_file}': {str(e)}")
+        self.nama_file = nama_file
+        self.encoding = encoding
+        self.biner = biner
+        if os.fstat(self._file.fileno()).st_size == 0:
+            # mmap cannot map an empty file
+            self._map: Any = b""
         else:
-            match = re.search(pola, teks)
-            return match.group() if match else None
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _out(self, data: bytes) -> Any:
+        return data if self.biner else data.decode(self.encoding, errors="replace")
+
+    def _bytes(self, value: Any) -> bytes:
+        return value if isinstance(value, bytes) else str(value).encode(self.encoding)
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return self._out(self._map[index])
+        if index < 0:
+            index += len(self._map)
+        if not 0 <= index < len(self._map):
+            raise IndexError("indeks peta memori di luar jangkauan")
+        return self._out(self._map[index : index + 1])
+
+    def cari(self, teks: Any, mulai: int = 0, akhir: Optional[int] = None) -> int:
+        """Byte offset of the first occurrence of teks, or -1"""
+        if akhir is None:
+            akhir = len(self._map)
+        return self._map.find(self._bytes(teks), mulai, akhir)
+
+    def rekaman(self, indeks: int, lebar: int) -> Any:
+        """Record number `indeks` of a fixed-width file with `lebar`-byte rows"""
+        start = indeks * lebar
+        if indeks < 0 or start >= len(self._map):
+            raise IndexError("indeks rekaman di luar jangkauan")
+        return self._out(self._map[start : start + lebar])
+
+    def iter_baris(self):
+        """Yield lines without their line endings"""
+        data = self._map
+        start = 0
+        end = len(data)
+        while start < end:
+            newline = data.find(b"\n", start)
+            if newline == -1:
+                newline = end
+            line = data[start:newline]
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            yield self._out(line)
+            start = newline + 1
+
+    def cari_pola(self, pola: str, semua: bool = False) -> Any:
+        """Regex search directly over the mapped bytes"""
+        flags = 0
+        if isinstance(pola, CompiledPattern):
+            # Same expression, recompiled for bytes (UNICODE is str-only)
+            flags = pola.regex.flags & ~re.UNICODE
+            pola = pola.pola
+        try:
+            compiled = _compile(self._bytes(pola), flags)
+        except re.error as e:
+            raise CodingYokValueError(f"Pola regex tidak valid: {str(e)}")
+        if semua:
+            matches = []
+            for match in compiled.finditer(self._map):
+                groups = match.groups()
+                if not groups:
+                    matches.append(self._out(match.group()))
+                elif len(groups) == 1:
+                    matches.append(self._out(groups[0] or b""))
+                else:
+                    matches.append(tuple(self._out(g or b"") for g in groups))
+            return matches
+        match = compiled.search(self._map)
+        return self._out(match.group()) if match else None
+
+    def tutup(self) -> None:
+        """Release the mapping and the file"""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "MemoryMappedFile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.tutup()
+
+    def __repr__(self) -> str:
+        return f"<peta_memori '{self.nama_file}' {len(self._map)} byte>"
+
+
+def peta_memori(
+    nama_file: str, encoding: str = "utf-8", biner: bool = False
+) -> MemoryMappedFile:
+    """Memory-map a file for random access without loading it (Indonesian: memory map)"""
+    return MemoryMappedFile(nama_file, encoding, biner)
+
+
+# Regular expressions with Indonesian interface
+class CompiledPattern:
+    """A regular expression compiled once and reused (kompilasi_pola)"""
+
+    def __init__(self, regex: "re.Pattern"):
+        self.regex = regex
+        self.pola = regex.pattern
+
+    def cari(self, teks: str) -> Optional[str]:
+        """First match, or kosong"""
+        match = self.regex.search(teks)
+        return match.group() if match else None
+
+    def cari_semua(self, teks: str) -> List[Any]:
+        """All matches (group values when the pattern has groups)"""
+        return self.regex.findall(teks)
+
+    def cocok(self, teks: str) -> bool:
+        """Whether the whole text matches"""
+        return self.regex.fullmatch(teks) is not None
+
+    def ganti(self, pengganti: Any, teks: str, semua: bool = True) -> str:
+        """Replace matches (all, or only the first)"""
+        return _sub(self.regex, pengganti, teks, semua)
+
+    def pisah(self, teks: str) -> List[str]:
+        """Split text on matches"""
+        return _split(self.regex, teks)
+
+    def __repr__(self) -> str:
+        return f"<pola {self.pola!r}>"
+
+
+@lru_cache(maxsize=1024)
+def _compile(pola: Any, flags: int = 0) -> "re.Pattern":
+    """Compile a pattern string, cached well beyond re's own small cache"""
+    return re.compile(pola, flags)
+
+
+def _regex(pola: Any) -> "re.Pattern":
+    if isinstance(pola, CompiledPattern):
+        return pola.regex
+    try:
+        return _compile(pola)
     except re.error as e:
         raise CodingYokValueError(f"Pola regex tidak valid: {str(e)}")
+    except TypeError:
+        raise CodingYokValueError("Pola regex harus berupa teks")
 
 
-def ganti_pola(pola: str, pengganti: str, teks: str, semua: bool = True) -> str:
-    """Replace pattern in text (Indonesian: replace pattern)"""
+def _sub(regex: "re.Pattern", pengganti: Any, teks: str, semua: bool) -> str:
     try:
-        if semua:
-            return re.sub(pola, pengganti, teks)
-        else:
-            return re.sub(pola, pengganti, teks, count=1)
+        return regex.sub(pengganti, teks, count=0 if semua else 1)
+    except re.error as e:
+        # Bad group references in the replacement only surface here
+        raise CodingYokValueError(f"Pengganti regex tidak valid: {str(e)}")
+
+
+def _split(regex: "re.Pattern", teks: str) -> List[str]:
+    try:
+        return regex.split(teks)
     except re.error as e:
         raise CodingYokValueError(f"Pola regex tidak valid: {str(e)}")
 
 
-def pisah_pola(pola: str, teks: str) -> List[str]:
-    """Split text by pattern (Indonesian: split pattern)"""
+def kompilasi_pola(
+    pola: str, abaikan_kapital: bool = False, multibaris: bool = False
+) -> CompiledPattern:
+    """Compile a regex for repeated use (Indonesian: compile pattern)"""
+    flags = 0
+    if abaikan_kapital:
+        flags |= re.IGNORECASE
+    if multibaris:
+        flags |= re.MULTILINE
     try:
-        return re.split(pola, teks)
+        return CompiledPattern(_compile(pola, flags))
     except re.error as e:
         raise CodingYokValueError(f"Pola regex tidak valid: {str(e)}")
 
 
+def cari_pola(pola: Any, teks: str, semua: bool = False) -> Union[str, List[str], None]:
+    """Search pattern in text (Indonesian: search pattern)"""
+    if isinstance(teks, MemoryMappedFile):
+        return teks.cari_pola(pola, semua)
+    regex = _regex(pola)
+    if semua:
+        return regex.findall(teks)
+    match = regex.search(teks)
+    return match.group() if match else None
+
+
+def ganti_pola(pola: Any, pengganti: str, teks: str, semua: bool = True) -> str:
+    """Replace pattern in text (Indonesian: replace pattern)"""
+    return _sub(_regex(pola), pengganti, teks, semua)
+
+
+def pisah_pola(pola: Any, teks: str) -> List[str]:
+    """Split text by pattern (Indonesian: split pattern)"""
+    return _split(_regex(pola), teks)
+
+
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_PATTERN = re.compile(
+    r"^https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?$"
+)
+
+
 def validasi_email(email: str) -> bool:
     """Validate email format"""
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return _EMAIL_PATTERN.match(email) is not None
 
 
 def validasi_url(url: str) -> bool:
     """Validate URL format"""
-    pattern = r"^https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?$"
-    return bool(re.match(pattern, url))
+    return _URL_PATTERN.match(url) is not None
 
 
 def get_fileio_functions() -> Dict[str, Any]:
@@ -280,8 +1311,11 @@ def get_fileio_functions() -> Dict[str, Any]:
         "baca_file": baca_file,
         "tulis_file": tulis_file,
         "tambah_ke_file": tambah_ke_file,
+        "buka_penulis": buka_penulis,
         "baca_baris": baca_baris,
         "tulis_baris": tulis_baris,
+        "iter_baris": iter_baris,
+        "iter_blok": iter_blok,
         "ada_file": ada_file,
         "hapus_file": hapus_file,
         "salin_file": salin_file,
@@ -293,16 +1327,27 @@ def get_fileio_functions() -> Dict[str, Any]:
         "hapus_direktori": hapus_direktori,
         "daftar_file": daftar_file,
         "daftar_direktori": daftar_direktori,
+        "jelajahi": jelajahi,
+        "salin_banyak": salin_banyak,
+        "hapus_banyak": hapus_banyak,
         # JSON operations
         "baca_json": baca_json,
         "tulis_json": tulis_json,
+        "baca_jsonl": baca_jsonl,
+        "tulis_jsonl": tulis_jsonl,
+        "buka_jsonl": buka_jsonl,
+        "iter_json": iter_json,
         # CSV operations
         "baca_csv": baca_csv,
         "tulis_csv": tulis_csv,
+        "iter_csv": iter_csv,
+        "buka_csv": buka_csv,
+        "peta_memori": peta_memori,
         # Pattern matching
         "cari_pola": cari_pola,
         "ganti_pola": ganti_pola,
         "pisah_pola": pisah_pola,
+        "kompilasi_pola": kompilasi_pola,
         # Validation
         "validasi_email": validasi_email,
         "validasi_url": validasi_url,
@@ -0,0 +1,606 @@
+"""
+HTTP client for CodingYok
+Keep-alive connection pools per host, timeouts and retries on http.client
+"""
+
+import codecs
+import http.client
+import json
+import os
+import socket
+import ssl
+import threading
+import time
+import base64
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from .errors import CodingYokRuntimeError
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_RETRIES = 2
+MAX_REDIRECTS = 5
+
+_IDEMPOTENT = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+_RETRY_STATUSES = {502, 503, 504}
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# Errors that mean the request may not have reached the server intact
+_CONNECTION_ERRORS = (
+    ConnectionError,
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    http.client.IncompleteRead,
+    socket.timeout,
+    OSError,
+)
+# Errors from a pooled connection the server has already closed
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _proxy_for(scheme: str, host: str, proxies: Dict[str, str]) -> Optional[str]:
+    """Proxy URL for a request (HTTP(S)_PROXY), or None (NO_PROXY, unset)"""
+    proxy = proxies.get(scheme)
+    if not proxy:
+        return None
+    if "no" in proxies:
+        if urllib.request.proxy_bypass_environment(host, proxies):
+            return None
+    elif urllib.request.proxy_bypass(host):
+        return None
+    return proxy
+
+
+class HTTPConnectionPool:
+    """Idle keep-alive connections to one scheme://host:port
+
+    With a proxy URL, plain HTTP requests are forwarded through the proxy
+    and HTTPS requests are tunnelled through it with CONNECT.
+    """
+
+    def __init__(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        timeout: float,
+        max_size: int = 10,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        proxy: Optional[str] = None,
+    ):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_size = max_size
+        if ssl_context is None and scheme == "https":
+            ssl_context = ssl.create_default_context()
+        self.ssl_context = ssl_context
+        self.proxy = proxy
+        self._proxy_headers: Dict[str, str] = {}
+        if proxy:
+            if "://" not in proxy:
+                proxy = "http://" + proxy
+            parsed = urllib.parse.urlsplit(proxy)
+            self._proxy_address = (parsed.hostname, parsed.port or 80)
+            if parsed.username:
+                credentials = f"{urllib.parse.unquote(parsed.username)}:" + (
+                    urllib.parse.unquote(parsed.password or "")
+                )
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                self._proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    @property
+    def forwarding(self) -> bool:
+        """Whether requests go to an HTTP proxy with absolute-URL targets"""
+        return bool(self.proxy) and self.scheme == "http"
+
+    def request_target(self, target: str) -> str:
+        if self.forwarding:
+            return f"http://{self.host}:{self.port}{target}"
+        return target
+
+    def request_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        if self.forwarding and self._proxy_headers:
+            return {**headers, **self._proxy_headers}
+        return headers
+
+    def acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused) — an idle connection when available"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        host, port = self._proxy_address if self.proxy else (self.host, self.port)
+        if self.scheme == "https":
+            conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+                host, port, timeout=self.timeout, context=self.ssl_context
+            )
+            if self.proxy:
+                conn.set_tunnel(self.host, self.port, self._proxy_headers)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        return conn, False
+
+    def release(self, conn: http.client.HTTPConnection) -> None:
+        """Put a connection whose response was fully read back in the pool"""
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class HTTPSession:
+    """Reusable HTTP client that keeps connections open between requests
+
+    Connections are pooled per scheme, host and port. Idempotent requests
+    (GET, HEAD, PUT, DELETE, OPTIONS) are retried with exponential back-off
+    on connection errors, timeouts and 502/503/504 answers. Proxies come
+    from HTTP_PROXY / HTTPS_PROXY / NO_PROXY (urllib.request.getproxies())
+    unless `proxies` is given. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = 0.1,
+        headers: Optional[Dict[str, str]] = None,
+        max_per_host: int = 10,
+        proxies: Optional[Dict[str, str]] = None,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = dict(headers or {})
+        self.max_per_host = max_per_host
+        self.proxies = urllib.request.getproxies() if proxies is None else proxies
+        self._pools: Dict[Tuple[str, str, int], HTTPConnectionPool] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._lock = threading.Lock()
+
+    def _pool(self, scheme: str, host: str, port: int) -> HTTPConnectionPool:
+        key = (scheme, host, port)
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    context = None
+                    if scheme == "https":
+                        # Building a context loads the CA store; do it once
+                        if self._ssl_context is None:
+                            self._ssl_context = ssl.create_default_context()
+                        context = self._ssl_context
+                    pool = HTTPConnectionPool(
+                        scheme,
+                        host,
+                        port,
+                        self.timeout,
+                        self.max_per_host,
+                        context,
+                        _proxy_for(scheme, host, self.proxies),
+                    )
+                    self._pools[key] = pool
+        return pool
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a request; returns {"status", "headers", "content"}
+
+        dict data is sent as JSON, str data as UTF-8. Redirects are followed.
+        """
+        response, _, _, body = self._exchange(method, url, data, headers, timeout)
+        response_headers = dict(response.headers)
+        return {
+            "status": response.status,
+            "headers": response_headers,
+            "content": body.decode(_charset(response_headers), errors="replace"),
+        }
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> "HTTPStreamResponse":
+        """Send a request and return once the headers arrive
+
+        The body is read incrementally through the returned response.
+        """
+        response, conn, pool, _ = self._exchange(
+            method, url, data, headers, timeout, stream=True
+        )
+        return HTTPStreamResponse(response, conn, pool)
+
+    def _exchange(
+        self,
+        method: str,
+        url: str,
+        data: Any,
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+        stream: bool = False,
+    ) -> Tuple[http.client.HTTPResponse, Any, HTTPConnectionPool, Optional[bytes]]:
+        method = method.upper()
+        request_headers = {**self.headers, **(headers or {})}
+        if isinstance(data, dict):
+            data = json.dumps(data).encode("utf-8")
+            request_headers.setdefault("Content-Type", "application/json")
+        elif isinstance(data, str):
+            data = data.encode("utf-8")
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response, conn, pool, body = self._send(
+                method, url, data, request_headers, timeout, stream
+            )
+            location = response.getheader("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response, conn, pool, body
+            if stream:
+                response.read()
+                _finish(pool, conn, response)
+            url = urllib.parse.urljoin(url, location)
+            if response.status == 303 or (
+                response.status in (301, 302) and method == "POST"
+            ):
+                method, data = "GET", None
+                request_headers.pop("Content-Type", None)
+        raise CodingYokRuntimeError(f"Terlalu banyak redirect: {url}")
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: Optional[float],
+        stream: bool,
+    ) -> Tuple[http.client.HTTPResponse, Any, HTTPConnectionPool, Optional[bytes]]:
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme.lower()
+        if scheme not in ("http", "https") or not parsed.hostname:
+            raise CodingYokRuntimeError(f"URL tidak valid: {url}")
+        port = parsed.port or (443 if scheme == "https" else 80)
+        pool = self._pool(scheme, parsed.hostname, port)
+        target = parsed.path or "/"
+        if parsed.query:
+            target += "?" + parsed.query
+
+        attempts = self.retries + 1 if method in _IDEMPOTENT else 1
+        attempt = 0
+        while True:
+            conn, reused = pool.acquire()
+            conn.timeout = timeout if timeout is not None else self.timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            try:
+                conn.request(
+                    method,
+                    pool.request_target(target),
+                    body=data,
+                    headers=pool.request_headers(headers),
+                )
+                response = conn.getresponse()
+                body = None if stream else response.read()
+            except _CONNECTION_ERRORS as e:
+                conn.close()
+                if reused and isinstance(e, _STALE_ERRORS):
+                    # The server closed an idle keep-alive connection; this
+                    # is not a failed attempt, just retry on a fresh one
+                    continue
+                attempt += 1
+                if attempt >= attempts:
+                    raise CodingYokRuntimeError(
+                        f"Koneksi ke {parsed.hostname}:{port} gagal: {e}"
+                    )
+                time.sleep(self.backoff * (2 ** (attempt - 1)))
+                continue
+
+            attempt += 1
+            if response.status in _RETRY_STATUSES and attempt < attempts:
+                if stream:
+                    response.read()
+                _finish(pool, conn, response)
+                time.sleep(self.backoff * (2 ** (attempt - 1)))
+                continue
+            if not stream:
+                _finish(pool, conn, response)
+            return response, conn, pool, body
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        return self.request("GET", url, headers=headers, timeout=timeout)
+
+    def post(
+        self,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        return self.request("POST", url, data, headers, timeout)
+
+    def put(
+        self,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        return self.request("PUT", url, data, headers, timeout)
+
+    def delete(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        return self.request("DELETE", url, headers=headers, timeout=timeout)
+
+    def get_many(
+        self,
+        requests: List[Any],
+        concurrency: int = 10,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Send many requests concurrently, results in the same order
+
+        Each item is a URL or a dict with "url" and optional "metode",
+        "data" and "header". A failed item yields {"url", "status": kosong,
+        "error"} instead of aborting the batch; successful items carry
+        "error": kosong.
+        """
+
+        def fetch(item: Any) -> Dict[str, Any]:
+            if isinstance(item, dict):
+                url = item.get("url", "")
+                method = item.get("metode", "GET")
+                data = item.get("data")
+                headers = item.get("header")
+            else:
+                url, method, data, headers = item, "GET", None, None
+            try:
+                response = self.request(method, url, data, headers, timeout)
+            except Exception as e:
+                message = getattr(e, "message", None) or str(e)
+                return {"url": url, "status": None, "error": message}
+            response["url"] = url
+            response["error"] = None
+            return response
+
+        requests = list(requests)
+        if not requests:
+            return []
+        workers = max(1, min(concurrency, len(requests)))
+        with ThreadPoolExecutor(workers, thread_name_prefix="codingyok-http") as pool:
+            return list(pool.map(fetch, requests))
+
+    def close(self) -> None:
+        """Close every pooled connection"""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def __enter__(self) -> "HTTPSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class HTTPStreamResponse:
+    """Response whose body is read incrementally
+
+    The connection returns to its session's pool once the body has been read
+    to the end; closing earlier drops the connection.
+    """
+
+    def __init__(
+        self,
+        response: http.client.HTTPResponse,
+        conn: http.client.HTTPConnection,
+        pool: HTTPConnectionPool,
+    ):
+        self.status = response.status
+        self.headers = dict(response.headers)
+        length = _find_header(self.headers, "Content-Length")
+        self.length = int(length) if length and length.isdigit() else None
+        self._response = response
+        self._conn: Optional[http.client.HTTPConnection] = conn
+        self._pool = pool
+
+    def iter_blok(self, ukuran: int = 64 * 1024):
+        """Yield the body as byte chunks of at most ukuran bytes"""
+        try:
+            while True:
+                chunk = self._response.read(ukuran)
+                if not chunk:
+                    break
+                yield chunk
+        except _CONNECTION_ERRORS as e:
+            self.close()
+            raise CodingYokRuntimeError(f"Koneksi terputus saat membaca respons: {e}")
+        finally:
+            if not self._response.isclosed():
+                # Abandoned before the end
+                self.close()
+        if self._conn is not None:
+            _finish(self._pool, self._conn, self._response)
+            self._conn = None
+
+    def iter_baris(self, encoding: Optional[str] = None):
+        """Yield decoded lines without their line endings"""
+        decoder = codecs.getincrementaldecoder(encoding or _charset(self.headers))(
+            errors="replace"
+        )
+        pending = ""
+        for chunk in self.iter_blok():
+            lines = (pending + decoder.decode(chunk)).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line[:-1] if line.endswith("\r") else line
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending[:-1] if pending.endswith("\r") else pending
+
+    __iter__ = iter_blok
+
+    def baca(self) -> bytes:
+        """Read the rest of the body"""
+        return b"".join(self.iter_blok())
+
+    def close(self) -> None:
+        """Stop reading and drop the connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._response.close()
+
+    def __enter__(self) -> "HTTPStreamResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def _finish(
+    pool: HTTPConnectionPool,
+    conn: http.client.HTTPConnection,
+    response: http.client.HTTPResponse,
+) -> None:
+    """Hand a connection whose response was fully read back to its pool"""
+    if response.will_close:
+        conn.close()
+    else:
+        pool.release(conn)
+
+
+def _find_header(headers: Dict[str, str], name: str) -> Optional[str]:
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _charset(headers: Dict[str, str]) -> str:
+    content_type = _find_header(headers, "Content-Type") or ""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset" and value:
+            return value.strip('"')
+    return "utf-8"
+
+
+_default_session: Optional[HTTPSession] = None
+_default_lock = threading.Lock()
+
+
+def default_session() -> HTTPSession:
+    """Shared session behind http_get/http_post"""
+    global _default_session
+    if _default_session is None:
+        with _default_lock:
+            if _default_session is None:
+                _default_session = HTTPSession()
+    return _default_session
+
+
+def buat_sesi_http(
+    timeout: float = DEFAULT_TIMEOUT,
+    percobaan: int = DEFAULT_RETRIES,
+    header: Optional[Dict[str, str]] = None,
+    maks_koneksi: int = 10,
+) -> HTTPSession:
+    """Create an HTTP session with pooled keep-alive connections
+
+    percobaan is the number of retries for idempotent requests; maks_koneksi
+    the number of idle connections kept per host.
+    """
+    return HTTPSession(timeout, percobaan, headers=header, max_per_host=maks_koneksi)
+
+
+def http_get_banyak(
+    urls: List[Any],
+    konkurensi: int = 10,
+    timeout: float = DEFAULT_TIMEOUT,
+    header: Optional[Dict[str, str]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch many URLs concurrently; results keep the order of urls
+
+    Errors are reported per item in result["error"] rather than raised.
+    """
+    with HTTPSession(timeout, headers=header, max_per_host=konkurensi) as session:
+        return session.get_many(urls, konkurensi, timeout)
+
+
+def http_get_stream(
+    url: str,
+    header: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> HTTPStreamResponse:
+    """GET url and return a response to read with iter_blok()/iter_baris()"""
+    response = default_session().stream("GET", url, headers=header, timeout=timeout)
+    if response.status >= 400:
+        response.close()
+        raise CodingYokRuntimeError(f"HTTP GET error: HTTP Error {response.status}")
+    return response
+
+
+def unduh_file(
+    url: str,
+    tujuan: str,
+    progres: Optional[Any] = None,
+    ukuran_blok: int = 64 * 1024,
+    header: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Download url to tujuan without holding the body in memory
+
+    progres, when given, is called as progres(diunduh, total) after every
+    block; total is kosong when the server sends no Content-Length. Data is
+    written to "<tujuan>.part" and renamed into place once complete.
+    """
+    temporary = tujuan + ".part"
+    with http_get_stream(url, header, timeout) as response:
+        downloaded = 0
+        try:
+            with open(temporary, "wb") as f:
+                for chunk in response.iter_blok(ukuran_blok):
+                    f.write(chunk)
+                    downloaded += len(chunk)
+                    if progres is not None:
+                        progres(downloaded, response.length)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+    os.replace(temporary, tujuan)
+    return {"status": response.status, "tujuan": tujuan, "ukuran": downloaded}
@@ -5,13 +5,22 @@ Executes the Abstract Syntax Tree (AST)
 
 from typing import Any, Dict, List, Optional, Callable
 import sys
+import threading
 from .ast_nodes import *
 from .errors import *
-from .environment import Environment
+from .environment import Environment, Frame
 from .stdlib import get_builtin_functions
 from .indonesia import get_indonesian_functions
 from .fileio import get_fileio_functions
 from .web import get_web_functions
+from .vektor import get_vektor_functions
+from .paralel import get_paralel_functions
+from .asinkron import (
+    CodingYokCoroutine,
+    EventLoopThread,
+    get_asinkron_functions,
+    resolve_awaitable,
+)
 from .classes import (
     CodingYokClass,
     CodingYokInstance,
@@ -19,14 +28,18 @@ from .classes import (
     create_builtin_exceptions,
 )
 from .modules import ModuleLoader, ModuleObject
+from .output import DEFAULT_BUFFER_SIZE, OutputBuffer
 
 
 class CodingYokFunction:
     """Represents a CodingYok function"""
 
-    def __init__(self, declaration: FunctionDefinition, closure: Environment):
+    def __init__(
+        self, declaration: FunctionDefinition, closure: Environment, interpreter=None
+    ):
         self.declaration = declaration
         self.closure = closure
+        self.interpreter = interpreter
         self.is_generator = self._check_if_generator()
 
     def _check_if_generator(self) -> bool:
@@ -79,11 +92,17 @@ class CodingYokFunction:
                     f"Parameter '{param}' tidak memiliki nilai"
                 )
 
-        # Execute function body
-        try:
-            previous = interpreter.environment
-            interpreter.environment = environment
+        if self.declaration.is_async:
+            # Arguments are bound now; the body runs when awaited
+            return CodingYokCoroutine(
+                lambda: self._execute(interpreter, environment), self.declaration.name
+            )
+        return self._execute(interpreter, environment)
 
+    def _execute(self, interpreter, environment: Environment) -> Any:
+        """Run the body in an environment with the parameters bound"""
+        frame = interpreter.push_frame(environment, self.declaration.name)
+        try:
             for statement in self.declaration.body:
                 interpreter.execute(statement)
 
@@ -92,7 +111,7 @@ class CodingYokFunction:
         except ReturnValue as return_value:
             return return_value.value
         finally:
-            interpreter.environment = previous
+            interpreter.pop_frame(frame)
 
     def _create_generator(self, interpreter, arguments: List[Any], keyword_args: dict = None):
         """Create a generator object"""
@@ -116,20 +135,30 @@ class CodingYokFunction:
                     f"Parameter '{param}' tidak memiliki nilai"
                 )
 
+        name = self.declaration.name
+
         def generator():
-            previous = interpreter.environment
-            interpreter.environment = environment
-            try:
-                for statement in self.declaration.body:
-                    try:
-                        interpreter.execute(statement)
-                    except YieldValue as yv:
-                        yield yv.value
-            finally:
-                interpreter.environment = previous
+            # Enter a frame only while a step runs, so the generator can be
+            # resumed from any thread without leaking its scope there
+            for statement in self.declaration.body:
+                frame = interpreter.push_frame(environment, name)
+                try:
+                    interpreter.execute(statement)
+                    continue
+                except YieldValue as yv:
+                    value = yv.value
+                finally:
+                    interpreter.pop_frame(frame)
+                yield value
 
         return generator()
 
+    def __call__(self, *args, **kwargs):
+        """Make function callable from Python (web handlers, map/filter)"""
+        if self.interpreter:
+            return self.call(self.interpreter, list(args), kwargs)
+        raise CodingYokRuntimeError("Fungsi tidak memiliki interpreter")
+
     def __str__(self) -> str:
         return f"<fungsi {self.declaration.name}>"
 
@@ -161,12 +190,11 @@ class CodingYokLambda:
         for i, param in enumerate(self.parameters):
             environment.define(param, arguments[i])
 
-        previous = interpreter.environment
-        interpreter.environment = environment
+        frame = interpreter.push_frame(environment, "<lambda>")
         try:
             return interpreter.evaluate(self.body)
         finally:
-            interpreter.environment = previous
+            interpreter.pop_frame(frame)
 
     def __call__(self, *args):
         """Make lambda callable for Python's map/filter"""
@@ -204,14 +232,31 @@ class ContinueException(Exception):
 class CodingYokInterpreter:
     """Main interpreter class"""
 
-    def __init__(self, script_dir=None):
+    def __init__(
+        self,
+        script_dir=None,
+        output=None,
+        output_buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
         self.globals = Environment()
-        self.environment = self.globals
         self.global_env = self.globals
+        # Each thread keeps its own chain of frames (see `frame`), so CodingYok
+        # code can run concurrently (web workers, `tugas` threads)
+        self._local = threading.local()
         self.script_dir = script_dir
 
+        # Program output; `output` redirects it to any object with write()
+        self.output = OutputBuffer(output, output_buffer_size)
+
+        # Programs run so far; process workers replay their definitions
+        self.programs: List[Program] = []
+
+        # asyncio loop for `menunggu`, started on first use
+        self._event_loop: Optional[EventLoopThread] = None
+        self._event_loop_lock = threading.Lock()
+
         # Add built-in functions
-        builtins = get_builtin_functions()
+        builtins = get_builtin_functions(self.output)
         for name, func in builtins.items():
             self.globals.define(name, func)
 
@@ -226,10 +271,25 @@ class CodingYokInterpreter:
             self.globals.define(name, func)
 
         # Add web functions
-        web_funcs = get_web_functions()
+        web_funcs = get_web_functions(self)
         for name, func in web_funcs.items():
             self.globals.define(name, func)
 
+        # Add vector functions
+        vektor_funcs = get_vektor_functions()
+        for name, func in vektor_funcs.items():
+            self.globals.define(name, func)
+
+        # Add process-parallel functions
+        paralel_funcs = get_paralel_functions()
+        for name, func in paralel_funcs.items():
+            self.globals.define(name, func)
+
+        # Add async helper functions
+        asinkron_funcs = get_asinkron_functions()
+        for name, func in asinkron_funcs.items():
+            self.globals.define(name, func)
+
         # Add built-in exception classes
         exceptions = create_builtin_exceptions()
         for name, exc_class in exceptions.items():
@@ -238,13 +298,59 @@ class CodingYokInterpreter:
         # Initialize module loader
         self.module_loader = ModuleLoader(self)
 
+    @property
+    def frame(self) -> Frame:
+        """Frame the current thread is executing; threads start at globals"""
+        try:
+            return self._local.frame
+        except AttributeError:
+            frame = self._local.frame = Frame(self.globals)
+            return frame
+
+    def push_frame(self, environment: Environment, name: str) -> Frame:
+        """Enter a new frame on this thread; pair with pop_frame()"""
+        frame = Frame(environment, self.frame, name)
+        self._local.frame = frame
+        return frame
+
+    def pop_frame(self, frame: Frame) -> None:
+        """Leave frame, returning to the frame it was entered from"""
+        self._local.frame = frame.parent
+
+    @property
+    def environment(self) -> Environment:
+        """Scope the current thread is executing in"""
+        try:
+            return self._local.frame.environment
+        except AttributeError:
+            return self.frame.environment
+
+    @environment.setter
+    def environment(self, environment: Environment) -> None:
+        # Block scopes (e.g. `kecuali ... sebagai e`) swap within a frame
+        try:
+            self._local.frame.environment = environment
+        except AttributeError:
+            self.frame.environment = environment
+
+    def event_loop(self) -> EventLoopThread:
+        """The interpreter's asyncio loop thread, started on first use"""
+        if self._event_loop is None:
+            with self._event_loop_lock:
+                if self._event_loop is None:
+                    self._event_loop = EventLoopThread()
+        return self._event_loop
+
     def interpret(self, program: Program) -> None:
         """Interpret a program"""
-        try:
-            for statement in program.statements:
-                self.execute(statement)
-        except CodingYokRuntimeError as error:
-            self.runtime_error(error)
+        self.programs.append(program)
+        with self.output.hold():
+            try:
+                for statement in program.statements:
+                    self.execute(statement)
+            except CodingYokRuntimeError as error:
+                self.output.flush()
+                self.runtime_error(error)
 
     def runtime_error(self, error: CodingYokRuntimeError) -> None:
         """Handle runtime error"""
@@ -275,7 +381,7 @@ class CodingYokInterpreter:
             value = self.evaluate(expr)
             values.append(self.stringify(value))
 
-        print(" ".join(values))
+        self.output.write(" ".join(values) + "\n")
 
     def visit_assignment(self, stmt: AssignmentStatement) -> None:
         """Visit assignment statement"""
@@ -368,8 +474,9 @@ class CodingYokInterpreter:
         if not hasattr(iterable, "__iter__"):
             raise CodingYokTypeError("Objek tidak dapat diiterasi")
 
+        iterator = iter(iterable)
         try:
-            for item in iterable:
+            for item in iterator:
                 # Handle tuple unpacking in for loop
                 if isinstance(stmt.variable, list):
                     # Tuple unpacking: untuk a, b dalam items
@@ -397,6 +504,11 @@ class CodingYokInterpreter:
                     continue
         except BreakException:
             pass
+        finally:
+            # The loop created this iterator and is its only user; close it
+            # now (e.g. releasing iter_baris' file) instead of waiting for GC
+            if iterator is not iterable and hasattr(iterator, "close"):
+                iterator.close()
 
     def visit_tuple_unpacking(self, stmt) -> None:
         """Visit tuple unpacking statement (a, b = 1, 2)"""
@@ -419,7 +531,7 @@ class CodingYokInterpreter:
 
     def visit_function_def(self, stmt: FunctionDefinition) -> None:
         """Visit function definition"""
-        function = CodingYokFunction(stmt, self.environment)
+        function = CodingYokFunction(stmt, self.environment, self)
         self.environment.define(stmt.name, function)
 
     def visit_return(self, stmt: ReturnStatement) -> None:
@@ -701,11 +813,23 @@ class CodingYokInterpreter:
         except Exception as e:
             exception_occurred = e
         finally:
+            # Control flow (kembalikan, berhenti, ...) leaves the block normally
+            if exception_occurred is not None and not isinstance(
+                exception_occurred,
+                (ReturnValue, YieldValue, BreakException, ContinueException),
+            ):
+                exit_args = [
+                    type(exception_occurred),
+                    exception_occurred,
+                    exception_occurred.__traceback__,
+                ]
+            else:
+                exit_args = [None, None, None]
             if exit_method:
                 if hasattr(exit_method, "call"):
-                    exit_method.call(self, [None, None, None])
+                    exit_method.call(self, exit_args)
                 elif callable(exit_method):
-                    exit_method(None, None, None)
+                    exit_method(*exit_args)
 
         if exception_occurred:
             raise exception_occurred
@@ -813,6 +937,14 @@ class CodingYokInterpreter:
         for name, value_expr in expr.keyword_args.items():
             keyword_args[name] = self.evaluate(value_expr)
 
+        return self.call_value(callee, arguments, keyword_args)
+
+    def call_value(
+        self, callee: Any, arguments: List[Any], keyword_args: Optional[dict] = None
+    ) -> Any:
+        """Call a CodingYok or Python callable with evaluated arguments"""
+        if keyword_args is None:
+            keyword_args = {}
         if isinstance(callee, CodingYokFunction):
             return callee.call(self, arguments, keyword_args)
         elif isinstance(callee, CodingYokClass):
@@ -920,19 +1052,18 @@ class CodingYokInterpreter:
             raise CodingYokTypeError("Objek tidak dapat diiterasi dalam comprehension")
 
         env = Environment(self.environment)
-        prev_env = self.environment
-        self.environment = env
+        frame = self.push_frame(env, "<comprehension>")
 
         try:
             for item in iterable:
-                self.environment.define(expr.variable, item)
+                env.define(expr.variable, item)
 
                 if expr.condition is None or self.is_truthy(
                     self.evaluate(expr.condition)
                 ):
                     result.append(self.evaluate(expr.element))
         finally:
-            self.environment = prev_env
+            self.pop_frame(frame)
 
         return result
 
@@ -945,12 +1076,11 @@ class CodingYokInterpreter:
             raise CodingYokTypeError("Objek tidak dapat diiterasi dalam comprehension")
 
         env = Environment(self.environment)
-        prev_env = self.environment
-        self.environment = env
+        frame = self.push_frame(env, "<comprehension>")
 
         try:
             for item in iterable:
-                self.environment.define(expr.variable, item)
+                env.define(expr.variable, item)
 
                 if expr.condition is None or self.is_truthy(
                     self.evaluate(expr.condition)
@@ -959,7 +1089,7 @@ class CodingYokInterpreter:
                     value = self.evaluate(expr.value)
                     result[key] = value
         finally:
-            self.environment = prev_env
+            self.pop_frame(frame)
 
         return result
 
@@ -979,22 +1109,25 @@ class CodingYokInterpreter:
             raise CodingYokTypeError("Objek tidak dapat diiterasi dalam comprehension")
 
         env = Environment(self.environment)
-        prev_env = self.environment
-        self.environment = env
+        frame = self.push_frame(env, "<comprehension>")
 
         try:
             for item in iterable:
-                self.environment.define(expr.variable, item)
+                env.define(expr.variable, item)
 
                 if expr.condition is None or self.is_truthy(
                     self.evaluate(expr.condition)
                 ):
                     result.add(self.evaluate(expr.element))
         finally:
-            self.environment = prev_env
+            self.pop_frame(frame)
 
         return result
 
+    def visit_await(self, expr: AwaitExpression) -> Any:
+        """Visit menunggu expression"""
+        return resolve_awaitable(self, self.evaluate(expr.expression))
+
     def visit_lambda(self, expr: LambdaExpression) -> CodingYokLambda:
         """Visit lambda expression"""
         return CodingYokLambda(expr.parameters, expr.body, self.environment, self)
@@ -5,10 +5,23 @@ Handles module loading, caching, and import resolution
 
 import os
 import sys
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from pathlib import Path
 
 
+def _tugas_module(interpreter) -> Dict[str, Any]:
+    from .tugas import get_tugas_functions
+
+    return get_tugas_functions(interpreter)
+
+
+# Modules implemented in Python, keyed by import name. Each factory builds the
+# module namespace for one interpreter; `impor` checks these before .cy files.
+BUILTIN_MODULES: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "tugas": _tugas_module,
+}
+
+
 class ModuleObject:
     """Represents a loaded module"""
 
@@ -73,6 +86,12 @@ class ModuleLoader:
         if module_name in self.cache:
             return self.cache[module_name]
 
+        factory = BUILTIN_MODULES.get(module_name)
+        if factory is not None:
+            module_obj = ModuleObject(module_name, factory(self.interpreter))
+            self.cache[module_name] = module_obj
+            return module_obj
+
         # Find the module file
         module_path = self.find_module(module_name)
         if not module_path:
@@ -107,16 +126,15 @@ class ModuleLoader:
         module_env = Environment(self.interpreter.global_env)
 
         # Execute the module in its own environment
-        previous_env = self.interpreter.environment
+        frame = self.interpreter.push_frame(module_env, f"<modul {module_name}>")
         try:
-            self.interpreter.environment = module_env
             for statement in ast.statements:
                 self.interpreter.execute(statement)
         except Exception as e:
             # If there's an error during module execution, propagate it
             raise RuntimeError(f"Error saat mengeksekusi modul '{module_name}': {e}")
         finally:
-            self.interpreter.environment = previous_env
+            self.interpreter.pop_frame(frame)
 
         # Create module object with the module's namespace
         module_obj = ModuleObject(module_name, module_env.values)
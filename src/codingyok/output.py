@@ -0,0 +1,118 @@
+"""
+Output subsystem for the CodingYok interpreter
+Buffers program output in front of a redirectable sink
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, TextIO
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+def _isatty(stream: Any) -> bool:
+    try:
+        return bool(stream.isatty())
+    except (AttributeError, ValueError, OSError):
+        return False
+
+
+class OutputBuffer:
+    """Buffered text output in front of a sink (stdout by default)
+
+    Inside a session (see `hold()`), writes collect in memory and reach the
+    sink when the buffer fills, on `flush()` or when the session ends. When
+    the sink is a terminal the buffer flushes at every newline so interactive
+    output stays prompt. Outside a session every write goes straight through.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[TextIO] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        line_buffered: Optional[bool] = None,
+    ):
+        self.sink = sink
+        self.buffer_size = buffer_size
+        self.line_buffered = line_buffered
+        self._parts: List[str] = []
+        self._size = 0
+        self._depth = 0
+        self._line = False
+        self._line_sessions = 0
+        # Sink resolved when the outermost session starts, so callers that
+        # swap sys.stdout beforehand (tests, embedding) still see the output
+        self._target: Optional[TextIO] = None
+        self._lock = threading.RLock()
+
+    @property
+    def target(self) -> TextIO:
+        return self._target or self.sink or sys.stdout
+
+    @contextmanager
+    def hold(self) -> Iterator["OutputBuffer"]:
+        """Buffer writes until the outermost hold() exits"""
+        with self._lock:
+            if self._depth == 0:
+                self._target = self.sink or sys.stdout
+                line = self.line_buffered
+                self._line = _isatty(self._target) if line is None else line
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.flush()
+                    self._target = None
+
+    @contextmanager
+    def line_flushed(self) -> Iterator["OutputBuffer"]:
+        """Flush at every newline until exit, e.g. while a server runs"""
+        with self._lock:
+            self.flush()
+            self._line_sessions += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._line_sessions -= 1
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            self._parts.append(text)
+            self._size += len(text)
+            if (
+                self._depth == 0
+                or self._size >= self.buffer_size
+                or ((self._line or self._line_sessions) and "\n" in text)
+            ):
+                self.flush()
+        return len(text)
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    def flush(self) -> None:
+        with self._lock:
+            target = self.target
+            if self._parts:
+                data = "".join(self._parts)
+                self._parts.clear()
+                self._size = 0
+                target.write(data)
+            flush = getattr(target, "flush", None)
+            if flush is not None:
+                flush()
+
+    def isatty(self) -> bool:
+        return _isatty(self.target)
+
+    def __getattr__(self, name: str) -> Any:
+        # encoding, fileno, errors, ... come from the underlying stream
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.target, name)
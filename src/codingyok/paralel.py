@@ -0,0 +1,222 @@
+"""
+Process-parallel helpers for CodingYok
+Runs CodingYok functions on several cores, one interpreter per worker
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ast_nodes import (
+    ASTNode,
+    AssignmentStatement,
+    CallExpression,
+    ClassDefinition,
+    FromImportStatement,
+    FunctionDefinition,
+    ImportStatement,
+    LambdaExpression,
+    Statement,
+)
+from .errors import CodingYokRuntimeError, CodingYokTypeError
+
+_DEFINITIONS = (ClassDefinition, FromImportStatement, FunctionDefinition, ImportStatement)
+
+_RUNTIME_PREFIX = "Kesalahan Runtime: "
+
+# Set in each worker process by _init_worker
+_worker_function: Any = None
+
+
+def _has_call(node: Any) -> bool:
+    """Whether evaluating an expression could call a function"""
+    if isinstance(node, CallExpression):
+        return True
+    if isinstance(node, LambdaExpression):
+        return False  # the body only runs when the lambda is called
+    if isinstance(node, ASTNode):
+        return any(_has_call(value) for value in vars(node).values())
+    if isinstance(node, (list, tuple)):
+        return any(_has_call(value) for value in node)
+    return False
+
+
+def _definitions(interpreter) -> List[Statement]:
+    """Top-level statements a worker needs to rebuild the program's namespace
+
+    Definitions, imports and assignments that call nothing are replayed;
+    anything else (I/O, loops, server start-up) stays in the main process.
+    Replays that fail in a worker are skipped.
+    """
+    statements = []
+    for program in getattr(interpreter, "programs", ()):
+        for statement in program.statements:
+            if isinstance(statement, _DEFINITIONS) or (
+                isinstance(statement, AssignmentStatement)
+                and not _has_call(statement.value)
+            ):
+                statements.append(statement)
+    return statements
+
+
+def _module_name(fungsi: Any) -> Optional[Tuple[str, str]]:
+    """(module, name) when fungsi was defined at the top level of a module"""
+    interpreter = getattr(fungsi, "interpreter", None)
+    if interpreter is None:
+        return None
+    for module in interpreter.module_loader.cache.values():
+        if module.namespace is fungsi.closure.values:
+            for name, value in module.namespace.items():
+                if value is fungsi:
+                    return module.name, name
+    return None
+
+
+def _function_spec(fungsi: Any) -> Tuple[str, Any]:
+    """A picklable description of fungsi"""
+    from .interpreter import CodingYokFunction, CodingYokLambda
+
+    if isinstance(fungsi, CodingYokFunction):
+        # Module functions see their module's globals, so workers load the
+        # module instead of redefining the function in the program's scope
+        module = _module_name(fungsi)
+        if module is not None:
+            return ("modul", module)
+        return ("fungsi", fungsi.declaration)
+    if isinstance(fungsi, CodingYokLambda):
+        return ("lambda", LambdaExpression(fungsi.parameters, fungsi.body))
+    if callable(fungsi) and not hasattr(fungsi, "call"):
+        return ("python", fungsi)
+    raise CodingYokTypeError(
+        "peta_paralel() membutuhkan fungsi, lambda, atau fungsi bawaan"
+    )
+
+
+def _init_worker(script_dir: Optional[str], definitions: List[Statement], spec) -> None:
+    global _worker_function
+    from .environment import Environment
+    from .interpreter import CodingYokInterpreter
+
+    kind, value = spec
+    if kind == "python":
+        _worker_function = value
+        return
+    interpreter = CodingYokInterpreter(script_dir)
+    for statement in definitions:
+        try:
+            interpreter.execute(statement)
+        except Exception:
+            # e.g. an assignment from a value only the main process computed;
+            # if the function needs that name it fails when it runs
+            continue
+    if kind == "modul":
+        module_name, name = value
+        module = interpreter.module_loader.load_module(module_name)
+        _worker_function = module.get_attribute(name)
+        return
+    # Define the function in its own scope so it cannot shadow a global
+    frame = interpreter.push_frame(Environment(interpreter.globals), "<pekerja>")
+    try:
+        if kind == "lambda":
+            _worker_function = interpreter.evaluate(value)
+        else:
+            interpreter.execute(value)
+            _worker_function = frame.environment.get(value.name)
+    finally:
+        interpreter.pop_frame(frame)
+
+
+def _run_batch(items: List[Any]) -> Tuple[bool, Any]:
+    results = []
+    for position, item in enumerate(items):
+        try:
+            results.append(_worker_function(item))
+        except Exception as e:
+            # CodingYok errors do not survive pickling; send the text instead
+            message = str(e)
+            if message.startswith(_RUNTIME_PREFIX):
+                message = message[len(_RUNTIME_PREFIX) :]
+            return False, (position, message)
+    return True, results
+
+
+def peta_paralel(
+    fungsi: Any,
+    data: Any,
+    pekerja: Optional[int] = None,
+    ukuran_batch: Optional[int] = None,
+) -> List[Any]:
+    """Apply fungsi to every item on a process pool; results keep their order
+
+    Each worker rebuilds the program's functions, classes and imports in its
+    own interpreter; a function imported from a module is taken from that
+    module, loaded in the worker. Items, results and top-level constants must
+    be picklable, and the function cannot depend on local variables of an
+    enclosing function.
+    """
+    items = list(data)
+    if pekerja is None:
+        pekerja = os.cpu_count() or 1
+    if pekerja <= 1 or len(items) <= 1:
+        return [fungsi(item) for item in items]
+
+    spec = _function_spec(fungsi)
+    interpreter = getattr(fungsi, "interpreter", None)
+    definitions = _definitions(interpreter) if interpreter is not None else []
+    script_dir = getattr(interpreter, "script_dir", None)
+
+    if ukuran_batch is None:
+        # A few batches per worker balances uneven item costs
+        ukuran_batch = math.ceil(len(items) / (pekerja * 4))
+    ukuran_batch = max(1, int(ukuran_batch))
+    batches = [
+        items[start : start + ukuran_batch]
+        for start in range(0, len(items), ukuran_batch)
+    ]
+
+    # Forked workers must not inherit (and later repeat) buffered output
+    if interpreter is not None:
+        interpreter.output.flush()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    results: List[Any] = []
+    try:
+        with ProcessPoolExecutor(
+            min(pekerja, len(batches)),
+            initializer=_init_worker,
+            initargs=(script_dir, definitions, spec),
+        ) as pool:
+            futures = [pool.submit(_run_batch, batch) for batch in batches]
+            for index, future in enumerate(futures):
+                ok, value = future.result()
+                if not ok:
+                    # Batches not yet started are dropped (3.8 has no
+                    # shutdown(cancel_futures=...))
+                    for pending in futures[index + 1 :]:
+                        pending.cancel()
+                    pool.shutdown(wait=False)
+                    position, message = value
+                    raise CodingYokRuntimeError(
+                        f"peta_paralel gagal pada elemen ke-"
+                        f"{index * ukuran_batch + position}: {message}"
+                    )
+                results.extend(value)
+    except BrokenProcessPool:
+        raise CodingYokRuntimeError(
+            "Proses pekerja peta_paralel gagal dimulai atau berhenti tiba-tiba"
+        )
+    except CodingYokRuntimeError:
+        raise
+    except Exception as e:
+        raise CodingYokRuntimeError(f"peta_paralel gagal: {str(e)}")
+    return results
+
+
+def get_paralel_functions() -> Dict[str, Any]:
+    """Get all process-parallel functions"""
+    return {
+        "peta_paralel": peta_paralel,
+    }
@@ -103,6 +103,9 @@ class CodingYokParser:
             if self.match(TokenType.FUNGSI):
                 return self.function_definition()
 
+            if self.match(TokenType.ASYNC):
+                return self.async_function_definition()
+
             # Class definition
             if self.match(TokenType.KELAS):
                 return self.class_definition()
@@ -178,6 +181,7 @@ class CodingYokParser:
             if self.peek().type in [
                 TokenType.KELAS,
                 TokenType.FUNGSI,
+                TokenType.ASYNC,
                 TokenType.JIKA,
                 TokenType.UNTUK,
                 TokenType.SELAMA,
@@ -382,6 +386,9 @@ class CodingYokParser:
             right = self.unary()
             return UnaryExpression(operator, right)
 
+        if self.match(TokenType.MENUNGGU):
+            return AwaitExpression(self.unary())
+
         return self.power()
 
     def power(self) -> Expression:
@@ -725,6 +732,13 @@ class CodingYokParser:
 
         return FunctionDefinition(name, parameters, body, defaults)
 
+    def async_function_definition(self) -> FunctionDefinition:
+        """Parse async function definition (after 'async'/'asinkron')"""
+        self.consume(TokenType.FUNGSI, "Diharapkan 'fungsi' setelah 'async'")
+        function = self.function_definition()
+        function.is_async = True
+        return function
+
     def class_definition(self) -> ClassDefinition:
         """Parse class definition"""
         name = self.consume(TokenType.IDENTIFIER, "Diharapkan nama kelas").value
@@ -751,6 +765,8 @@ class CodingYokParser:
 
             if self.match(TokenType.FUNGSI):
                 methods.append(self.function_definition())
+            elif self.match(TokenType.ASYNC):
+                methods.append(self.async_function_definition())
             else:
                 self.error("Hanya definisi fungsi yang diperbolehkan dalam kelas")
 
@@ -3,12 +3,17 @@ Standard library functions for CodingYok
 Provides built-in functions with Indonesian names
 """
 
+import sys
 import time
 import random
 import math
 import datetime
-from typing import Any, Dict, List, Callable, Optional, Union
+import array
+import operator
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Callable, Optional, TextIO, Union
 from .errors import CodingYokTypeError, CodingYokValueError
+from .vektor import Vektor, np
 
 
 def panjang(obj: Any) -> int:
@@ -29,6 +34,7 @@ def tipe(obj: Any) -> str:
         dict: "kamus",
         bool: "boolean",
         type(None): "kosong",
+        Vektor: "vektor",
     }
     return type_map.get(type(obj), str(type(obj).__name__))
 
@@ -50,6 +56,11 @@ def masukan(prompt: str = "") -> str:
     return input(prompt)
 
 
+def bilas() -> None:
+    """Flush buffered program output (flush in Python)"""
+    sys.stdout.flush()
+
+
 def int_indo(value: Any) -> int:
     """Convert to integer"""
     try:
@@ -120,6 +131,8 @@ def saring(fungsi: Callable, iterable: Any) -> filter:
 
 def jumlah(iterable: Any) -> float:
     """Sum of iterable (sum in Python)"""
+    if isinstance(iterable, Vektor):
+        return iterable.jumlah()
     try:
         return sum(iterable)
     except TypeError:
@@ -128,6 +141,8 @@ def jumlah(iterable: Any) -> float:
 
 def maksimum(iterable: Any) -> Any:
     """Maximum value (max in Python)"""
+    if isinstance(iterable, Vektor):
+        return iterable.maksimum()
     try:
         return max(iterable)
     except (ValueError, TypeError):
@@ -136,6 +151,8 @@ def maksimum(iterable: Any) -> Any:
 
 def minimum(iterable: Any) -> Any:
     """Minimum value (min in Python)"""
+    if isinstance(iterable, Vektor):
+        return iterable.minimum()
     try:
         return min(iterable)
     except (ValueError, TypeError):
@@ -343,8 +360,12 @@ def ganti(text: str, old: str, new: str) -> str:
         raise CodingYokTypeError("ganti() membutuhkan teks")
 
 
-def cetak_tabel(data: List[List[Any]], header: Optional[List[str]] = None) -> None:
-    """Print data as formatted table"""
+def cetak_tabel(
+    data: List[List[Any]],
+    header: Optional[List[str]] = None,
+    keluaran: Optional[TextIO] = None,
+) -> None:
+    """Print data as formatted table (to keluaran, default sys.stdout)"""
     if not data:
         return
 
@@ -373,9 +394,13 @@ def cetak_tabel(data: List[List[Any]], header: Optional[List[str]] = None) -> No
             + " | ".join(
                 cell.ljust(width) for cell, width in zip(header_row, col_widths)
             )
-            + " |"
+            + " |",
+            file=keluaran,
+        )
+        print(
+            "|" + "|".join("-" * (width + 2) for width in col_widths) + "|",
+            file=keluaran,
         )
-        print("|" + "|".join("-" * (width + 2) for width in col_widths) + "|")
         data_start = 1
     else:
         data_start = 0
@@ -385,50 +410,230 @@ def cetak_tabel(data: List[List[Any]], header: Optional[List[str]] = None) -> No
         print(
             "| "
             + " | ".join(cell.ljust(width) for cell, width in zip(row, col_widths))
-            + " |"
+            + " |",
+            file=keluaran,
         )
 
 
-def hitung_statistik(data: List[Union[int, float]]) -> Dict[str, float]:
-    """Calculate basic statistics for numerical data"""
-    if not data:
+def hitung_statistik(
+    data: Iterable[Union[int, float]],
+    persentil: Optional[List[float]] = None,
+    perkiraan: bool = False,
+    ukuran_sampel: int = 10000,
+) -> Dict[str, Any]:
+    """Calculate basic statistics for numerical data
+
+    Accepts any iterable (lists, vektor, generators, file lines). Streams are
+    consumed in a single pass (Welford for mean/variance); the median and
+    percentiles use selection rather than a full sort. With perkiraan=True
+    only a bounded reservoir sample is kept, so median and percentiles
+    become approximations.
+    """
+    if persentil is None:
+        persentil = []
+    for p in persentil:
+        if not 0 <= p <= 100:
+            raise CodingYokValueError("Persentil harus di antara 0 dan 100")
+    if perkiraan and (
+        not isinstance(ukuran_sampel, int)
+        or isinstance(ukuran_sampel, bool)
+        or ukuran_sampel < 1
+    ):
+        raise CodingYokValueError("ukuran_sampel harus bilangan bulat minimal 1")
+
+    if isinstance(data, Vektor):
+        data = data._data
+    if not perkiraan:
+        if np is not None and isinstance(data, (list, tuple, np.ndarray)):
+            result = _statistik_numpy(data, persentil)
+            if result is not None:
+                return result
+        if isinstance(data, (list, tuple, array.array, memoryview)):
+            return _statistik_urutan(data, persentil)
+
+    n = 0
+    total: Union[int, float] = 0
+    mean = 0.0
+    m2 = 0.0
+    terkecil = terbesar = None
+
+    if perkiraan:
+        rng = random.Random(0)
+        sample: Any = []
+    else:
+        sample = array.array("d")
+    keep = sample.append
+
+    try:
+        for x in data:
+            if isinstance(x, str):
+                x = x.strip()
+                if not x:
+                    continue
+                try:
+                    x = int(x)
+                except ValueError:
+                    x = float(x)
+            n += 1
+            total += x
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            if terkecil is None or x < terkecil:
+                terkecil = x
+            if terbesar is None or x > terbesar:
+                terbesar = x
+            if not perkiraan or n <= ukuran_sampel:
+                keep(x)
+            else:
+                j = rng.randrange(n)
+                if j < ukuran_sampel:
+                    sample[j] = x
+    except (TypeError, ValueError):
+        raise CodingYokTypeError("hitung_statistik() membutuhkan data angka")
+
+    if n == 0:
         return {}
 
-    n = len(data)
-    total = sum(data)
-    rata_rata = total / n
+    variance = m2 / n
+    ranks = [50.0] + [float(p) for p in persentil]
+    quantiles = _hitung_kuantil(sample, ranks)
 
-    # Calculate variance and standard deviation
-    variance = sum((x - rata_rata) ** 2 for x in data) / n
-    std_dev = variance**0.5
+    result: Dict[str, Any] = {
+        "jumlah": total,
+        "rata_rata": total / n,
+        "median": quantiles[0],
+        "minimum": terkecil,
+        "maksimum": terbesar,
+        "varians": variance,
+        "standar_deviasi": variance**0.5,
+        "jumlah_data": n,
+    }
+    if persentil:
+        result["persentil"] = dict(zip(persentil, quantiles[1:]))
+    if perkiraan:
+        result["perkiraan"] = n > ukuran_sampel
+    return result
 
-    # Calculate median
-    sorted_data = sorted(data)
-    if n % 2 == 0:
-        median = (sorted_data[n // 2 - 1] + sorted_data[n // 2]) / 2
-    else:
-        median = float(sorted_data[n // 2])
 
-    return {
+def _statistik_urutan(values: Any, persentil: List[float]) -> Dict[str, Any]:
+    """In-memory sequences: a few C-level passes beat a Python-level loop"""
+    n = len(values)
+    if n == 0:
+        return {}
+
+    try:
+        total = sum(values)
+        rata_rata = total / n
+        variance = (
+            sum(map(pow, map(operator.sub, values, repeat(rata_rata)), repeat(2))) / n
+        )
+        terkecil = min(values)
+        terbesar = max(values)
+    except TypeError:
+        raise CodingYokTypeError("hitung_statistik() membutuhkan data angka")
+
+    quantiles = _hitung_kuantil(values, [50.0] + [float(p) for p in persentil])
+    result: Dict[str, Any] = {
         "jumlah": total,
         "rata_rata": rata_rata,
-        "median": median,
-        "minimum": min(data),
-        "maksimum": max(data),
+        "median": quantiles[0],
+        "minimum": terkecil,
+        "maksimum": terbesar,
         "varians": variance,
-        "standar_deviasi": std_dev,
+        "standar_deviasi": variance**0.5,
         "jumlah_data": n,
     }
+    if persentil:
+        result["persentil"] = dict(zip(persentil, quantiles[1:]))
+    return result
+
+
+def _statistik_numpy(values: Any, persentil: List[float]) -> Optional[Dict[str, Any]]:
+    """NumPy fast path; returns None when data is not a numeric array"""
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "iuf":
+        return None
+    arr = arr.ravel()
+    n = arr.size
+    if n == 0:
+        return {}
 
-
-def get_builtin_functions() -> Dict[str, Any]:
-    """Get all built-in functions"""
-    return {
+    quantiles = np.percentile(arr, [50.0] + [float(p) for p in persentil])
+    variance = float(arr.var())
+    result: Dict[str, Any] = {
+        "jumlah": arr.sum().item(),
+        "rata_rata": float(arr.mean()),
+        "median": float(quantiles[0]),
+        "minimum": arr.min().item(),
+        "maksimum": arr.max().item(),
+        "varians": variance,
+        "standar_deviasi": variance**0.5,
+        "jumlah_data": int(n),
+    }
+    if persentil:
+        result["persentil"] = {
+            p: float(q) for p, q in zip(persentil, quantiles[1:])
+        }
+    return result
+
+
+def _pilih(values: List[float], k: int) -> float:
+    """Return the k-th smallest value (0-based) using quickselect"""
+    while True:
+        if len(values) <= 32:
+            return sorted(values)[k]
+        pivot = sorted((values[0], values[len(values) // 2], values[-1]))[1]
+        lows = [x for x in values if x < pivot]
+        if k < len(lows):
+            values = lows
+            continue
+        k -= len(lows)
+        highs = [x for x in values if x > pivot]
+        equal = len(values) - len(lows) - len(highs)
+        if k < equal:
+            return pivot
+        k -= equal
+        values = highs
+
+
+def _hitung_kuantil(values: Any, ranks: List[float]) -> List[float]:
+    """Linear-interpolated percentiles (same definition as NumPy's default)"""
+    n = len(values)
+    # Selection is linear per rank; past a few ranks one sort is cheaper
+    ordered = sorted(values) if len(ranks) > 3 else None
+
+    def select(k: int) -> float:
+        if ordered is not None:
+            return ordered[k]
+        return _pilih(values, k)
+
+    result = []
+    for rank in ranks:
+        pos = rank / 100 * (n - 1)
+        lo = int(pos)
+        low_value = float(select(lo))
+        if pos == lo:
+            result.append(low_value)
+        else:
+            high_value = float(select(lo + 1))
+            result.append(low_value + (high_value - low_value) * (pos - lo))
+    return result
+
+
+def get_builtin_functions(output: Optional[TextIO] = None) -> Dict[str, Any]:
+    """Get all built-in functions
+
+    With an output stream, the builtins that print or prompt (bilas,
+    cetak_tabel, masukan) use it instead of sys.stdout.
+    """
+    functions = {
         # Basic functions
         "panjang": panjang,
         "tipe": tipe,
         "rentang": rentang,
         "masukan": masukan,
+        "bilas": bilas,
         # Type conversion
         "int": int_indo,
         "float": float_indo,
@@ -475,3 +680,27 @@ def get_builtin_functions() -> Dict[str, Any]:
         "PI": math.pi,
         "E": math.e,
     }
+
+    if output is not None:
+
+        def masukan_keluaran(prompt: str = "") -> str:
+            """Get user input (input in Python)"""
+            output.write(prompt)
+            output.flush()
+            return input()
+
+        def bilas_keluaran() -> None:
+            """Flush buffered program output (flush in Python)"""
+            output.flush()
+
+        def cetak_tabel_keluaran(
+            data: List[List[Any]], header: Optional[List[str]] = None
+        ) -> None:
+            """Print data as formatted table"""
+            cetak_tabel(data, header, output)
+
+        functions["masukan"] = masukan_keluaran
+        functions["bilas"] = bilas_keluaran
+        functions["cetak_tabel"] = cetak_tabel_keluaran
+
+    return functions
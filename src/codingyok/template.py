@@ -0,0 +1,363 @@
+"""
+Template engine for CodingYok web applications
+Templates are compiled once into Python render functions and cached
+"""
+
+import html
+import json
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .errors import CodingYokRuntimeError, CodingYokSyntaxError
+
+
+_TAG = re.compile(r"({{.*?}}|{%.*?%}|{#.*?#})", re.DOTALL)
+_EXPR_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<number>\d+(?:\.\d+)?)
+      | (?P<string>"[^"]*"|'[^']*')
+      | (?P<op>==|!=|<=|>=|<|>|\||\.|,)
+      | (?P<name>[A-Za-z_]\w*)
+    )""",
+    re.VERBOSE,
+)
+_LITERALS = {"benar": "True", "salah": "False", "kosong": "None"}
+_KEYWORDS = {"dan", "atau", "bukan", "dalam"}
+
+
+class Aman(str):
+    """Text marked safe for HTML output; it is not escaped again"""
+
+
+class _Undefined:
+    """Placeholder for names missing from the context; renders as empty"""
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __str__(self) -> str:
+        return ""
+
+
+_UNDEFINED = _Undefined()
+
+
+def _to_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if value is True:
+        return "benar"
+    if value is False:
+        return "salah"
+    return str(value)
+
+
+def _escape(value: Any) -> str:
+    if isinstance(value, Aman):
+        return value
+    return html.escape(_to_text(value), quote=True)
+
+
+def _get(obj: Any, key: str) -> Any:
+    """Resolve `obj.key` as a dict key, attribute or list index"""
+    if isinstance(obj, dict):
+        return obj.get(key, _UNDEFINED)
+    if key.isdigit() and isinstance(obj, (list, tuple, str)):
+        index = int(key)
+        return obj[index] if index < len(obj) else _UNDEFINED
+    fields = getattr(obj, "fields", None)
+    if isinstance(fields, dict) and key in fields:
+        # CodingYok class instances keep attributes in `fields`
+        return fields[key]
+    return getattr(obj, key, _UNDEFINED)
+
+
+FILTERS: Dict[str, Callable[[Any], Any]] = {
+    "aman": lambda value: Aman(_to_text(value)),
+    "atas": lambda value: _to_text(value).upper(),
+    "bawah": lambda value: _to_text(value).lower(),
+    "judul": lambda value: _to_text(value).title(),
+    "panjang": len,
+    "json": lambda value: json.dumps(value, ensure_ascii=False),
+}
+
+
+class _ExpressionCompiler:
+    """Translate a template expression into Python source
+
+    Grammar: `atau`/`dan`/`bukan`, comparisons (== != < > <= >= dalam),
+    literals, dotted lookups and `| filter` pipes.
+    """
+
+    def __init__(self, source: str, line: int, names: set):
+        self.source = source
+        self.line = line
+        self.names = names
+        self.tokens: List[Tuple[str, str]] = []
+        pos = 0
+        source = source.rstrip()
+        while pos < len(source):
+            match = _EXPR_TOKEN.match(source, pos)
+            if not match:
+                self.error(f"karakter tidak dikenal di '{source[pos:]}'")
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            pos = match.end()
+        self.pos = 0
+
+    def error(self, message: str):
+        raise CodingYokSyntaxError(f"Template: {message}", self.line)
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def accept(self, value: str) -> bool:
+        token = self.peek()
+        if token is not None and token[1] == value and token[0] in ("op", "name"):
+            self.pos += 1
+            return True
+        return False
+
+    def compile(self) -> str:
+        code = self.or_expr()
+        if self.peek() is not None:
+            self.error(f"ekspresi tidak valid: '{self.source.strip()}'")
+        return code
+
+    def or_expr(self) -> str:
+        code = self.and_expr()
+        while self.accept("atau"):
+            code = f"({code} or {self.and_expr()})"
+        return code
+
+    def and_expr(self) -> str:
+        code = self.not_expr()
+        while self.accept("dan"):
+            code = f"({code} and {self.not_expr()})"
+        return code
+
+    def not_expr(self) -> str:
+        if self.accept("bukan"):
+            return f"(not {self.not_expr()})"
+        return self.comparison()
+
+    def comparison(self) -> str:
+        left = self.filtered()
+        token = self.peek()
+        if token is not None and token[1] in ("==", "!=", "<", ">", "<=", ">="):
+            self.pos += 1
+            return f"({left} {token[1]} {self.filtered()})"
+        if self.accept("dalam"):
+            return f"({left} in {self.filtered()})"
+        return left
+
+    def filtered(self) -> str:
+        code = self.operand()
+        while self.accept("|"):
+            token = self.peek()
+            if token is None or token[0] != "name" or token[1] not in FILTERS:
+                self.error(f"filter tidak dikenal: '{token[1] if token else ''}'")
+            self.pos += 1
+            code = f"_filters[{token[1]!r}]({code})"
+        return code
+
+    def operand(self) -> str:
+        token = self.peek()
+        if token is None:
+            self.error("ekspresi kosong")
+        kind, value = token
+        self.pos += 1
+        if kind == "number":
+            return value
+        if kind == "string":
+            # Re-quote the raw text; backslashes in templates are not escapes
+            return repr(value[1:-1])
+        if kind != "name" or value in _KEYWORDS:
+            self.error(f"token tidak terduga: '{value}'")
+        if value in _LITERALS:
+            return _LITERALS[value]
+        self.names.add(value)
+        code = f"v_{value}"
+        while self.accept("."):
+            token = self.peek()
+            if token is None or token[0] not in ("name", "number"):
+                self.error("nama atribut dibutuhkan setelah '.'")
+            self.pos += 1
+            code = f"_get({code}, {token[1]!r})"
+        return code
+
+
+class Template:
+    """A template compiled into a Python render function
+
+    Supports `{{ ekspresi }}` (HTML-escaped unless piped through `aman`),
+    `{% untuk x dalam daftar %}` ... `{% akhir_untuk %}`,
+    `{% jika ... %}` / `{% kalau_tidak_jika ... %}` / `{% kalau_tidak %}` ...
+    `{% akhir_jika %}` and `{# komentar #}`.
+    """
+
+    def __init__(self, source: str, name: str = "<template>", autoescape: bool = True):
+        self.name = name
+        self.autoescape = autoescape
+        self.code, self._lines = self._compile(source)
+        try:
+            code = compile(self.code, name, "exec")
+        except SyntaxError as e:
+            lineno = e.lineno or 1
+            line = self._lines[min(lineno, len(self._lines)) - 1]
+            raise CodingYokSyntaxError(f"Template: {e.msg}", line)
+        namespace: Dict[str, Any] = {
+            "_get": _get,
+            "_UNDEFINED": _UNDEFINED,
+            "_filters": FILTERS,
+        }
+        exec(code, namespace)
+        self._render = namespace["render"]
+
+    def render(self, context: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        """Render with the given context variables"""
+        if context:
+            kwargs = {**context, **kwargs}
+        return self._render(kwargs, _escape if self.autoescape else _to_text)
+
+    def _compile(self, source: str) -> Tuple[str, List[int]]:
+        """Python source of the render function, and the template line of
+        each generated line"""
+        body: List[str] = []
+        body_lines: List[int] = []
+        names: set = set()
+        stack: List[Tuple[str, int]] = []
+        depth = 1
+        line = 1
+        pending: List[str] = []
+
+        def emit(code: str) -> None:
+            body.append("    " * depth + code)
+            body_lines.append(line)
+
+        def flush() -> None:
+            text = "".join(pending)
+            if text:
+                emit(f"_append({text!r})")
+            pending.clear()
+
+        # re.split with a capturing group puts the tags at odd indices
+        for index, part in enumerate(_TAG.split(source)):
+            if index % 2 == 0 or part.startswith("{#"):
+                if index % 2 == 0:
+                    pending.append(part)
+                line += part.count("\n")
+                continue
+            tag = part[:2]
+            inner = part[2:-2].strip()
+            flush()
+            if tag == "{{":
+                expr = _ExpressionCompiler(inner, line, names).compile()
+                emit(f"_append(_out({expr}))")
+            else:
+                keyword, _, rest = inner.partition(" ")
+                rest = rest.strip()
+                if keyword == "untuk":
+                    targets, sep, iterable = rest.partition(" dalam ")
+                    target_names = [n.strip() for n in targets.split(",")]
+                    if not sep or not all(
+                        re.fullmatch(r"[A-Za-z_]\w*", n) for n in target_names
+                    ):
+                        raise CodingYokSyntaxError(
+                            "Template: format 'untuk x dalam daftar' dibutuhkan", line
+                        )
+                    iterable_code = _ExpressionCompiler(iterable, line, names).compile()
+                    emit(f"for {', '.join('v_' + n for n in target_names)} in {iterable_code}:")
+                    stack.append(("untuk", line))
+                    depth += 1
+                    emit("pass")
+                elif keyword == "jika":
+                    emit(f"if {_ExpressionCompiler(rest, line, names).compile()}:")
+                    stack.append(("jika", line))
+                    depth += 1
+                    emit("pass")
+                elif keyword in ("kalau_tidak_jika", "kalau_tidak"):
+                    if not stack or stack[-1][0] != "jika":
+                        raise CodingYokSyntaxError(
+                            f"Template: '{keyword}' tanpa 'jika'", line
+                        )
+                    depth -= 1
+                    if keyword == "kalau_tidak":
+                        emit("else:")
+                        stack[-1] = ("kalau_tidak", line)
+                    else:
+                        emit(f"elif {_ExpressionCompiler(rest, line, names).compile()}:")
+                    depth += 1
+                    emit("pass")
+                elif keyword in ("akhir_untuk", "akhir_jika"):
+                    opened = stack.pop()[0] if stack else None
+                    expected = "untuk" if keyword == "akhir_untuk" else "jika"
+                    if opened is None or opened.replace("kalau_tidak", "jika") != expected:
+                        raise CodingYokSyntaxError(
+                            f"Template: '{keyword}' tidak memiliki pasangan", line
+                        )
+                    depth -= 1
+                else:
+                    raise CodingYokSyntaxError(
+                        f"Template: tag tidak dikenal '{keyword}'", line
+                    )
+            line += part.count("\n")
+        flush()
+        if stack:
+            kind, opened_line = stack[-1]
+            raise CodingYokSyntaxError(
+                f"Template: blok '{kind}' tidak ditutup", opened_line
+            )
+
+        header = [
+            "def render(_ctx, _out):",
+            "    _parts = []",
+            "    _append = _parts.append",
+        ]
+        # Context lookups happen once per render; loop targets rebind locals
+        for name in sorted(names):
+            header.append(f"    v_{name} = _ctx.get({name!r}, _UNDEFINED)")
+        footer = ["    return ''.join(_parts)"]
+        lines = [1] * len(header) + body_lines + [line]
+        return "\n".join(header + body + footer) + "\n", lines
+
+
+class TemplateCache:
+    """Compiled templates keyed by path, recompiled when the file changes"""
+
+    def __init__(self):
+        self._templates: Dict[str, Tuple[Tuple[int, int], Template]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Template:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            raise CodingYokRuntimeError(f"Template '{path}' tidak ditemukan")
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._templates.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        with open(path, "r", encoding="utf-8") as f:
+            template = Template(f.read(), path)
+        with self._lock:
+            self._templates[path] = (stamp, template)
+        return template
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+
+template_cache = TemplateCache()
+
+
+def render_template(template_path: str, **context) -> str:
+    """Render a template file, compiling it only when it has changed"""
+    return template_cache.get(template_path).render(context)
@@ -156,6 +156,7 @@ INDONESIAN_KEYWORDS = {
     "cocokkan": TokenType.COCOKKAN,
     "kasus": TokenType.KASUS,
     "async": TokenType.ASYNC,
+    "asinkron": TokenType.ASYNC,
     "menunggu": TokenType.MENUNGGU,
     "benar": TokenType.BENAR,
     "salah": TokenType.SALAH,
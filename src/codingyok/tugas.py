@@ -0,0 +1,174 @@
+"""
+Background tasks for CodingYok (`impor tugas`)
+Thread-pool execution with futures, for overlapping file and HTTP I/O
+"""
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from .errors import CodingYokRuntimeError, CodingYokValueError
+
+
+class Tugas:
+    """Handle to a function running in the background (a future)"""
+
+    def __init__(self, future):
+        self._future = future
+
+    def hasil(self, timeout: Optional[float] = None) -> Any:
+        """Wait for the task and return its result, re-raising its error"""
+        try:
+            return self._future.result(timeout)
+        except FutureTimeoutError:
+            raise CodingYokRuntimeError(f"Tugas belum selesai dalam {timeout} detik")
+
+    def galat(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """Wait for the task and return the error it raised, or kosong"""
+        try:
+            return self._future.exception(timeout)
+        except FutureTimeoutError:
+            raise CodingYokRuntimeError(f"Tugas belum selesai dalam {timeout} detik")
+
+    def selesai(self) -> bool:
+        return self._future.done()
+
+    def batal(self) -> bool:
+        """Cancel the task if it has not started yet"""
+        return self._future.cancel()
+
+    def __repr__(self) -> str:
+        return f"<tugas {'selesai' if self._future.done() else 'berjalan'}>"
+
+
+class Pelaksana:
+    """Fixed pool of threads running CodingYok functions
+
+    With `maks_antrian`, at most that many tasks wait for a free thread;
+    `jalankan()` blocks once the queue is full, so producers cannot outrun
+    the workers. Usable in a `dengan` block, which waits for all tasks.
+    """
+
+    def __init__(
+        self,
+        interpreter,
+        maks_pekerja: Optional[int] = None,
+        maks_antrian: Optional[int] = None,
+    ):
+        if maks_pekerja is None:
+            maks_pekerja = min(32, (os.cpu_count() or 1) + 4)
+        if maks_pekerja < 1:
+            raise CodingYokValueError("maks_pekerja harus minimal 1")
+        self.interpreter = interpreter
+        self.maks_pekerja = maks_pekerja
+        self._pool = ThreadPoolExecutor(maks_pekerja, thread_name_prefix="codingyok-tugas")
+        self._slots = (
+            threading.BoundedSemaphore(maks_pekerja + maks_antrian)
+            if maks_antrian is not None
+            else None
+        )
+
+    def jalankan(self, fungsi: Any, *args, **kwargs) -> Tugas:
+        """Start fungsi(*args) on a pool thread"""
+        call = self.interpreter.call_value
+        if self._slots is None:
+            return Tugas(self._pool.submit(call, fungsi, list(args), kwargs))
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(call, fungsi, list(args), kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return Tugas(future)
+
+    def peta(self, fungsi: Any, data: Any) -> List[Any]:
+        """Apply fungsi to every item concurrently; results keep their order"""
+        return tunggu_semua([self.jalankan(fungsi, item) for item in data])
+
+    def tutup(self, tunggu: bool = True) -> None:
+        """Stop accepting tasks; optionally wait for running ones"""
+        self._pool.shutdown(wait=tunggu)
+
+    def __enter__(self) -> "Pelaksana":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.tutup()
+
+    def __repr__(self) -> str:
+        return f"<pelaksana {self.maks_pekerja} pekerja>"
+
+
+def _futures(daftar_tugas: Any) -> List[Any]:
+    futures = []
+    for tugas in daftar_tugas:
+        if not isinstance(tugas, Tugas):
+            raise CodingYokValueError("tunggu_semua() membutuhkan daftar tugas")
+        futures.append(tugas._future)
+    return futures
+
+
+def tunggu_semua(daftar_tugas: Any, timeout: Optional[float] = None) -> List[Any]:
+    """Wait for every task; returns their results in order
+
+    The first failing task (in list order) re-raises its error once all
+    tasks have finished.
+    """
+    futures = _futures(daftar_tugas)
+    _done, pending = wait(futures, timeout)
+    if pending:
+        raise CodingYokRuntimeError(
+            f"{len(pending)} tugas belum selesai dalam {timeout} detik"
+        )
+    return [future.result() for future in futures]
+
+
+def tunggu_pertama(daftar_tugas: Any, timeout: Optional[float] = None) -> Tugas:
+    """Wait until any task finishes and return it"""
+    tasks = list(daftar_tugas)
+    futures = _futures(tasks)
+    done, _pending = wait(futures, timeout, return_when=FIRST_COMPLETED)
+    if not done:
+        raise CodingYokRuntimeError(f"Tidak ada tugas selesai dalam {timeout} detik")
+    for tugas in tasks:
+        if tugas._future in done:
+            return tugas
+
+
+def get_tugas_functions(interpreter) -> Dict[str, Any]:
+    """Namespace of the `tugas` module for one interpreter"""
+    default: List[Pelaksana] = []
+    lock = threading.Lock()
+
+    def default_executor() -> Pelaksana:
+        if not default:
+            with lock:
+                if not default:
+                    default.append(Pelaksana(interpreter))
+        return default[0]
+
+    def jalankan_latar(fungsi: Any, *args, **kwargs) -> Tugas:
+        """Run fungsi(*args) on the shared background pool"""
+        return default_executor().jalankan(fungsi, *args, **kwargs)
+
+    def peta_latar(fungsi: Any, data: Any) -> List[Any]:
+        """Apply fungsi to every item on the shared pool, keeping order"""
+        return default_executor().peta(fungsi, data)
+
+    def buat_pelaksana(
+        maks_pekerja: Optional[int] = None, maks_antrian: Optional[int] = None
+    ) -> Pelaksana:
+        """Create a separate thread pool, optionally with a bounded queue"""
+        return Pelaksana(interpreter, maks_pekerja, maks_antrian)
+
+    return {
+        "jalankan_latar": jalankan_latar,
+        "peta_latar": peta_latar,
+        "tunggu_semua": tunggu_semua,
+        "tunggu_pertama": tunggu_pertama,
+        "buat_pelaksana": buat_pelaksana,
+        "buat_kunci": threading.Lock,
+    }
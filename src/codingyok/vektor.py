@@ -0,0 +1,268 @@
+"""
+Numeric vector type for CodingYok
+Compact array-backed storage with vectorized arithmetic
+"""
+
+import array
+import math
+import operator
+from itertools import repeat
+from typing import Any, Callable, Dict
+from .errors import CodingYokTypeError, CodingYokValueError, CodingYokZeroDivisionError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+NUMPY_TERSEDIA = np is not None
+
+
+def _number(value: Any) -> float:
+    """Element value for a vector, as float"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    raise CodingYokTypeError("Elemen vektor harus berupa angka")
+
+
+class Vektor:
+    """Fixed-size numeric vector backed by array.array (or NumPy when installed)
+
+    Slicing returns a view that shares storage with the original vector,
+    so writes through a slice are visible in the parent.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Any = None):
+        if data is None:
+            data = ()
+        if isinstance(data, Vektor):
+            data = data._data.tolist()
+        if np is not None:
+            try:
+                self._data = np.array(data, dtype=np.float64).ravel()
+            except (TypeError, ValueError):
+                raise CodingYokTypeError("vektor() membutuhkan data angka")
+        else:
+            try:
+                self._data = array.array("d", data)
+            except TypeError:
+                raise CodingYokTypeError("vektor() membutuhkan data angka")
+
+    @classmethod
+    def _wrap(cls, data: Any) -> "Vektor":
+        """Wrap existing storage (array, memoryview or ndarray) without copying"""
+        obj = cls.__new__(cls)
+        obj._data = data
+        return obj
+
+    # Sequence protocol
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            if np is not None:
+                return Vektor._wrap(self._data[index])
+            return Vektor._wrap(memoryview(self._data)[index])
+        try:
+            return float(self._data[index])
+        except IndexError:
+            raise IndexError("indeks vektor di luar jangkauan")
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            target = self[index]
+            if isinstance(value, (int, float)):
+                value = repeat(float(value), len(target))
+            try:
+                values = [_number(v) for v in value]
+            except TypeError:
+                raise CodingYokTypeError("Nilai slice vektor harus berupa angka")
+            if len(values) != len(target):
+                raise CodingYokValueError(
+                    "Panjang nilai tidak sama dengan panjang slice vektor"
+                )
+            for i, v in enumerate(values):
+                target._data[i] = v
+        else:
+            self._data[index] = _number(value)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self._data
+
+    # Element-wise arithmetic
+    def _elementwise(self, other: Any, op: Callable, reflected: bool = False) -> "Vektor":
+        if isinstance(other, Vektor):
+            if len(other) != len(self):
+                raise CodingYokValueError(
+                    f"Panjang vektor tidak sama: {len(self)} dan {len(other)}"
+                )
+            right = other._data
+            if np is None:
+                right = iter(right)
+        elif isinstance(other, (int, float)) and not isinstance(other, bool):
+            right = other if np is not None else repeat(other)
+        else:
+            return NotImplemented
+
+        left = self._data
+        if reflected:
+            left, right = right, left
+
+        if np is not None:
+            return Vektor._wrap(op(left, right))
+        return Vektor._wrap(array.array("d", map(op, left, right)))
+
+    def _check_divisor(self, divisor: Any) -> None:
+        if isinstance(divisor, Vektor):
+            if 0.0 in divisor._data:
+                raise CodingYokZeroDivisionError()
+        elif divisor == 0:
+            raise CodingYokZeroDivisionError()
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    def __radd__(self, other):
+        return self._elementwise(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._elementwise(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._elementwise(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._elementwise(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        self._check_divisor(other)
+        return self._elementwise(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        self._check_divisor(self)
+        return self._elementwise(other, operator.truediv, reflected=True)
+
+    def __floordiv__(self, other):
+        self._check_divisor(other)
+        return self._elementwise(other, operator.floordiv)
+
+    def __rfloordiv__(self, other):
+        self._check_divisor(self)
+        return self._elementwise(other, operator.floordiv, reflected=True)
+
+    def __mod__(self, other):
+        self._check_divisor(other)
+        return self._elementwise(other, operator.mod)
+
+    def __rmod__(self, other):
+        self._check_divisor(self)
+        return self._elementwise(other, operator.mod, reflected=True)
+
+    def __pow__(self, other):
+        return self._elementwise(other, operator.pow)
+
+    def __rpow__(self, other):
+        return self._elementwise(other, operator.pow, reflected=True)
+
+    def __neg__(self):
+        if np is not None:
+            return Vektor._wrap(-self._data)
+        return Vektor._wrap(array.array("d", map(operator.neg, self._data)))
+
+    # Whole-vector comparison (like daftar), so `jika v == w` stays a boolean
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Vektor) or len(other) != len(self):
+            return False
+        return all(map(operator.eq, self._data, other._data))
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+    # Aggregations
+    def jumlah(self) -> float:
+        """Sum of all elements"""
+        if np is not None:
+            return float(self._data.sum())
+        return math.fsum(self._data)
+
+    def minimum(self) -> float:
+        """Smallest element"""
+        if not len(self):
+            raise CodingYokValueError("Tidak dapat mencari nilai minimum")
+        if np is not None:
+            return float(self._data.min())
+        return min(self._data)
+
+    def maksimum(self) -> float:
+        """Largest element"""
+        if not len(self):
+            raise CodingYokValueError("Tidak dapat mencari nilai maksimum")
+        if np is not None:
+            return float(self._data.max())
+        return max(self._data)
+
+    def rata_rata(self) -> float:
+        """Arithmetic mean"""
+        if not len(self):
+            raise CodingYokValueError("Tidak dapat menghitung rata-rata vektor kosong")
+        return self.jumlah() / len(self)
+
+    def titik(self, other: "Vektor") -> float:
+        """Dot product with another vector"""
+        if not isinstance(other, Vektor) or len(other) != len(self):
+            raise CodingYokValueError("titik() membutuhkan vektor dengan panjang sama")
+        if np is not None:
+            return float(self._data.dot(other._data))
+        return math.fsum(map(operator.mul, self._data, other._data))
+
+    def salin(self) -> "Vektor":
+        """Return an independent copy (slices are views)"""
+        if np is not None:
+            return Vektor._wrap(self._data.copy())
+        return Vektor._wrap(array.array("d", self._data.tolist()))
+
+    def daftar(self) -> list:
+        """Convert to a plain list"""
+        return [float(x) for x in self._data]
+
+    def __repr__(self) -> str:
+        items = ", ".join(repr(float(x)) for x in self._data)
+        return f"vektor([{items}])"
+
+    __str__ = __repr__
+
+
+def vektor(data: Any = None) -> Vektor:
+    """Create numeric vector from an iterable of numbers"""
+    if isinstance(data, (str, dict)):
+        raise CodingYokTypeError("vektor() membutuhkan data angka")
+    if data is not None and not isinstance(data, (list, tuple, Vektor, range)):
+        data = list(data)
+    return Vektor(data)
+
+
+def vektor_nol(n: int) -> Vektor:
+    """Create vector of n zeros"""
+    if np is not None:
+        return Vektor._wrap(np.zeros(n, dtype=np.float64))
+    return Vektor._wrap(array.array("d", bytes(8 * n)))
+
+
+def get_vektor_functions() -> Dict[str, Any]:
+    """Get all vector-related functions"""
+    return {
+        "vektor": vektor,
+        "vektor_nol": vektor_nol,
+    }
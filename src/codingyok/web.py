@@ -3,52 +3,1005 @@ Simple web framework foundation for CodingYok
 Provides basic HTTP server and routing capabilities
 """
 
+import contextlib
+import functools
 import json
+import mimetypes
+import os
+import queue
+import re
+import signal
+import stat
+import sys
+import threading
+import time
 import urllib.parse
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from email.utils import formatdate, parsedate_to_datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, Iterable, List, Callable, Any, Optional, Tuple
+from .asinkron import CodingYokCoroutine
 from .errors import CodingYokRuntimeError
+from .httpclient import (
+    buat_sesi_http,
+    default_session,
+    http_get_banyak,
+    http_get_stream,
+    unduh_file,
+)
+from .template import render_template
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    """HTTPServer that hands accepted connections to a fixed pool of threads
+
+    Connections wait in a bounded queue; when it is full new clients get an
+    immediate 503 instead of piling up behind slow handlers.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        workers: int = 8,
+        queue_size: int = 128,
+    ):
+        super().__init__(server_address, handler_class)
+        self.worker_count = workers
+        self._requests: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._workers: List[threading.Thread] = []
+        self._stopping = threading.Event()
+
+    def serve_forever(self, poll_interval: float = 0.5):
+        """Start worker threads, then accept connections
+
+        Threads are started here rather than in __init__ so that a server
+        created before os.fork() gets its own workers in each child.
+        """
+        for i in range(self.worker_count - len(self._workers)):
+            worker = threading.Thread(
+                target=self._process_queue, name=f"codingyok-web-{i}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        super().serve_forever(poll_interval)
+
+    def process_request(self, request, client_address):
+        """Queue the connection for a worker thread"""
+        try:
+            self._requests.put_nowait((request, client_address))
+        except queue.Full:
+            try:
+                request.sendall(
+                    b"HTTP/1.1 503 Service Unavailable\r\n"
+                    b"Content-Length: 0\r\nConnection: close\r\n\r\n"
+                )
+            except OSError:
+                pass
+            self.shutdown_request(request)
+
+    def _process_queue(self):
+        while not self._stopping.is_set():
+            try:
+                item = self._requests.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._stopping.set()
+        # Drop connections nobody will serve, then wake idle workers; never
+        # block on the bounded queue
+        while True:
+            try:
+                item = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self.shutdown_request(item[0])
+        for _ in self._workers:
+            try:
+                self._requests.put_nowait(None)
+            except queue.Full:
+                break
+
+
+class WebResponse:
+    """HTTP response ready to be written by any server engine
+
+    `file` is an optional (path, offset, length) range that engines stream
+    straight from disk (sendfile where available) instead of `body`.
+    `stream` is an optional iterable of byte chunks of unknown total length,
+    sent chunked (HTTP/1.1) or until the connection closes (HTTP/1.0).
+    """
+
+    def __init__(
+        self,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        body: bytes = b"",
+        file: Optional[Tuple[str, int, int]] = None,
+        stream: Optional[Iterable[bytes]] = None,
+    ):
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self.body = body
+        self.file = file
+        self.stream = stream
+
+    def content_length(self) -> Optional[int]:
+        """Value for the Content-Length header, None when it must be omitted"""
+        if self.status in (204, 304) or self.stream is not None:
+            return None
+        if self.file is not None:
+            return self.file[2]
+        return len(self.body)
+
+
+class StaticFileCache:
+    """LRU of small, frequently served static files
+
+    Entries are keyed by path and validated against the file's modification
+    stamp, so edited files are re-read on the next request.
+    """
+
+    def __init__(self, max_file_size: int = 64 * 1024, max_total: int = 8 * 1024 * 1024):
+        self.max_file_size = max_file_size
+        self.max_total = max_total
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stamp: Tuple[int, int]) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != stamp:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def put(self, path: str, stamp: Tuple[int, int], content: bytes) -> None:
+        if len(content) > self.max_file_size:
+            return
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old is not None:
+                self._total -= len(old[1])
+            self._entries[path] = (stamp, content)
+            self._total += len(content)
+            while self._total > self.max_total:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._total -= len(evicted)
+
+
+def _parse_range(value: str, size: int) -> Any:
+    """Parse a single `bytes=` range
+
+    Returns (start, end) inclusive, None to ignore the header (malformed or
+    multiple ranges), or False when the range cannot be satisfied.
+    """
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            suffix = int(last)
+            if suffix == 0:
+                return False
+            start = max(size - suffix, 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start > end and first and last:
+        return None
+    if start >= size:
+        return False
+    return start, min(end, size - 1)
+
+
+def build_response(response: Any) -> WebResponse:
+    """Convert a handler return value into a WebResponse"""
+    if isinstance(response, WebResponse):
+        return response
+    if isinstance(response, dict):
+        # JSON response
+        body = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        content_type = "application/json; charset=utf-8"
+    elif isinstance(response, str):
+        # HTML/Text response
+        body = response.encode("utf-8")
+        content_type = "text/html; charset=utf-8"
+    elif isinstance(response, Iterator):
+        # Generator handlers stream their chunks as they are produced
+        return stream_response(response)
+    else:
+        # Default string conversion
+        body = str(response).encode("utf-8")
+        content_type = "text/plain; charset=utf-8"
+    return WebResponse(200, {"Content-Type": content_type}, body)
+
+
+def _encode_chunks(chunks: Iterable) -> Iterable[bytes]:
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        elif not isinstance(chunk, (bytes, bytearray)):
+            chunk = str(chunk).encode("utf-8")
+        if chunk:
+            yield chunk
+
+
+def stream_response(
+    chunks: Iterable, content_type: str = "text/html; charset=utf-8", status: int = 200
+) -> WebResponse:
+    """Create a streamed response from an iterable of text or byte chunks"""
+    return WebResponse(
+        status, {"Content-Type": content_type}, stream=_encode_chunks(chunks)
+    )
+
+
+# zlib wbits for each supported Content-Encoding
+_ENCODINGS = {"gzip": 31, "deflate": 15}
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+_ENCODED_ETAG = re.compile(r'-(?:gzip|deflate)"$')
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick gzip or deflate from an Accept-Encoding header, honouring q-values"""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in _ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def _compress_stream(chunks: Iterable[bytes], compressor: Any) -> Iterable[bytes]:
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def compress_response(
+    response: WebResponse,
+    accept_encoding: Optional[str],
+    min_size: int = 1024,
+    level: int = 6,
+) -> WebResponse:
+    """Compress a response body (or stream) when the client accepts it
+
+    Bodies smaller than `min_size`, partial and empty responses, file
+    ranges sent with sendfile and already-encoded bodies are left alone.
+    """
+    if (
+        response.file is not None
+        or response.status in (204, 206, 304)
+        or _header(response.headers, "Content-Encoding") is not None
+    ):
+        return response
+    content_type = _header(response.headers, "Content-Type", "")
+    if not content_type.startswith(_COMPRESSIBLE_TYPES):
+        return response
+    if response.stream is None and len(response.body) < min_size:
+        return response
+
+    response.headers["Vary"] = "Accept-Encoding"
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return response
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _ENCODINGS[encoding])
+    if response.stream is None:
+        response.body = compressor.compress(response.body) + compressor.flush()
+    else:
+        response.stream = _compress_stream(response.stream, compressor)
+    response.headers["Content-Encoding"] = encoding
+    etag = response.headers.get("ETag")
+    if etag:
+        # Each representation needs its own validator
+        response.headers["ETag"] = f'{etag[:-1]}-{encoding}"'
+    return response
+
+
+def error_response(status_code: int, message: str) -> WebResponse:
+    """Build an HTML error page"""
+    error_html = f"""
+                <!DOCTYPE html>
+                <html>
+                <head>
+                    <title>Error {status_code}</title>
+                    <meta charset="utf-8">
+                </head>
+                <body>
+                    <h1>Error {status_code}</h1>
+                    <p>{message}</p>
+                    <hr>
+                    <p><em>CodingYok Web Server</em></p>
+                </body>
+                </html>
+                """
+    return WebResponse(
+        status_code,
+        {"Content-Type": "text/html; charset=utf-8"},
+        error_html.encode("utf-8"),
+    )
+
+
+_NO_MATCH = object()
+_INT_SEGMENT = re.compile(r"-?[0-9]+")
+
+
+def _convert_int(segment: str) -> Any:
+    return int(segment) if _INT_SEGMENT.fullmatch(segment) else _NO_MATCH
+
+
+def _convert_float(segment: str) -> Any:
+    try:
+        return float(segment)
+    except ValueError:
+        return _NO_MATCH
+
+
+_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": lambda segment: segment,
+    "int": _convert_int,
+    "float": _convert_float,
+}
+
+
+class _RouteNode:
+    """One path segment in the route trie"""
+
+    __slots__ = ("static", "params", "rest", "handlers", "mount", "pattern")
+
+    def __init__(self):
+        self.static: Dict[str, "_RouteNode"] = {}
+        self.params: List[Tuple[str, Callable[[str], Any], "_RouteNode"]] = []
+        self.rest: Optional[Tuple[str, "_RouteNode"]] = None
+        self.handlers: Dict[str, Callable] = {}
+        self.mount: Optional[str] = None
+        self.pattern = ""
+
+
+class RouteMatch:
+    """Result of looking up a path in a RouteTable"""
+
+    def __init__(
+        self,
+        handlers: Optional[Dict[str, Callable]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        directory: Optional[str] = None,
+        rest: str = "",
+        route: str = "",
+    ):
+        self.handlers = handlers or {}
+        self.params = params or {}
+        self.directory = directory
+        self.rest = rest
+        self.route = route
+
+
+class RouteTable:
+    """Routes compiled into a segment trie
+
+    Patterns may contain `{name}`, `{name:int}`, `{name:float}` and a final
+    `{name:path}` that captures the rest of the URL. Lookup walks one trie
+    level per path segment, so its cost depends on the URL's depth and not on
+    how many routes are registered. Static segments win over parameters.
+    """
+
+    def __init__(self):
+        self.root = _RouteNode()
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        return [segment for segment in path.split("/") if segment]
+
+    def add(self, pattern: str, method: str, handler: Callable) -> None:
+        """Register handler for pattern and HTTP method"""
+        node = self.root
+        segments = self._split(pattern)
+        for i, segment in enumerate(segments):
+            if segment.startswith("{") and segment.endswith("}"):
+                name, _, kind = segment[1:-1].partition(":")
+                kind = kind or "str"
+                if kind == "path":
+                    if i != len(segments) - 1:
+                        raise CodingYokRuntimeError(
+                            f"Parameter path '{name}' harus di akhir pola '{pattern}'"
+                        )
+                    if node.rest is None:
+                        node.rest = (name, _RouteNode())
+                    node = node.rest[1]
+                    continue
+                if kind not in _CONVERTERS:
+                    raise CodingYokRuntimeError(
+                        f"Tipe parameter '{kind}' tidak dikenal di pola '{pattern}'"
+                    )
+                for param_name, converter, child in node.params:
+                    if param_name == name and converter is _CONVERTERS[kind]:
+                        node = child
+                        break
+                else:
+                    child = _RouteNode()
+                    node.params.append((name, _CONVERTERS[kind], child))
+                    # Typed parameters are tried before catch-all strings
+                    node.params.sort(key=lambda item: item[1] is _CONVERTERS["str"])
+                    node = child
+            elif "{" in segment or "}" in segment:
+                raise CodingYokRuntimeError(
+                    f"Segmen '{segment}' harus berupa teks atau satu parameter utuh"
+                )
+            else:
+                node = node.static.setdefault(segment, _RouteNode())
+        node.handlers[method.upper()] = handler
+        node.pattern = pattern
+
+    def mount(self, prefix: str, directory: str) -> None:
+        """Serve files below directory for every URL starting with prefix"""
+        node = self.root
+        for segment in self._split(prefix):
+            node = node.static.setdefault(segment, _RouteNode())
+        node.mount = directory
+        if not node.handlers:
+            node.pattern = prefix
+
+    def match(self, path: str) -> Optional[RouteMatch]:
+        """Find handlers (and parameters) or a static mount for path"""
+        segments = self._split(path)
+        found = self._match(self.root, segments, 0, {})
+        if found is not None:
+            return found
+
+        # Fall back to the longest mounted prefix
+        node = self.root
+        mounted = None
+        for i, segment in enumerate(segments):
+            if node.mount is not None:
+                mounted = (node, i)
+            node = node.static.get(segment)
+            if node is None:
+                break
+        else:
+            if node.mount is not None:
+                mounted = (node, len(segments))
+        if mounted is None:
+            return None
+        node, used = mounted
+        return RouteMatch(
+            directory=node.mount, rest="/".join(segments[used:]), route=node.pattern
+        )
+
+    def _match(
+        self, node: _RouteNode, segments: List[str], i: int, params: Dict[str, Any]
+    ) -> Optional[RouteMatch]:
+        if i == len(segments):
+            if node.handlers:
+                return RouteMatch(node.handlers, params, route=node.pattern)
+            return None
+
+        segment = segments[i]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._match(child, segments, i + 1, params)
+            if found is not None:
+                return found
+
+        for name, converter, child in node.params:
+            value = converter(segment)
+            if value is _NO_MATCH:
+                continue
+            found = self._match(child, segments, i + 1, {**params, name: value})
+            if found is not None:
+                return found
+
+        if node.rest is not None:
+            name, child = node.rest
+            if child.handlers:
+                return RouteMatch(
+                    child.handlers,
+                    {**params, name: "/".join(segments[i:])},
+                    route=child.pattern,
+                )
+        return None
 
 
 class CodingYokWebServer:
     """Simple web server for CodingYok applications"""
 
-    def __init__(self, host: str = "localhost", port: int = 8000):
+    ENGINES = ("http", "asyncio")
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8000,
+        workers: int = 0,
+        queue_size: int = 128,
+        engine: str = "http",
+        processes: int = 0,
+        compression: bool = True,
+    ):
+        if engine not in self.ENGINES:
+            raise CodingYokRuntimeError(
+                f"Mesin server '{engine}' tidak dikenal, pilih salah satu: "
+                f"{', '.join(self.ENGINES)}"
+            )
         self.host = host
         self.port = port
+        self.workers = workers
+        self.queue_size = queue_size
+        self.engine = engine
+        self.processes = processes
+        self.compression = compression
+        self.compress_min_size = 1024
         self.routes: Dict[str, Dict[str, Callable]] = {}
         self.static_files: Dict[str, str] = {}
+        self.static_dirs: Dict[str, str] = {}
+        self.static_cache = StaticFileCache()
+        self.metrics = None
+        self._route_table: Optional[RouteTable] = None
+        self._before_hooks: List[Callable] = []
+        self._after_hooks: List[Callable] = []
+        # Set by buat_server_web so handlers and hooks written in CodingYok
+        # (functions, bound methods, lambdas) go through the interpreter
+        self.interpreter = None
+
+    def _call(self, func: Callable, *args: Any) -> Any:
+        """Call a handler or hook with the given arguments"""
+        interpreter = self.interpreter or getattr(func, "interpreter", None)
+        if interpreter is None:
+            return func(*args)
+        return interpreter.call_value(func, list(args))
 
     def route(self, path: str, method: str = "GET"):
-        """Decorator to register route handlers"""
+        """Decorator to register route handlers
+
+        Paths may contain parameters such as `/produk/{id:int}`; their values
+        are passed to the handler in request["params"].
+        """
 
         def decorator(handler_func):
             if path not in self.routes:
                 self.routes[path] = {}
             self.routes[path][method.upper()] = handler_func
+            self._route_table = None
             return handler_func
 
         return decorator
 
+    def before_request(self, hook: Callable):
+        """Register a hook called with the request before routing
+
+        Returning anything other than kosong skips the remaining hooks and
+        the handler, and that value becomes the response.
+        """
+        self._before_hooks.append(hook)
+        return hook
+
+    def after_request(self, hook: Callable):
+        """Register a hook called with (request, response) after the handler
+
+        Hooks run in reverse registration order; a returned value replaces
+        the response.
+        """
+        self._after_hooks.append(hook)
+        return hook
+
+    def use(self, middleware: Any):
+        """Add a middleware object with before_request/after_request methods"""
+        if hasattr(middleware, "before_request"):
+            self.before_request(middleware.before_request)
+        if hasattr(middleware, "after_request"):
+            self.after_request(middleware.after_request)
+        return middleware
+
+    def enable_metrics(self, path: str = "/_metrik"):
+        """Record per-route request counts and latency, served at path"""
+        from .web_metrics import MetricsMiddleware
+
+        if self.metrics is None:
+            self.metrics = MetricsMiddleware()
+            # First registered: its timer wraps every other hook
+            self._before_hooks.insert(0, self.metrics.before_request)
+            self._after_hooks.insert(0, self.metrics.after_request)
+        self.route(path)(self.metrics.endpoint)
+        return self.metrics
+
     def static(self, url_path: str, file_path: str):
         """Register static file"""
         self.static_files[url_path] = file_path
 
+    def static_dir(self, url_prefix: str, directory: str):
+        """Serve every file below directory under url_prefix"""
+        self.static_dirs[url_prefix] = directory
+        self._route_table = None
+
+    def compile_routes(self) -> RouteTable:
+        """Build the route trie; done once before serving and after changes"""
+        table = RouteTable()
+        for path, handlers in self.routes.items():
+            for method, handler in handlers.items():
+                table.add(path, method, handler)
+        for prefix, directory in self.static_dirs.items():
+            table.mount(prefix, directory)
+        self._route_table = table
+        return table
+
+    def create_server(self):
+        """Create the underlying server without starting it
+
+        Every engine exposes serve_forever(), shutdown(), server_close() and
+        server_address like socketserver servers do.
+        """
+        self.compile_routes()
+        if self.engine == "asyncio":
+            from .web_async import AsyncioWebServer
+
+            return AsyncioWebServer(self, (self.host, self.port), self.workers)
+
+        handler_class = self._create_handler_class()
+        if self.workers and self.workers > 0:
+            return ThreadPoolHTTPServer(
+                (self.host, self.port), handler_class, self.workers, self.queue_size
+            )
+        return HTTPServer((self.host, self.port), handler_class)
+
     def run(self):
         """Start the web server"""
-        handler_class = self._create_handler_class()
-        server = HTTPServer((self.host, self.port), handler_class)
-        print(f"Server CodingYok berjalan di http://{self.host}:{self.port}")
+        server = self.create_server()
+        mode = f" ({self.workers} pekerja)" if self.workers else ""
+        if self.processes and self.processes > 1:
+            mode += f" ({self.processes} proses)"
+        if self.engine != "http":
+            mode += f" [{self.engine}]"
+        # Handler output must reach a piped stdout while we serve, not sit in
+        # the interpreter's buffer until the program ends
+        streaming = (
+            self.interpreter.output.line_flushed()
+            if self.interpreter is not None
+            else contextlib.nullcontext()
+        )
+        with streaming:
+            print(
+                f"Server CodingYok berjalan di http://{self.host}:{self.port}{mode}",
+                flush=True,
+            )
+            if self.processes and self.processes > 1:
+                self._run_prefork(server)
+                return
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                print("\nServer dihentikan")
+            finally:
+                server.server_close()
+
+    def _run_prefork(self, server) -> None:
+        """Fork worker processes that share the listening socket, and keep
+        that many alive until interrupted
+
+        Each child inherits a copy of the interpreter as it is when run() is
+        called, so top-level definitions are already executed in every worker
+        and CodingYok handlers run in parallel on separate cores.
+        """
+        if not hasattr(os, "fork"):
+            server.server_close()
+            raise CodingYokRuntimeError(
+                "Mode multi-proses membutuhkan os.fork (Linux/macOS)"
+            )
+
+        children: Dict[int, float] = {}
+        stopping = False
+        stop_signals = {signal.SIGTERM, signal.SIGINT}
+
+        def spawn() -> None:
+            # Flush buffered output so children don't repeat it
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # Hold SIGTERM/SIGINT until the child has dropped the master's
+            # handlers and the parent has recorded its pid, so stop() always
+            # sees every child and never runs inside one
+            mask = signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+            try:
+                pid = os.fork()
+                if pid == 0:
+                    code = 0
+                    try:
+                        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                        signal.signal(signal.SIGINT, signal.SIG_DFL)
+                        signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+                        server.serve_forever()
+                    except BaseException:
+                        code = 1
+                    finally:
+                        try:
+                            if self.interpreter is not None:
+                                self.interpreter.output.flush()
+                        finally:
+                            os._exit(code)
+                children[pid] = time.monotonic()
+            finally:
+                signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+
+        def stop(signum=None, frame=None) -> None:
+            nonlocal stopping
+            stopping = True
+            for pid in list(children):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+        def reap(timeout: float) -> Optional[int]:
+            """Pid of an exited child, or None if none exits within timeout"""
+            deadline = time.monotonic() + timeout
+            while True:
+                pid, _status = os.waitpid(-1, os.WNOHANG)
+                if pid:
+                    return pid
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.05)
+
+        previous_handler = signal.signal(signal.SIGTERM, stop)
+        try:
+            for _ in range(self.processes):
+                spawn()
+            while children:
+                try:
+                    pid = reap(1.0)
+                except KeyboardInterrupt:
+                    print("\nServer dihentikan")
+                    stop()
+                    continue
+                except ChildProcessError:
+                    break
+                if pid is None:
+                    continue
+                started = children.pop(pid, None)
+                if started is None or stopping:
+                    continue
+                print(f"Proses pekerja {pid} berhenti, memulai ulang", flush=True)
+                # Avoid a tight crash loop when workers die on startup
+                if time.monotonic() - started < 1.0:
+                    time.sleep(1.0)
+                spawn()
+        finally:
+            stop()
+            # Give workers a moment to finish, then make sure none outlive us
+            while children:
+                try:
+                    pid = reap(5.0)
+                except ChildProcessError:
+                    break
+                if pid is None:
+                    for pid in list(children):
+                        try:
+                            os.kill(pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass
+                    continue
+                children.pop(pid, None)
+            signal.signal(signal.SIGTERM, previous_handler)
+            server.server_close()
+
+    def dispatch(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes = b""
+    ) -> WebResponse:
+        """Route one parsed request through the hooks and its handler"""
+        parsed_url = urllib.parse.urlparse(target)
+        request_data: Dict[str, Any] = {
+            "method": method,
+            "path": parsed_url.path,
+            "query": urllib.parse.parse_qs(parsed_url.query),
+            "headers": headers,
+            "params": {},
+            "route": "",
+        }
+
+        response = None
         try:
-            server.serve_forever()
-        except KeyboardInterrupt:
-            print("\nServer dihentikan")
-            server.shutdown()
+            if body:
+                text = body.decode("utf-8")
+                request_data["body"] = text
+
+                # Try to parse JSON
+                content_type = _header(headers, "Content-Type")
+                if content_type == "application/json":
+                    try:
+                        request_data["json"] = json.loads(text)
+                    except json.JSONDecodeError:
+                        pass
+
+            for hook in self._before_hooks:
+                result = self._call(hook, request_data)
+                if result is not None:
+                    response = build_response(result)
+                    break
+            if response is None:
+                response = self._route_request(request_data)
+        except Exception as e:
+            response = error_response(500, str(e))
+
+        for hook in reversed(self._after_hooks):
+            try:
+                result = self._call(hook, request_data, response)
+            except Exception as e:
+                result = error_response(500, str(e))
+            if result is not None:
+                response = build_response(result)
+
+        if self.compression:
+            response = compress_response(
+                response, _header(headers, "Accept-Encoding"), self.compress_min_size
+            )
+        return response
+
+    def _route_request(self, request_data: Dict[str, Any]) -> WebResponse:
+        path = request_data["path"]
+        method = request_data["method"]
+        headers = request_data["headers"]
+
+        # Check static files first
+        if path in self.static_files:
+            request_data["route"] = path
+            return self._serve_static_file(self.static_files[path], headers)
+
+        # Check routes
+        table = self._route_table or self.compile_routes()
+        match = table.match(path)
+        if match is None:
+            return error_response(404, "Halaman tidak ditemukan")
+        request_data["route"] = match.route
+        if match.directory is not None:
+            return self._serve_from_directory(match.directory, match.rest, headers)
+        if method not in match.handlers:
+            response = error_response(405, "Metode tidak diizinkan")
+            response.headers["Allow"] = ", ".join(sorted(match.handlers))
+            return response
+
+        request_data["params"] = match.params
+        try:
+            handler = match.handlers[method]
+            result = self._call(handler, request_data)
+            if isinstance(result, CodingYokCoroutine):
+                # `async fungsi` handler; the worker thread runs it to completion
+                result = result.jalankan()
+            return build_response(result)
+        except Exception as e:
+            return error_response(500, str(e))
+
+    def _serve_from_directory(
+        self, directory: str, relative: str, headers: Dict[str, str]
+    ) -> WebResponse:
+        """Serve a file from a mounted directory, refusing paths that escape it"""
+        root = os.path.realpath(directory)
+        file_path = os.path.realpath(
+            os.path.join(root, urllib.parse.unquote(relative))
+        )
+        if file_path != root and not file_path.startswith(root + os.sep):
+            return error_response(404, "File tidak ditemukan")
+        if os.path.isdir(file_path):
+            file_path = os.path.join(file_path, "index.html")
+        return self._serve_static_file(file_path, headers)
+
+    def _serve_static_file(
+        self, file_path: str, headers: Optional[Dict[str, str]] = None
+    ) -> WebResponse:
+        """Serve static file with validators, ranges and a small-file cache"""
+        headers = headers or {}
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return error_response(404, "File tidak ditemukan")
+        except OSError as e:
+            return error_response(500, str(e))
+        if not stat.S_ISREG(st.st_mode):
+            return error_response(404, "File tidak ditemukan")
+
+        size = st.st_size
+        etag = f'"{st.st_mtime_ns:x}-{size:x}"'
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        response_headers = {
+            "Content-Type": content_type,
+            "ETag": etag,
+            "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+            "Accept-Ranges": "bytes",
+        }
+
+        # Conditional requests
+        if_none_match = _header(headers, "If-None-Match")
+        if if_none_match is not None:
+            # Compressed representations carry a suffixed tag of the same file
+            tags = [
+                _ENCODED_ETAG.sub('"', tag.strip()) for tag in if_none_match.split(",")
+            ]
+            if "*" in tags or etag in tags:
+                return WebResponse(304, response_headers)
+        else:
+            if_modified_since = _header(headers, "If-Modified-Since")
+            if if_modified_since:
+                try:
+                    since = parsedate_to_datetime(if_modified_since).timestamp()
+                except (TypeError, ValueError):
+                    since = None
+                if since is not None and int(st.st_mtime) <= since:
+                    return WebResponse(304, response_headers)
+
+        # Byte ranges
+        status = 200
+        start, length = 0, size
+        range_header = _header(headers, "Range")
+        if_range = _header(headers, "If-Range")
+        if range_header and size and (if_range is None or if_range == etag):
+            byte_range = _parse_range(range_header, size)
+            if byte_range is False:
+                response_headers["Content-Range"] = f"bytes */{size}"
+                return WebResponse(416, response_headers)
+            if byte_range is not None:
+                start, end = byte_range
+                length = end - start + 1
+                status = 206
+                response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+        # Small files come from memory, large ones are streamed from disk
+        if size <= self.static_cache.max_file_size:
+            stamp = (st.st_mtime_ns, size)
+            content = self.static_cache.get(file_path, stamp)
+            if content is None:
+                try:
+                    with open(file_path, "rb") as f:
+                        content = f.read()
+                except OSError as e:
+                    return error_response(500, str(e))
+                self.static_cache.put(file_path, stamp, content)
+            return WebResponse(
+                status, response_headers, content[start : start + length]
+            )
+        return WebResponse(status, response_headers, file=(file_path, start, length))
 
     def _create_handler_class(self):
         """Create HTTP request handler class"""
-        routes = self.routes
-        static_files = self.static_files
+        app = self
 
         class CodingYokRequestHandler(BaseHTTPRequestHandler):
             def do_GET(self):
@@ -64,132 +1017,36 @@ class CodingYokWebServer:
                 self._handle_request("DELETE")
 
             def _handle_request(self, method):
-                # Parse URL
-                parsed_url = urllib.parse.urlparse(self.path)
-                path = parsed_url.path
-                query_params = urllib.parse.parse_qs(parsed_url.query)
-
-                # Check static files first
-                if path in static_files:
-                    self._serve_static_file(static_files[path])
-                    return
-
-                # Check routes
-                if path in routes and method in routes[path]:
-                    try:
-                        # Prepare request data
-                        request_data = {
-                            "method": method,
-                            "path": path,
-                            "query": query_params,
-                            "headers": dict(self.headers),
-                        }
-
-                        # Get request body for POST/PUT
-                        if method in ["POST", "PUT"]:
-                            content_length = int(self.headers.get("Content-Length", 0))
-                            if content_length > 0:
-                                body = self.rfile.read(content_length).decode("utf-8")
-                                request_data["body"] = body
-
-                                # Try to parse JSON
-                                if (
-                                    self.headers.get("Content-Type")
-                                    == "application/json"
-                                ):
-                                    try:
-                                        request_data["json"] = json.loads(body)
-                                    except json.JSONDecodeError:
-                                        pass
-
-                        # Call handler
-                        handler = routes[path][method]
-                        response = handler(request_data)
-
-                        # Send response
-                        self._send_response(response)
-
-                    except Exception as e:
-                        self._send_error_response(500, str(e))
-                else:
-                    self._send_error_response(404, "Halaman tidak ditemukan")
+                body = b""
+                content_length = int(self.headers.get("Content-Length", 0))
+                if content_length > 0:
+                    body = self.rfile.read(content_length)
 
-            def _serve_static_file(self, file_path):
-                """Serve static file"""
-                try:
-                    with open(file_path, "rb") as f:
-                        content = f.read()
+                response = app.dispatch(method, self.path, dict(self.headers), body)
+                self._send_response(response)
 
-                    # Determine content type
-                    content_type = "text/plain"
-                    if file_path.endswith(".html"):
-                        content_type = "text/html"
-                    elif file_path.endswith(".css"):
-                        content_type = "text/css"
-                    elif file_path.endswith(".js"):
-                        content_type = "application/javascript"
-                    elif file_path.endswith(".json"):
-                        content_type = "application/json"
-
-                    self.send_response(200)
-                    self.send_header("Content-Type", content_type)
-                    self.send_header("Content-Length", len(content))
-                    self.end_headers()
-                    self.wfile.write(content)
-
-                except FileNotFoundError:
-                    self._send_error_response(404, "File tidak ditemukan")
-                except Exception as e:
-                    self._send_error_response(500, str(e))
-
-            def _send_response(self, response):
+            def _send_response(self, response: WebResponse):
                 """Send HTTP response"""
-                if isinstance(response, dict):
-                    # JSON response
-                    json_data = json.dumps(response, ensure_ascii=False)
-                    self.send_response(200)
-                    self.send_header("Content-Type", "application/json; charset=utf-8")
-                    self.send_header("Content-Length", len(json_data.encode("utf-8")))
-                    self.end_headers()
-                    self.wfile.write(json_data.encode("utf-8"))
-                elif isinstance(response, str):
-                    # HTML/Text response
-                    self.send_response(200)
-                    self.send_header("Content-Type", "text/html; charset=utf-8")
-                    self.send_header("Content-Length", len(response.encode("utf-8")))
-                    self.end_headers()
-                    self.wfile.write(response.encode("utf-8"))
-                else:
-                    # Default string conversion
-                    content = str(response)
-                    self.send_response(200)
-                    self.send_header("Content-Type", "text/plain; charset=utf-8")
-                    self.send_header("Content-Length", len(content.encode("utf-8")))
-                    self.end_headers()
-                    self.wfile.write(content.encode("utf-8"))
-
-            def _send_error_response(self, status_code, message):
-                """Send error response"""
-                self.send_response(status_code)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                length = response.content_length()
+                if length is not None:
+                    self.send_header("Content-Length", str(length))
                 self.end_headers()
-
-                error_html = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <title>Error {status_code}</title>
-                    <meta charset="utf-8">
-                </head>
-                <body>
-                    <h1>Error {status_code}</h1>
-                    <p>{message}</p>
-                    <hr>
-                    <p><em>CodingYok Web Server</em></p>
-                </body>
-                </html>
-                """
-                self.wfile.write(error_html.encode("utf-8"))
+                if response.file is not None:
+                    file_path, offset, count = response.file
+                    if count:
+                        with open(file_path, "rb") as f:
+                            # Zero-copy os.sendfile when the platform allows
+                            self.connection.sendfile(f, offset, count)
+                elif response.stream is not None:
+                    # HTTP/1.0: the body ends when the connection closes
+                    self.close_connection = True
+                    for chunk in response.stream:
+                        self.wfile.write(chunk)
+                else:
+                    self.wfile.write(response.body)
 
             def log_message(self, format, *args):
                 """Override to customize logging"""
@@ -198,25 +1055,35 @@ class CodingYokWebServer:
         return CodingYokRequestHandler
 
 
-def buat_server_web(host: str = "localhost", port: int = 8000) -> CodingYokWebServer:
-    """Create a new web server instance"""
-    return CodingYokWebServer(host, port)
+def _header(headers: Dict[str, str], name: str, default: Any = None) -> Any:
+    """Case-insensitive header lookup"""
+    if name in headers:
+        return headers[name]
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return default
 
 
-def render_template(template_path: str, **context) -> str:
-    """Simple template rendering"""
-    try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
-
-        # Simple variable substitution
-        for key, value in context.items():
-            placeholder = f"{{{{{key}}}}}"
-            template = template.replace(placeholder, str(value))
+def buat_server_web(
+    host: str = "localhost",
+    port: int = 8000,
+    pekerja: int = 0,
+    antrian: int = 128,
+    mesin: str = "http",
+    proses: int = 0,
+    kompresi: bool = True,
+) -> CodingYokWebServer:
+    """Create a new web server instance
 
-        return template
-    except FileNotFoundError:
-        raise CodingYokRuntimeError(f"Template '{template_path}' tidak ditemukan")
+    pekerja > 0 serves requests on a pool of that many threads, with at most
+    `antrian` connections waiting for a free worker. mesin="asyncio" selects
+    the keep-alive asyncio engine instead of http.server. proses > 1 forks
+    that many worker processes sharing one listening socket. kompresi
+    gzip/deflate-encodes text and JSON responses for clients that accept it.
+    """
+    return CodingYokWebServer(host, port, pekerja, antrian, mesin, proses, kompresi)
 
 
 def json_response(data: Any, status: int = 200) -> Dict[str, Any]:
@@ -241,66 +1108,63 @@ def redirect_response(url: str) -> str:
 
 
 # HTTP client functions
-def http_get(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-    """Make HTTP GET request"""
+def http_get(
+    url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Make HTTP GET request over the shared keep-alive session"""
     try:
-        import urllib.request
-
-        req = urllib.request.Request(url)
-        if headers:
-            for key, value in headers.items():
-                req.add_header(key, value)
-
-        with urllib.request.urlopen(req) as response:
-            content = response.read().decode("utf-8")
-            return {
-                "status": response.getcode(),
-                "headers": dict(response.headers),
-                "content": content,
-            }
-    except Exception as e:
-        raise CodingYokRuntimeError(f"HTTP GET error: {str(e)}")
+        response = default_session().get(url, headers, timeout)
+    except CodingYokRuntimeError as e:
+        raise CodingYokRuntimeError(f"HTTP GET error: {e.message}")
+    if response["status"] >= 400:
+        raise CodingYokRuntimeError(f"HTTP GET error: HTTP Error {response['status']}")
+    return response
 
 
 def http_post(
-    url: str, data: Any = None, headers: Optional[Dict[str, str]] = None
+    url: str,
+    data: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
 ) -> Dict[str, Any]:
-    """Make HTTP POST request"""
+    """Make HTTP POST request over the shared keep-alive session"""
     try:
-        import urllib.request
-
-        # Prepare data
-        if isinstance(data, dict):
-            data = json.dumps(data).encode("utf-8")
-            if not headers:
-                headers = {}
-            headers["Content-Type"] = "application/json"
-        elif isinstance(data, str):
-            data = data.encode("utf-8")
-
-        req = urllib.request.Request(url, data=data, method="POST")
-        if headers:
-            for key, value in headers.items():
-                req.add_header(key, value)
-
-        with urllib.request.urlopen(req) as response:
-            content = response.read().decode("utf-8")
-            return {
-                "status": response.getcode(),
-                "headers": dict(response.headers),
-                "content": content,
-            }
-    except Exception as e:
-        raise CodingYokRuntimeError(f"HTTP POST error: {str(e)}")
-
-
-def get_web_functions() -> Dict[str, Callable]:
-    """Get all web-related functions"""
+        response = default_session().post(url, data, headers, timeout)
+    except CodingYokRuntimeError as e:
+        raise CodingYokRuntimeError(f"HTTP POST error: {e.message}")
+    if response["status"] >= 400:
+        raise CodingYokRuntimeError(f"HTTP POST error: HTTP Error {response['status']}")
+    return response
+
+
+def get_web_functions(interpreter=None) -> Dict[str, Callable]:
+    """Get all web-related functions
+
+    With an interpreter, servers created by buat_server_web call their
+    handlers and hooks through it.
+    """
+    if interpreter is None:
+        create_server = buat_server_web
+    else:
+
+        @functools.wraps(buat_server_web)
+        def buat_server_web_interpreter(*args, **kwargs) -> CodingYokWebServer:
+            server = buat_server_web(*args, **kwargs)
+            server.interpreter = interpreter
+            return server
+
+        create_server = buat_server_web_interpreter
+
     return {
-        "buat_server_web": buat_server_web,
+        "buat_server_web": create_server,
         "render_template": render_template,
         "json_response": json_response,
         "redirect_response": redirect_response,
+        "stream_response": stream_response,
         "http_get": http_get,
         "http_post": http_post,
+        "buat_sesi_http": buat_sesi_http,
+        "http_get_banyak": http_get_banyak,
+        "http_get_stream": http_get_stream,
+        "unduh_file": unduh_file,
     }
@@ -0,0 +1,301 @@
+"""
+Asyncio server engine for CodingYok web applications
+HTTP/1.1 keep-alive and pipelining on asyncio streams
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .web import WebResponse, error_response
+
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BODY_SIZE = 10 * 1024 * 1024
+KEEPALIVE_TIMEOUT = 15.0
+
+_REASONS = {status.value: status.phrase for status in HTTPStatus}
+
+
+class _DateCache:
+    """HTTP Date header, formatted at most once per second"""
+
+    def __init__(self):
+        self._second = 0
+        self._value = ""
+
+    def get(self) -> str:
+        now = int(time.time())
+        if now != self._second:
+            self._second = now
+            self._value = formatdate(now, usegmt=True)
+        return self._value
+
+
+def parse_request_head(
+    head: bytes,
+) -> Optional[Tuple[str, str, str, Dict[str, str], Dict[str, str]]]:
+    """Parse request line and headers; returns None for malformed input
+
+    Returns (method, target, version, headers, lowercase_headers).
+    """
+    lines = head.decode("latin-1").split("\r\n")
+    request_line = lines[0].split(" ")
+    if len(request_line) != 3 or not request_line[2].startswith("HTTP/"):
+        return None
+    method, target, version = request_line
+
+    headers: Dict[str, str] = {}
+    lowered: Dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            return None
+        name = name.strip()
+        value = value.strip()
+        headers[name] = value
+        lowered[name.lower()] = value
+    return method, target, version, headers, lowered
+
+
+class _RequestError(Exception):
+    """A request that is answered with an error status and then closed"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class AsyncioWebServer:
+    """CodingYokWebServer engine built on asyncio streams
+
+    Connections are kept alive between requests (HTTP/1.1 semantics) and
+    pipelined requests are answered in order. Handlers run on the event loop,
+    or on a thread pool when `workers` > 0 so slow handlers do not stall
+    other connections. Bodies larger than `max_body_size` are refused with
+    413 before they are read.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        server_address: Tuple[str, int],
+        workers: int = 0,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+        max_body_size: int = MAX_BODY_SIZE,
+    ):
+        self.app = app
+        self.keepalive_timeout = keepalive_timeout
+        self.max_body_size = max_body_size
+        self.socket = socket.create_server(server_address)
+        self.socket.setblocking(False)
+        self.server_address = self.socket.getsockname()[:2]
+        self._executor = ThreadPoolExecutor(workers) if workers > 0 else None
+        self._date = _DateCache()
+        self._connections: set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._stopped = threading.Event()
+
+    def serve_forever(self) -> None:
+        """Run the event loop until shutdown() is called"""
+        self._stopped.clear()
+        try:
+            asyncio.run(self._serve())
+        finally:
+            self._stopped.set()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() from another thread and wait for it to exit"""
+        loop = self._loop
+        if loop is None or self._stop is None:
+            return
+        loop.call_soon_threadsafe(self._stop.set)
+        self._stopped.wait()
+
+    def server_close(self) -> None:
+        """Release the listening socket and worker threads"""
+        self.socket.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        server = await asyncio.start_server(
+            self._handle_connection, sock=self.socket, limit=MAX_HEADER_SIZE
+        )
+        try:
+            await self._stop.wait()
+        finally:
+            server.close()
+            for writer in list(self._connections):
+                writer.close()
+            self._loop = None
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout
+                    )
+                except asyncio.LimitOverrunError:
+                    self._write(writer, error_response(431, "Header terlalu besar"), False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+
+                request = parse_request_head(head)
+                if request is None:
+                    self._write(writer, error_response(400, "Permintaan tidak valid"), False)
+                    break
+                method, target, version, headers, lowered = request
+
+                connection = lowered.get("connection", "").lower()
+                chunked = version == "HTTP/1.1"
+                if chunked:
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+
+                try:
+                    body = await self._read_body(reader, lowered)
+                except _RequestError as e:
+                    self._write(writer, error_response(e.status, e.message), False)
+                    await writer.drain()
+                    break
+
+                response = await self._dispatch(method, target, headers, body)
+                if response.stream is not None and not chunked:
+                    # HTTP/1.0 clients read a stream until the connection closes
+                    keep_alive = False
+                self._write(writer, response, keep_alive, chunked)
+                await writer.drain()
+                if response.file is not None:
+                    await self._send_file(writer, response.file)
+                elif response.stream is not None:
+                    await self._send_stream(writer, response.stream, chunked)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except Exception:
+            # A failing stream after the headers went out: drop the connection
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _read_body(
+        self, reader: asyncio.StreamReader, lowered: Dict[str, str]
+    ) -> bytes:
+        if lowered.get("transfer-encoding", "").lower() == "chunked":
+            return await self._read_chunked(reader)
+        try:
+            length = int(lowered.get("content-length", 0) or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise _RequestError(400, "Content-Length tidak valid")
+        if length > self.max_body_size:
+            raise _RequestError(413, "Isi permintaan terlalu besar")
+        return await reader.readexactly(length) if length > 0 else b""
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        total = 0
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            try:
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                size = -1
+            if size < 0:
+                raise _RequestError(400, "Ukuran chunk tidak valid")
+            total += size
+            if total > self.max_body_size:
+                raise _RequestError(413, "Isi permintaan terlalu besar")
+            if size == 0:
+                # Skip optional trailers up to the terminating blank line
+                while (await reader.readuntil(b"\r\n")) != b"\r\n":
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    async def _dispatch(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> WebResponse:
+        if self._executor is None:
+            return self.app.dispatch(method, target, headers, body)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self.app.dispatch, method, target, headers, body
+        )
+
+    async def _send_file(
+        self, writer: asyncio.StreamWriter, file: Tuple[str, int, int]
+    ) -> None:
+        file_path, offset, count = file
+        if not count:
+            return
+        loop = asyncio.get_running_loop()
+        with open(file_path, "rb") as f:
+            # os.sendfile on plain sockets, chunked reads otherwise
+            await loop.sendfile(writer.transport, f, offset, count)
+
+    async def _send_stream(
+        self, writer: asyncio.StreamWriter, stream: Iterable[bytes], chunked: bool
+    ) -> None:
+        iterator = iter(stream)
+        loop = asyncio.get_running_loop()
+        while True:
+            # Producing a chunk may run handler code, so keep it off the loop
+            # whenever a worker pool is configured
+            if self._executor is None:
+                chunk = next(iterator, None)
+            else:
+                chunk = await loop.run_in_executor(self._executor, next, iterator, None)
+            if chunk is None:
+                break
+            if chunked:
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            else:
+                writer.write(chunk)
+            await writer.drain()
+        if chunked:
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+
+    def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        response: WebResponse,
+        keep_alive: bool,
+        chunked: bool = False,
+    ) -> None:
+        status = response.status
+        parts = [
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n",
+            f"Server: CodingYok\r\nDate: {self._date.get()}\r\n",
+        ]
+        for name, value in response.headers.items():
+            parts.append(f"{name}: {value}\r\n")
+        length = response.content_length()
+        if length is not None:
+            parts.append(f"Content-Length: {length}\r\n")
+        elif response.stream is not None and chunked:
+            parts.append("Transfer-Encoding: chunked\r\n")
+        parts.append("Connection: keep-alive\r\n\r\n" if keep_alive else "Connection: close\r\n\r\n")
+        writer.write("".join(parts).encode("latin-1") + response.body)
@@ -0,0 +1,103 @@
+"""
+Request metrics middleware for CodingYok web applications
+Per-route counters and latency histograms in Prometheus text format
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .web import WebResponse
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_START_KEY = "_metrik_mulai"
+_UNMATCHED = "tidak_dikenal"
+
+
+def _label(value: Any) -> str:
+    return (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+class MetricsMiddleware:
+    """Counts requests and records latency per route pattern
+
+    Routes are labelled by their pattern (`/produk/{id:int}`), not the raw
+    path, so the number of series stays bounded. Latency covers middleware,
+    routing and the handler call; for streamed responses it ends when the
+    stream is created. Each pre-fork worker process keeps its own counters.
+    """
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None):
+        self.buckets = tuple(sorted(buckets or DEFAULT_BUCKETS))
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, int], int] = {}
+        # (route, method) -> [per-bucket counts..., +Inf count], sum
+        self._latency: Dict[Tuple[str, str], Tuple[List[int], List[float]]] = {}
+
+    def before_request(self, request: Dict[str, Any]) -> None:
+        request[_START_KEY] = time.perf_counter()
+
+    def after_request(self, request: Dict[str, Any], response: WebResponse) -> None:
+        started = request.get(_START_KEY)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        route = request.get("route") or _UNMATCHED
+        method = request["method"]
+        slot = bisect_left(self.buckets, elapsed)
+        with self._lock:
+            key = (route, method, response.status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            series = self._latency.get((route, method))
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._latency[(route, method)] = series
+            series[0][slot] += 1
+            series[1][0] += elapsed
+
+    def render(self) -> str:
+        """Current metrics in Prometheus text exposition format"""
+        with self._lock:
+            requests = sorted(self._requests.items())
+            latency = sorted(
+                (key, (list(counts), total[0]))
+                for key, (counts, total) in self._latency.items()
+            )
+
+        lines = [
+            "# HELP codingyok_http_requests_total Jumlah permintaan HTTP",
+            "# TYPE codingyok_http_requests_total counter",
+        ]
+        for (route, method, status), count in requests:
+            lines.append(
+                f'codingyok_http_requests_total{{route="{_label(route)}",'
+                f'method="{method}",status="{status}"}} {count}'
+            )
+
+        name = "codingyok_http_request_duration_seconds"
+        lines.append(f"# HELP {name} Latensi permintaan HTTP dalam detik")
+        lines.append(f"# TYPE {name} histogram")
+        for (route, method), (counts, total) in latency:
+            labels = f'route="{_label(route)}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def endpoint(self, request: Dict[str, Any]) -> WebResponse:
+        """Route handler serving render()"""
+        return WebResponse(
+            200,
+            {"Content-Type": PROMETHEUS_CONTENT_TYPE},
+            self.render().encode("utf-8"),
+        )
@@ -260,6 +260,41 @@ class TestAdvancedFeatures:
         assert "10" in lines[2]  # Minimum
         assert "50" in lines[3]  # Maximum
 
+    def test_statistics_streaming_and_percentiles(self):
+        """Test statistics over a lazy iterator with percentiles"""
+        code = """
+        angka = peta(lambda x: x, rentang(1, 102))
+        stats = hitung_statistik(angka, persentil=[25, 90])
+        tulis(stats["median"])
+        tulis(stats["persentil"][25])
+        tulis(stats["persentil"][90])
+        tulis(stats["jumlah"])
+        """
+
+        output = self.capture_output(code)
+        lines = output.split("\n")
+        assert lines == ["51.0", "26.0", "91.0", "5151"]
+
+    def test_statistics_approximate_mode(self):
+        """Test bounded-memory approximate statistics"""
+        code = """
+        stats = hitung_statistik(rentang(10000), perkiraan=benar, ukuran_sampel=100)
+        tulis(stats["rata_rata"])
+        tulis(stats["maksimum"])
+        tulis(stats["perkiraan"])
+        """
+
+        output = self.capture_output(code)
+        lines = output.split("\n")
+        assert lines == ["4999.5", "9999", "benar"]
+
+        from codingyok.errors import CodingYokValueError
+        from codingyok.stdlib import hitung_statistik
+
+        for ukuran in (0, -5):
+            with pytest.raises(CodingYokValueError):
+                hitung_statistik(range(10), perkiraan=True, ukuran_sampel=ukuran)
+
     def test_table_printing(self):
         """Test table printing function"""
         code = """
@@ -329,3 +364,125 @@ class TestAdvancedFeatures:
 
         output = self.capture_output(code)
         assert "Rp 1.300.000" in output  # 1,000,000 + 500,000 - 200,000
+
+    def test_peta_paralel(self):
+        """Test process-parallel map with ordered results and errors"""
+        code = """
+        BOBOT = 3
+        kelas Titik:
+            fungsi __init__(diri, x):
+                diri.x = x
+
+        fungsi skor(x):
+            kembalikan Titik(x).x * BOBOT
+
+        tulis(peta_paralel(skor, rentang(10), pekerja=2, ukuran_batch=3))
+        tulis(peta_paralel(lambda x: x + BOBOT, [1, 2], pekerja=2))
+        coba:
+            peta_paralel(lambda x: 10 / x, [1, 0, 2], pekerja=2, ukuran_batch=1)
+        kecuali:
+            tulis("gagal")
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == [
+            "[0, 3, 6, 9, 12, 15, 18, 21, 24, 27]",
+            "[4, 5]",
+            "gagal",
+        ]
+
+    def test_peta_paralel_module_function_and_derived_names(self):
+        """Test module functions and assignments from values workers lack"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "modul_bantu.cy"), "w") as f:
+                f.write("faktor = 3\n\nfungsi kali(x):\n    kembalikan x * faktor\n")
+            self.interpreter = CodingYokInterpreter(script_dir=tmpdir)
+            code = """
+        dari modul_bantu impor kali
+        data = daftar(rentang(6))
+        pertama = data
+
+        fungsi tambah(x):
+            kembalikan x + 1
+
+        tulis(peta_paralel(kali, data, pekerja=2))
+        tulis(peta_paralel(tambah, pertama, pekerja=2))
+        """
+            output = self.capture_output(code)
+        assert output.split("\n") == [
+            "[0, 3, 6, 9, 12, 15]",
+            "[1, 2, 3, 4, 5, 6]",
+        ]
+
+    def test_async_functions_and_menunggu(self):
+        """Test async functions, concurrent kumpulkan and async builtins"""
+        code = """
+        async fungsi ambil(n):
+            menunggu tidur_asinkron(0.2)
+            kembalikan n * 2
+
+        asinkron fungsi utama():
+            kembalikan menunggu kumpulkan([ambil(i) untuk i dalam rentang(5)])
+
+        kelas Klien:
+            async fungsi sapa(diri, nama):
+                kembalikan "halo " + nama
+
+        tulis(menunggu utama())
+        tulis(menunggu Klien().sapa("budi"), menunggu ambil(5))
+        coba:
+            menunggu batas_waktu(tidur_asinkron(1), 0.05)
+        kecuali:
+            tulis("habis waktu")
+        """
+        import time
+
+        started = time.perf_counter()
+        output = self.capture_output(code)
+        assert output.split("\n") == ["[0, 2, 4, 6, 8]", "halo budi 10", "habis waktu"]
+        # The five 0.2s sleeps overlap
+        assert time.perf_counter() - started < 0.8
+
+    def test_awaited_coroutines_share_bounded_pool(self):
+        """Test that loop-awaited coroutines run on a bounded thread pool"""
+        import asyncio
+        import threading
+        import time
+        from codingyok.asinkron import MAX_COROUTINE_THREADS, CodingYokCoroutine
+
+        def body():
+            time.sleep(0.01)
+            return threading.current_thread().name
+
+        async def main():
+            count = MAX_COROUTINE_THREADS * 2
+            return await asyncio.gather(
+                *(CodingYokCoroutine(body, "badan") for _ in range(count))
+            )
+
+        names = asyncio.run(main())
+        assert all(name.startswith("codingyok-async") for name in names)
+        assert len(set(names)) <= MAX_COROUTINE_THREADS
+
+    def test_nested_awaits_fan_out_past_pool_limit(self):
+        """Test that coroutines awaiting children cannot exhaust the pool"""
+        import threading
+        from codingyok.asinkron import MAX_COROUTINE_THREADS
+
+        count = MAX_COROUTINE_THREADS + 6
+        code = f"""
+        async fungsi anak(n):
+            kembalikan n
+
+        async fungsi cabang(n):
+            kembalikan menunggu kumpulkan([anak(n)])
+
+        async fungsi utama():
+            kembalikan menunggu kumpulkan([cabang(i) untuk i dalam rentang({count})])
+
+        hasil = menunggu utama()
+        """
+        runner = threading.Thread(target=self.run_code, args=(code,), daemon=True)
+        runner.start()
+        runner.join(10)
+        assert not runner.is_alive(), "nested awaits deadlocked"
+        assert self.interpreter.globals.get("hasil") == [[i] for i in range(count)]
@@ -0,0 +1,315 @@
+"""
+Unit tests for CodingYok streaming file I/O
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+import tempfile
+from io import StringIO
+from codingyok.lexer import CodingYokLexer
+from codingyok.parser import CodingYokParser
+from codingyok.interpreter import CodingYokInterpreter
+
+
+class TestStreamingFileIO:
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.interpreter = CodingYokInterpreter()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def teardown_method(self):
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name).replace("\\", "/")
+
+    def capture_output(self, source_code):
+        """Helper to run CodingYok code and capture print output"""
+        old_stdout = sys.stdout
+        sys.stdout = captured_output = StringIO()
+        try:
+            tokens = CodingYokLexer(source_code).tokenize()
+            self.interpreter.interpret(CodingYokParser(tokens).parse())
+            return captured_output.getvalue().strip()
+        finally:
+            sys.stdout = old_stdout
+
+    def test_iter_baris_lazy_and_closed_on_break(self):
+        """Test iter_baris streams lines and the loop closes the file"""
+        log = self.path("app.log")
+        with open(log, "w") as f:
+            for i in range(10000):
+                f.write(f"baris {i}\r\n")
+
+        code = f"""
+        jumlah = 0
+        untuk baris dalam iter_baris(r"{log}"):
+            jumlah += 1
+        tulis(jumlah)
+        untuk baris dalam iter_baris(r"{log}"):
+            jika baris == "baris 3":
+                tulis(baris)
+                berhenti
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == ["10000", "baris 3"]
+
+        lines = iter(self.interpreter.globals.get("iter_baris")(log))
+        assert next(lines) == "baris 0"
+        lines.close()
+        assert lines.gi_frame is None  # generator finished, file closed
+
+    def test_iter_blok_text_and_binary(self):
+        """Test chunked reading in text and binary mode"""
+        data_file = self.path("data.bin")
+        with open(data_file, "wb") as f:
+            f.write(b"abcdefghij")
+
+        code = f"""
+        tulis(daftar(iter_blok(r"{data_file}", 4)))
+        tulis(panjang(daftar(iter_blok(r"{data_file}", 3, biner=benar))))
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == ["['abcd', 'efgh', 'ij']", "4"]
+
+    def test_streaming_csv_typed_columns_and_writer(self):
+        """Test header-aware CSV iteration with typed columns and the writer"""
+        csv_file = self.path("penjualan.csv")
+
+        code = f"""
+        dengan buka_csv(r"{csv_file}", ["produk", "jumlah", "harga", "lunas"]) sebagai penulis:
+            penulis.tulis_baris(["Teh", "3", "4500.5", "ya"])
+            penulis.tulis_baris({{"produk": "Kopi", "jumlah": 2, "harga": 12000, "lunas": "tidak"}})
+            penulis.tulis_banyak([["Gula", "", "15000", "benar"]])
+
+        total = 0
+        tipe_kolom = {{"jumlah": "int", "harga": "float", "lunas": "bool"}}
+        untuk baris dalam iter_csv(r"{csv_file}", header=benar, tipe=tipe_kolom, ukuran_batch=2):
+            tulis(baris["produk"], baris["jumlah"], baris["lunas"])
+            total += baris["harga"]
+        tulis(total)
+        tulis(daftar(iter_csv(r"{csv_file}"))[0])
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == [
+            "Teh 3 benar",
+            "Kopi 2 salah",
+            "Gula kosong benar",
+            "31500.5",
+            "['produk', 'jumlah', 'harga', 'lunas']",
+        ]
+
+    def test_peta_memori_fixed_width_and_regex(self):
+        """Test memory-mapped slicing, find, records, lines and cari_pola"""
+        data_file = self.path("tetap.txt")
+        with open(data_file, "w") as f:
+            f.write("0001Budi      Jakarta \n")
+            f.write("0002Siti      Bandung \n")
+            f.write("0003Andi      Surabaya\n")
+
+        code = f"""
+        dengan peta_memori(r"{data_file}") sebagai peta:
+            tulis(panjang(peta))
+            tulis(peta[4:8])
+            tulis(peta.rekaman(1, 23)[4:14].strip())
+            tulis(peta.cari("Andi"))
+            tulis(cari_pola(r"00\\d\\d(\\w+)", peta, semua=benar))
+            tulis(cari_pola(r"Band\\w+", peta))
+            untuk baris dalam peta.iter_baris():
+                tulis(baris[-8:].strip())
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == [
+            "69",
+            "Budi",
+            "Siti",
+            "50",
+            "['Budi', 'Siti', 'Andi']",
+            "Bandung",
+            "Jakarta",
+            "Bandung",
+            "Surabaya",
+        ]
+
+    def test_jsonl_streaming_and_incremental_array(self):
+        """Test JSON Lines read/write and element-wise JSON array parsing"""
+        import json
+
+        events = self.path("events.jsonl")
+        array_file = self.path("besar.json")
+        data = [{"id": i, "nilai": i * 1.5e3, "tag": ["a", "b]"]} for i in range(500)]
+        with open(array_file, "w") as f:
+            json.dump(data, f, indent=1)
+
+        code = f"""
+        tulis(tulis_jsonl(r"{events}", peta(lambda i: {{"id": i, "nama": "acara"}}, rentang(3))))
+        dengan buka_jsonl(r"{events}", "a") sebagai penulis:
+            penulis.tulis_baris({{"id": 3, "nama": "terakhir"}})
+        untuk acara dalam baca_jsonl(r"{events}"):
+            tulis(acara["id"], acara["nama"])
+
+        total = 0
+        untuk elemen dalam iter_json(r"{array_file}", 7):
+            total += elemen["id"]
+        tulis(total)
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == [
+            "3",
+            "0 acara",
+            "1 acara",
+            "2 acara",
+            "3 terakhir",
+            str(sum(range(500))),
+        ]
+        reader = self.interpreter.globals.get("iter_json")(array_file, 5)
+        assert list(reader) == data
+
+    def test_iter_json_stops_at_malformed_element(self, monkeypatch):
+        """Test that a broken element fails without reading the rest of the file"""
+        import builtins
+        from codingyok import fileio
+        from codingyok.errors import CodingYokRuntimeError
+
+        array_file = self.path("rusak.json")
+        with open(array_file, "w") as f:
+            f.write('[{"id": 0}, {"id": 1,}, "teks\n", ' + "[1, 2], " * 100000 + "3]")
+
+        read = []
+
+        class CountingFile:
+            def __init__(self, file):
+                self.file = file
+
+            def read(self, size):
+                block = self.file.read(size)
+                read.append(len(block))
+                return block
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self.file.close()
+
+        monkeypatch.setattr(
+            fileio, "open", lambda *a, **kw: CountingFile(builtins.open(*a, **kw)), raising=False
+        )
+        reader = fileio.iter_json(array_file, 16)
+        elements = iter(reader)
+        assert next(elements) == {"id": 0}
+        with pytest.raises(CodingYokRuntimeError):
+            next(elements)
+        assert sum(read) < 1024
+
+        with open(array_file, "w") as f:
+            f.write('["teks\n", ' + "[1, 2], " * 100000 + "3]")
+        read.clear()
+        with pytest.raises(CodingYokRuntimeError):
+            list(fileio.iter_json(array_file, 16))
+        assert sum(read) < 1024
+
+    def test_kompilasi_pola_and_pattern_cache(self):
+        """Test compiled pattern objects and the cached string patterns"""
+        from codingyok.fileio import _compile
+
+        code = """
+        angka = kompilasi_pola(r"\\d+")
+        kata = kompilasi_pola(r"halo", abaikan_kapital=benar)
+        tulis(angka.cari_semua("a1 b22 c333"))
+        tulis(angka.ganti("#", "a1 b22", semua=salah))
+        tulis(kata.cari("HALO dunia"))
+        tulis(kata.cocok("Halo"), angka.cocok("12a"))
+        tulis(cari_pola(angka, "umur 25 tahun"))
+        tulis(pisah_pola(angka, "a1b2c"))
+        untuk i dalam rentang(3):
+            teks = ganti_pola(r"\\s+", " ", "a   b    c")
+        tulis(teks)
+        """
+        _compile.cache_clear()
+        output = self.capture_output(code)
+        assert output.split("\n") == [
+            "['1', '22', '333']",
+            "a# b22",
+            "HALO",
+            "benar salah",
+            "25",
+            "['a', 'b', 'c']",
+            "a b c",
+        ]
+        assert _compile.cache_info().hits >= 2
+
+    def test_invalid_regex_replacement(self):
+        """Test that a bad replacement template raises a CodingYok error"""
+        from codingyok.errors import CodingYokValueError
+        from codingyok.fileio import ganti_pola, kompilasi_pola
+
+        with pytest.raises(CodingYokValueError):
+            ganti_pola("a", r"\1", "abc")
+        with pytest.raises(CodingYokValueError):
+            kompilasi_pola("a").ganti(r"\1", "abc")
+
+    def test_jelajahi_and_bulk_operations(self):
+        """Test recursive walking and thread-pooled copy/delete"""
+        for name in ("a.csv", "b.txt", "sub/c.csv", "sub/dalam/d.csv"):
+            os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+            with open(self.path(name), "w") as f:
+                f.write("x,y\n")
+        root = self.path("")
+        salinan = self.path("salinan")
+        code = f"""
+        semua = daftar(jelajahi("{root}", "*.csv"))
+        tulis(panjang(semua), panjang(daftar(jelajahi("{root}", "*.csv", rekursif=salah))))
+        tulis(panjang(daftar(jelajahi("{root}", tipe="direktori"))))
+        info = daftar(jelajahi("{root}", "b.txt", info=benar))
+        tulis(info[0]["nama"], info[0]["ukuran"])
+        tulis(salin_banyak(semua, "{salinan}"))
+        tulis(panjang(daftar_file("{salinan}")))
+        tulis(hapus_banyak(jelajahi("{salinan}")))
+        coba:
+            hapus_banyak(["{salinan}/a.csv", "{salinan}/c.csv"])
+        kecuali:
+            tulis("gagal")
+        tulis(hapus_banyak(["{salinan}/a.csv"], abaikan_hilang=benar))
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == ["3 1", "2", "b.txt 4", "3", "3", "3", "gagal", "1"]
+
+    def test_buka_penulis_buffered_and_atomic(self):
+        """Test the persistent writer and atomic replace-on-close"""
+        log = self.path("log.txt")
+        target = self.path("data.json")
+        code = f"""
+        dengan buka_penulis(r"{log}", mode="a") sebagai log:
+            untuk i dalam rentang(3):
+                log.tulis_baris("baris " + str(i))
+        tulis(baca_baris(r"{log}"))
+        tulis_json(r"{target}", {{"versi": 1}}, atomik=benar)
+        coba:
+            dengan buka_penulis(r"{target}", atomik=benar) sebagai penulis:
+                penulis.tulis_teks("rusak")
+                lempar ValueError("gagal")
+        kecuali:
+            tulis("dibatalkan")
+        tulis(baca_json(r"{target}"))
+        penulis = buka_penulis(r"{target}", atomik=benar, fsync="selalu")
+        penulis.tulis_banyak(["a", "b"])
+        tulis(baca_json(r"{target}"))
+        penulis.tutup()
+        tulis(baca_baris(r"{target}"))
+        """
+        output = self.capture_output(code)
+        assert output.split("\n") == [
+            "['baris 0', 'baris 1', 'baris 2']",
+            "dibatalkan",
+            "{'versi': 1}",
+            "{'versi': 1}",
+            "['a', 'b']",
+        ]
+        # No temporary files are left behind
+        assert sorted(os.listdir(self.temp_dir.name)) == ["data.json", "log.txt"]
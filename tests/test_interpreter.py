@@ -310,3 +310,98 @@ class TestCodingYokInterpreter:
         """
         output = self.capture_output(code)
         assert output == "0\n1\n3"
+
+    def test_output_sink_is_buffered(self):
+        """Test redirected, block-buffered output and explicit bilas()"""
+
+        class Sink:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, text):
+                self.writes.append(text)
+
+        sink = Sink()
+        self.interpreter = CodingYokInterpreter(output=sink)
+        code = """
+        untuk i dalam rentang(3):
+            tulis("baris", i)
+        bilas()
+        cetak_tabel([[1, 2]])
+        tulis("akhir")
+        """
+        self.run_code(code)
+        assert sink.writes[0] == "baris 0\nbaris 1\nbaris 2\n"
+        assert len(sink.writes) == 2
+        assert sink.writes[1].startswith("| 1")
+        assert sink.writes[1].endswith("akhir\n")
+
+    def test_output_leaves_sys_stdout_alone(self):
+        """Test that interpreters on several threads never swap sys.stdout"""
+        import threading
+
+        sinks = [StringIO() for _ in range(4)]
+        interpreters = [CodingYokInterpreter(output=sink) for sink in sinks]
+        program = CodingYokParser(
+            CodingYokLexer(
+                'untuk i dalam rentang(20):\n    tulis("x")\n    tidur(0.005)\n'
+                "cetak_tabel([[1]])\n"
+            ).tokenize()
+        ).parse()
+        stdout = sys.stdout
+        threads = [
+            threading.Thread(target=interpreter.interpret, args=(program,))
+            for interpreter in interpreters
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sys.stdout is stdout
+        for sink in sinks:
+            assert sink.getvalue() == "x\n" * 20 + "| 1 |\n"
+
+    def test_output_flushed_before_runtime_error(self):
+        """Test buffered output reaches the sink before the error report"""
+        sink = StringIO()
+        self.interpreter = CodingYokInterpreter(output=sink)
+        old_stderr = sys.stderr
+        sys.stderr = StringIO()
+        try:
+            self.run_code('tulis("sebelum")\ntulis(tidak_ada)')
+        finally:
+            sys.stderr = old_stderr
+        assert sink.getvalue() == "sebelum\n"
+
+    def test_concurrent_calls_use_separate_frames(self):
+        """Test one interpreter serving calls from many threads at once"""
+        import threading
+
+        self.run_code(
+            """
+fungsi jumlah(n):
+    jika n == 0:
+        kembalikan 0
+    kembalikan n + jumlah(n - 1)
+
+fungsi kuadrat_semua(n):
+    kembalikan [x * x untuk x dalam rentang(n)]
+"""
+        )
+        jumlah = self.interpreter.globals.get("jumlah")
+        kuadrat_semua = self.interpreter.globals.get("kuadrat_semua")
+        results = {}
+
+        def worker(n):
+            for _ in range(20):
+                results[n] = (jumlah(n), kuadrat_semua(n))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(10, 40)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for n in range(10, 40):
+            assert results[n] == (n * (n + 1) // 2, [x * x for x in range(n)])
+        assert self.interpreter.frame.stack() == ["<modul>"]
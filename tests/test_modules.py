@@ -203,5 +203,33 @@ d = bagi(10, 5)
     assert interpreter.environment.get("d") == 2
 
 
+def test_tugas_builtin_module():
+    """Test the thread-pool task module and concurrent interpreter calls"""
+    code = """
+impor tugas
+dari tugas impor jalankan_latar, tunggu_semua
+
+fungsi faktorial(n):
+    jika n <= 1:
+        kembalikan 1
+    tidur(0.001)
+    kembalikan n * faktorial(n - 1)
+
+daftar_tugas = [jalankan_latar(faktorial, n) untuk n dalam rentang(1, 13)]
+hasil = tunggu_semua(daftar_tugas)
+dengan tugas.buat_pelaksana(2, maks_antrian=1) sebagai pelaksana:
+    hasil_peta = pelaksana.peta(lambda x: x + 1, rentang(5))
+gagal = jalankan_latar(lambda: 1 / 0)
+"""
+    interpreter = run_code(code)
+    expected = [1]
+    for n in range(2, 13):
+        expected.append(expected[-1] * n)
+    assert interpreter.environment.get("hasil") == expected
+    assert interpreter.environment.get("hasil_peta") == [1, 2, 3, 4, 5]
+    with pytest.raises(CodingYokRuntimeError):
+        interpreter.environment.get("gagal").hasil()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""
+Tests for the CodingYok vektor type
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+from codingyok.lexer import CodingYokLexer
+from codingyok.parser import CodingYokParser
+from codingyok.interpreter import CodingYokInterpreter
+from codingyok.errors import CodingYokTypeError, CodingYokValueError
+from codingyok.vektor import vektor, vektor_nol
+
+
+def run_code(code):
+    """Helper to run CodingYok code"""
+    lexer = CodingYokLexer(code)
+    tokens = lexer.tokenize()
+    parser = CodingYokParser(tokens)
+    ast = parser.parse()
+    interpreter = CodingYokInterpreter()
+    interpreter.interpret(ast)
+    return interpreter
+
+
+def test_vectorized_arithmetic():
+    """Test element-wise operators through the interpreter"""
+    code = """
+v = vektor([1, 2, 3])
+w = v * 2 + 1
+u = 10 - v
+"""
+    interpreter = run_code(code)
+    assert interpreter.environment.get("w").daftar() == [3.0, 5.0, 7.0]
+    assert interpreter.environment.get("u").daftar() == [9.0, 8.0, 7.0]
+
+
+def test_slice_is_view():
+    """Test that slicing shares storage with the parent vector"""
+    code = """
+v = vektor([1, 2, 3, 4])
+bagian = v[1:3]
+bagian[0] = 100
+"""
+    interpreter = run_code(code)
+    assert interpreter.environment.get("v").daftar() == [1.0, 100.0, 3.0, 4.0]
+
+
+def test_aggregations_specialised():
+    """Test jumlah, maksimum, minimum and hitung_statistik on vektor"""
+    code = """
+v = vektor([10, 20, 30, 40, 50])
+total = jumlah(v)
+besar = maksimum(v)
+kecil = minimum(v)
+stats = hitung_statistik(v)
+"""
+    interpreter = run_code(code)
+    env = interpreter.environment
+    assert env.get("total") == 150.0
+    assert env.get("besar") == 50.0
+    assert env.get("kecil") == 10.0
+    assert env.get("stats")["median"] == 30.0
+    assert env.get("stats")["varians"] == 200.0
+
+
+def test_length_mismatch():
+    """Test that vectors of different length cannot be combined"""
+    with pytest.raises(CodingYokValueError):
+        vektor([1, 2]) + vektor([1, 2, 3])
+
+
+def test_setitem_non_numeric():
+    """Test that storing a non-number raises a CodingYok type error"""
+    v = vektor([1, 2, 3])
+    with pytest.raises(CodingYokTypeError):
+        v[0] = "a"
+    with pytest.raises(CodingYokTypeError):
+        v[0:2] = ["a", "b"]
+    with pytest.raises(CodingYokTypeError):
+        v[0:2] = None
+    assert v.daftar() == [1.0, 2.0, 3.0]
+
+
+def test_vektor_nol():
+    """Test zero-filled vector creation"""
+    assert vektor_nol(3).daftar() == [0.0, 0.0, 0.0]
+
+
+def test_reflected_operators():
+    """Test scalar-on-the-left %, // and ** operators"""
+    code = """
+v = vektor([3, 4, 5])
+sisa = 10 % v
+bagi = 10 // v
+pangkat = 2 ** v
+"""
+    interpreter = run_code(code)
+    env = interpreter.environment
+    assert env.get("sisa").daftar() == [1.0, 2.0, 0.0]
+    assert env.get("bagi").daftar() == [3.0, 2.0, 2.0]
+    assert env.get("pangkat").daftar() == [8.0, 16.0, 32.0]